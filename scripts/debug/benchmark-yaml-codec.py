@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Compares PyYAML's pure Python safe loader/dumper with the libyaml classes used by aicage._yaml_codec.
+
+Usage: python scripts/debug/benchmark-yaml-codec.py [iterations]
+"""
+
+import sys
+import timeit
+
+import yaml
+
+_PROJECT_CONFIG = {
+    "path": "/home/user/src/project",
+    "agents": {
+        agent: {
+            "base": "ubuntu",
+            "docker_args": "--net=host -e FOO=bar",
+            "extensions": ["python", "node", "java"],
+            "image_ref": f"aicage-extended:{agent}-ubuntu-python-node-java",
+            "mounts": {"gitconfig": True, "gnupg": False, "ssh": True, "docker": False},
+        }
+        for agent in ("claude", "codex", "copilot", "gemini", "goose", "qwen")
+    },
+}
+_BUILD_RECORD = {
+    "agent": "codex",
+    "base": "ubuntu",
+    "agent_version": "0.98.0",
+    "base_image": "ghcr.io/aicage/aicage-image-base:ubuntu",
+    "base_digest": "sha256:" + "0" * 64,
+    "image_ref": "aicage:codex-ubuntu",
+    "built_at": "2026-01-29T10:00:00+00:00",
+}
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    if not hasattr(yaml, "CSafeLoader"):
+        print("PyYAML was built without libyaml; aicage falls back to the pure Python classes.")
+        return
+    for label, document in (("project config", _PROJECT_CONFIG), ("build record", _BUILD_RECORD)):
+        payload = yaml.safe_dump(document, sort_keys=True)
+        for action, python_call, c_call in (
+            (
+                "load",
+                lambda payload=payload: yaml.load(payload, Loader=yaml.SafeLoader),
+                lambda payload=payload: yaml.load(payload, Loader=yaml.CSafeLoader),
+            ),
+            (
+                "dump",
+                lambda document=document: yaml.dump(document, Dumper=yaml.SafeDumper, sort_keys=True),
+                lambda document=document: yaml.dump(document, Dumper=yaml.CSafeDumper, sort_keys=True),
+            ),
+        ):
+            python_ms = timeit.timeit(python_call, number=iterations) * 1000 / iterations
+            c_ms = timeit.timeit(c_call, number=iterations) * 1000 / iterations
+            print(
+                f"{label:<15} {action}: python {python_ms:.3f} ms, libyaml {c_ms:.3f} ms, "
+                f"speedup {python_ms / c_ms:.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
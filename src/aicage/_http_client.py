@@ -0,0 +1,177 @@
+import base64
+import http.client
+import ssl
+import threading
+import urllib.parse
+import urllib.request
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+
+from aicage._tracing import HTTP_REQUEST_COUNTER, count_event
+
+_MAX_REDIRECTS: int = 5
+_REDIRECT_STATUSES: set[int] = {301, 302, 303, 307, 308}
+_MAX_IDLE_PER_HOST: int = 4
+# Errors raised when a kept-alive socket was closed by the server between requests.
+_STALE_CONNECTION_ERRORS: tuple[type[Exception], ...] = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    http.client.BadStatusLine,
+    BrokenPipeError,
+    ConnectionResetError,
+)
+
+# Scheme, host, port and the proxy URL the connection goes through ("" when direct).
+_ConnectionKey = tuple[str, str, int, str]
+
+
+@dataclass(frozen=True)
+class HttpResponse:
+    status: int
+    headers: dict[str, str]
+    body: bytes
+
+
+class _ConnectionPool:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._idle: dict[_ConnectionKey, list[http.client.HTTPConnection]] = {}
+
+    def acquire(self, key: _ConnectionKey, timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                connection = idle.pop()
+                connection.timeout = timeout
+                if connection.sock is not None:
+                    connection.sock.settimeout(timeout)
+                return connection, True
+        return _new_connection(key, timeout), False
+
+    def release(self, key: _ConnectionKey, connection: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < _MAX_IDLE_PER_HOST:
+                idle.append(connection)
+                return
+        connection.close()
+
+
+_POOL = _ConnectionPool()
+
+
+def http_request(
+    method: str,
+    url: str,
+    headers: Mapping[str, str] | None = None,
+    timeout: float = 5.0,
+) -> HttpResponse | None:
+    """
+    Sends a request over a kept-alive connection to the target host and follows redirects.
+    Returns None when the host cannot be reached; HTTP error statuses are returned as responses.
+    """
+    request_headers = dict(headers or {})
+    for _ in range(_MAX_REDIRECTS + 1):
+        response = _send(method, url, request_headers, timeout)
+        if response is None or response.status not in _REDIRECT_STATUSES:
+            return response
+        location = response.headers.get("location")
+        if not location:
+            return response
+        next_url = urllib.parse.urljoin(url, location)
+        if urllib.parse.urlsplit(next_url).netloc != urllib.parse.urlsplit(url).netloc:
+            request_headers = {k: v for k, v in request_headers.items() if k.lower() != "authorization"}
+        url = next_url
+    return None
+
+
+def _send(method: str, url: str, headers: dict[str, str], timeout: float) -> HttpResponse | None:
+    parts = urllib.parse.urlsplit(url)
+    if parts.scheme not in {"http", "https"} or not parts.hostname:
+        return None
+    default_port = 443 if parts.scheme == "https" else 80
+    proxy_url = _proxy_url(parts.scheme, parts.hostname)
+    key: _ConnectionKey = (parts.scheme, parts.hostname, parts.port or default_port, proxy_url)
+    target = urllib.parse.urlunsplit(("", "", parts.path or "/", parts.query, ""))
+    if proxy_url and parts.scheme == "http":
+        # Plain HTTP goes to the proxy itself, which needs the absolute URL and its own credentials.
+        target = urllib.parse.urlunsplit((parts.scheme, parts.netloc, parts.path or "/", parts.query, ""))
+        headers = {**headers, **_proxy_headers(proxy_url)}
+    count_event(HTTP_REQUEST_COUNTER)
+    connection, reused = _POOL.acquire(key, timeout)
+    try:
+        response = _exchange(connection, method, target, headers)
+    except _STALE_CONNECTION_ERRORS:
+        connection.close()
+        if not reused:
+            return None
+        connection = _new_connection(key, timeout)
+        try:
+            response = _exchange(connection, method, target, headers)
+        except (OSError, http.client.HTTPException):
+            connection.close()
+            return None
+    except (OSError, http.client.HTTPException):
+        connection.close()
+        return None
+    if response.headers.get("connection", "").lower() == "close":
+        connection.close()
+    else:
+        _POOL.release(key, connection)
+    return response
+
+
+def _exchange(
+    connection: http.client.HTTPConnection,
+    method: str,
+    target: str,
+    headers: dict[str, str],
+) -> HttpResponse:
+    connection.request(method, target, headers=headers)
+    response = connection.getresponse()
+    # The body must be drained before the connection can carry the next request.
+    body = response.read()
+    return HttpResponse(
+        status=response.status,
+        headers={name.lower(): value for name, value in response.getheaders()},
+        body=body,
+    )
+
+
+def _new_connection(key: _ConnectionKey, timeout: float) -> http.client.HTTPConnection:
+    scheme, host, port, proxy_url = key
+    if proxy_url:
+        proxy = urllib.parse.urlsplit(proxy_url)
+        proxy_host, proxy_port = proxy.hostname or "", proxy.port or 80
+        if scheme == "https":
+            connection = http.client.HTTPSConnection(proxy_host, proxy_port, timeout=timeout, context=_ssl_context())
+            connection.set_tunnel(host, port, headers=_proxy_headers(proxy_url))
+            return connection
+        return http.client.HTTPConnection(proxy_host, proxy_port, timeout=timeout)
+    if scheme == "https":
+        return http.client.HTTPSConnection(host, port, timeout=timeout, context=_ssl_context())
+    return http.client.HTTPConnection(host, port, timeout=timeout)
+
+
+def _proxy_url(scheme: str, host: str) -> str:
+    """
+    Returns the proxy configured for the scheme (HTTPS_PROXY, HTTP_PROXY, ...) unless NO_PROXY exempts the host.
+    """
+    proxy_url = urllib.request.getproxies().get(scheme, "")
+    if not proxy_url or urllib.request.proxy_bypass(host):
+        return ""
+    return proxy_url if "://" in proxy_url else f"http://{proxy_url}"
+
+
+def _proxy_headers(proxy_url: str) -> dict[str, str]:
+    proxy = urllib.parse.urlsplit(proxy_url)
+    if proxy.username is None:
+        return {}
+    credentials = f"{urllib.parse.unquote(proxy.username)}:{urllib.parse.unquote(proxy.password or '')}"
+    return {"Proxy-Authorization": f"Basic {base64.b64encode(credentials.encode()).decode('ascii')}"}
+
+
+@lru_cache(maxsize=1)
+def _ssl_context() -> ssl.SSLContext:
+    return ssl.create_default_context()
@@ -0,0 +1,154 @@
+import json
+import os
+import platform
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import wraps
+from pathlib import Path
+from typing import Any, ParamSpec, TypeVar
+
+from aicage.paths import TRACE_LOG_DIR
+
+_TRACE_ENV = "AICAGE_TRACE"
+_TRUTHY_VALUES: set[str] = {"1", "true", "yes", "on"}
+
+SUBPROCESS_COUNTER: str = "subprocesses"
+HTTP_REQUEST_COUNTER: str = "http_requests"
+DOCKER_API_COUNTER: str = "docker_api_calls"
+YAML_BYTES_COUNTER: str = "yaml_bytes_parsed"
+
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+
+
+@dataclass
+class _Span:
+    name: str
+    thread: str
+    start: float
+    end: float | None = None
+    children: list["_Span"] = field(default_factory=list)
+
+
+class _Tracer:
+    def __init__(self) -> None:
+        self.enabled = False
+        self.started = time.perf_counter()
+        self.started_at = datetime.now(timezone.utc)
+        self.spans: list[_Span] = []
+        self.counters: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def stack(self) -> list[_Span]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = []
+            self._local.stack = stack
+        return stack
+
+    def open_span(self, name: str) -> _Span:
+        span = _Span(name=name, thread=threading.current_thread().name, start=time.perf_counter())
+        stack = self.stack()
+        with self._lock:
+            if stack:
+                stack[-1].children.append(span)
+            else:
+                self.spans.append(span)
+        stack.append(span)
+        return span
+
+    def close_span(self, span: _Span) -> None:
+        span.end = time.perf_counter()
+        stack = self.stack()
+        if stack and stack[-1] is span:
+            stack.pop()
+
+    def count(self, counter: str, amount: int) -> None:
+        with self._lock:
+            self.counters[counter] = self.counters.get(counter, 0) + amount
+
+
+_TRACER = _Tracer()
+
+
+def tracing_requested() -> bool:
+    return os.getenv(_TRACE_ENV, "").strip().lower() in _TRUTHY_VALUES
+
+
+def enable_tracing() -> None:
+    _TRACER.enabled = True
+    _TRACER.started = time.perf_counter()
+    _TRACER.started_at = datetime.now(timezone.utc)
+
+
+@contextmanager
+def trace_span(name: str) -> Iterator[None]:
+    if not _TRACER.enabled:
+        yield
+        return
+    span = _TRACER.open_span(name)
+    try:
+        yield
+    finally:
+        _TRACER.close_span(span)
+
+
+def traced(name: str) -> Callable[[Callable[_P, _R]], Callable[_P, _R]]:
+    def decorator(func: Callable[_P, _R]) -> Callable[_P, _R]:
+        @wraps(func)
+        def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _R:
+            with trace_span(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def count_event(counter: str, amount: int = 1) -> None:
+    if _TRACER.enabled:
+        _TRACER.count(counter, amount)
+
+
+def write_trace() -> Path | None:
+    """
+    Writes the collected span tree and counters as JSON next to the global log.
+    Returns None when tracing is disabled; tracing stops after the first write.
+    """
+    if not _TRACER.enabled:
+        return None
+    _TRACER.enabled = False
+    ended = time.perf_counter()
+    payload: dict[str, Any] = {
+        "started_at": _TRACER.started_at.isoformat(),
+        "host": platform.node(),
+        "pid": os.getpid(),
+        "total_ms": _elapsed_ms(_TRACER.started, ended),
+        "counters": dict(sorted(_TRACER.counters.items())),
+        "spans": [_span_to_mapping(span, ended) for span in _TRACER.spans],
+    }
+    TRACE_LOG_DIR.mkdir(parents=True, exist_ok=True)
+    stamp = _TRACER.started_at.strftime("%Y%m%dT%H%M%SZ")
+    path = TRACE_LOG_DIR / f"aicage-trace-{stamp}-{os.getpid()}.json"
+    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    return path
+
+
+def _span_to_mapping(span: _Span, ended: float) -> dict[str, Any]:
+    end = span.end if span.end is not None else ended
+    return {
+        "name": span.name,
+        "thread": span.thread,
+        "start_ms": _elapsed_ms(_TRACER.started, span.start),
+        "duration_ms": _elapsed_ms(span.start, end),
+        "children": [_span_to_mapping(child, ended) for child in span.children],
+    }
+
+
+def _elapsed_ms(start: float, end: float) -> float:
+    return round((end - start) * 1000, 3)
@@ -0,0 +1,29 @@
+from typing import IO, Any
+
+import yaml
+
+from aicage._tracing import YAML_BYTES_COUNTER, count_event
+
+# libyaml bindings are optional in PyYAML builds; the pure Python classes produce the same documents.
+_Loader: Any
+_Dumper: Any
+
+try:
+    from yaml import CSafeDumper as _Dumper
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeDumper as _Dumper
+    from yaml import SafeLoader as _Loader
+
+
+def parse_yaml(payload: str) -> Any:
+    count_event(YAML_BYTES_COUNTER, len(payload))
+    return yaml.load(payload, Loader=_Loader)
+
+
+def dump_yaml(data: Any) -> str:
+    return yaml.dump(data, Dumper=_Dumper, sort_keys=True)
+
+
+def dump_yaml_to(data: Any, handle: IO[str]) -> None:
+    yaml.dump(data, handle, Dumper=_Dumper, sort_keys=True)
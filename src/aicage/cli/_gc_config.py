@@ -0,0 +1,15 @@
+from aicage._logging import get_logger
+from aicage.config.config_store import SettingsStore
+
+
+def gc_project_configs() -> None:
+    logger = get_logger()
+    store = SettingsStore()
+    removed = store.prune_missing_projects()
+    logger.info("Removed %s stale project configs from %s", len(removed), store.projects_dir)
+    if not removed:
+        print("No stale project configs found.")
+        return
+    print("Removed project configs:")
+    for entry in removed:
+        print(f"{entry.project_path} ({store.projects_dir / entry.config_file})")
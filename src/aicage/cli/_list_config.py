@@ -0,0 +1,29 @@
+from pathlib import Path
+
+from aicage._logging import get_logger
+from aicage.config.config_store import SettingsStore
+
+
+def list_project_configs() -> None:
+    logger = get_logger()
+    store = SettingsStore()
+    entries = store.list_projects()
+    logger.info("Listing %s project configs in %s", len(entries), store.projects_dir)
+    if not entries:
+        print("No project configs found.")
+        return
+    missing = 0
+    for entry in entries:
+        exists = Path(entry.project_path).is_dir()
+        if not exists:
+            missing += 1
+        print(f"{entry.project_path}{'' if exists else ' (missing)'}")
+        print(f"  agents: {', '.join(entry.agents) or '-'}")
+        print(f"  bases: {', '.join(entry.bases) or '-'}")
+        print(f"  images: {', '.join(entry.image_refs) or '-'}")
+        print(f"  last used: {entry.last_used}")
+        print(f"  config: {store.projects_dir / entry.config_file}")
+    print()
+    print(f"{len(entries)} project configs, {missing} with missing project directories.")
+    if missing:
+        print("Run 'aicage --config gc' to remove them.")
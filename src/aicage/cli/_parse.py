@@ -4,6 +4,7 @@ from collections.abc import Sequence
 
 from aicage import __version__
 from aicage._logging import get_logger
+from aicage._tracing import traced
 from aicage.cli._errors import CliError
 from aicage.cli_types import ParsedArgs
 
@@ -11,9 +12,10 @@ _MIN_REMAINING_WITH_AGENT = 2
 _CONFIG_ACTION_ALIASES: dict[str, str] = {
     "print": "info",
 }
-_VALID_CONFIG_ACTIONS: set[str] = {"info", "remove"}
+_VALID_CONFIG_ACTIONS: set[str] = {"gc", "info", "list", "remove"}
 
 
+@traced("parse_cli")
 def parse_cli(argv: Sequence[str]) -> ParsedArgs:
     """
     Returns parsed CLI args.
@@ -22,7 +24,8 @@ def parse_cli(argv: Sequence[str]) -> ParsedArgs:
     parser = argparse.ArgumentParser(add_help=False)
     parser.add_argument("--dry-run", action="store_true", help="Print docker run command without executing.")
     parser.add_argument("--docker", action="store_true", help="Mount the host Docker socket into the container.")
-    parser.add_argument("--config", help="Perform config actions such as 'info' or 'remove'.")
+    parser.add_argument("--config", help="Perform config actions: 'info', 'remove', 'list' or 'gc'.")
+    parser.add_argument("--trace", action="store_true", help="Write a timing trace next to the aicage log.")
     parser.add_argument("-h", "--help", action="store_true", help="Show help message and exit.")
     pre_argv, post_argv = _split_argv(argv)
 
@@ -39,10 +42,12 @@ def parse_cli(argv: Sequence[str]) -> ParsedArgs:
         usage: str = (
             "Usage:\n"
             "  aicage <agent>\n"
-            "  aicage [--dry-run] [--docker] -- <agent> [<agent-args>]\n"
-            "  aicage [--dry-run] [--docker] <docker-args> -- <agent> [<agent-args>]\n"
+            "  aicage [--dry-run] [--docker] [--trace] -- <agent> [<agent-args>]\n"
+            "  aicage [--dry-run] [--docker] [--trace] <docker-args> -- <agent> [<agent-args>]\n"
             "  aicage --config info\n"
             "  aicage --config remove\n"
+            "  aicage --config list\n"
+            "  aicage --config gc\n"
             "  aicage --version\n\n"
             "Any arguments between aicage and the agent require a '--' separator before the agent.\n"
             "<docker-args> are any arguments not recognized by aicage.\n"
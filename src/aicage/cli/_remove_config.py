@@ -10,8 +10,7 @@ def remove_project_config() -> None:
     project_path = Path.cwd().resolve()
     config_path = store.project_config_path(project_path)
     logger.info("Removing project config at %s", config_path)
-    if config_path.exists():
-        config_path.unlink()
+    if store.remove_project(project_path):
         print("Project config removed:")
         print(config_path)
     else:
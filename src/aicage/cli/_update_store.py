@@ -0,0 +1,44 @@
+from dataclasses import dataclass
+from pathlib import Path
+
+import yaml
+
+from aicage import paths as paths_module
+from aicage._yaml_codec import dump_yaml, parse_yaml
+
+_LATEST_VERSION_KEY: str = "latest_version"
+_CHECKED_AT_KEY: str = "checked_at"
+
+
+@dataclass(frozen=True)
+class UpdateCheckRecord:
+    latest_version: str
+    checked_at: str
+
+
+class UpdateCheckStore:
+    def __init__(self) -> None:
+        self._path = paths_module.UPDATE_CHECK_STATE_PATH
+
+    def load(self) -> UpdateCheckRecord | None:
+        if not self._path.is_file():
+            return None
+        try:
+            payload = parse_yaml(self._path.read_text(encoding="utf-8")) or {}
+        except (OSError, yaml.YAMLError):
+            return None
+        if not isinstance(payload, dict):
+            return None
+        return UpdateCheckRecord(
+            latest_version=str(payload.get(_LATEST_VERSION_KEY, "") or ""),
+            checked_at=str(payload.get(_CHECKED_AT_KEY, "") or ""),
+        )
+
+    def save(self, record: UpdateCheckRecord) -> Path:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            _LATEST_VERSION_KEY: record.latest_version,
+            _CHECKED_AT_KEY: record.checked_at,
+        }
+        self._path.write_text(dump_yaml(payload), encoding="utf-8")
+        return self._path
@@ -1,38 +1,122 @@
 import json
+import os
 import re
 import subprocess
-import urllib.error
-import urllib.request
+import sys
+from datetime import datetime, timezone
+from http import HTTPStatus
 
+from aicage._http_client import http_request
 from aicage._logging import get_logger
+from aicage._tracing import SUBPROCESS_COUNTER, count_event, traced
 from aicage.runtime.prompts.confirm import prompt_update_aicage
 
+from ._update_store import UpdateCheckRecord, UpdateCheckStore
+
 _PYPI_URL: str = "https://pypi.org/pypi/aicage/json"
 _REQUEST_TIMEOUT_SECONDS: float = 2.5
 _UPGRADE_COMMAND: str = "pipx upgrade aicage"
 _UNKNOWN_VERSION: str = "0.0.0"
+_TTL_ENV: str = "AICAGE_UPDATE_CHECK_TTL"
+_DEFAULT_TTL_SECONDS: int = 60 * 60 * 24
+_REFRESH_MODULE: str = "aicage.cli._version_check"
 
 
 def _check_for_update(current_version: str) -> str | None:
+    """
+    Returns a newer version from the cached PyPI lookup.
+    A stale or missing cache triggers a background refresh; its result is used on the next launch.
+    """
+    ttl = _resolve_ttl()
+    if ttl <= 0:
+        return None
+    store = UpdateCheckStore()
+    record = store.load()
+    if record is None or not _is_fresh(record.checked_at, ttl):
+        _start_background_refresh(store, record)
+
+    latest_version = record.latest_version if record else ""
+    if latest_version and _is_newer(latest_version, current_version):
+        return latest_version
+
+    return None
+
+
+def _fetch_latest_version() -> str | None:
     logger = get_logger()
+    response = http_request("GET", _PYPI_URL, {"Accept": "application/json"}, timeout=_REQUEST_TIMEOUT_SECONDS)
+    if response is None or response.status != HTTPStatus.OK:
+        logger.warning("Version check failed: %s", "unreachable" if response is None else f"HTTP {response.status}")
+        return None
     try:
-        request = urllib.request.Request(_PYPI_URL, headers={"Accept": "application/json"})
-        with urllib.request.urlopen(request, timeout=_REQUEST_TIMEOUT_SECONDS) as response:
-            payload = json.loads(response.read().decode("utf-8"))
-    except (urllib.error.URLError, TimeoutError, json.JSONDecodeError) as exc:
+        payload = json.loads(response.body.decode("utf-8"))
+    except (UnicodeDecodeError, json.JSONDecodeError) as exc:
         logger.warning("Version check failed: %s", exc)
         return None
 
     latest_version = str(payload.get("info", {}).get("version", "")).strip()
-    if not latest_version:
-        return None
+    return latest_version or None
 
-    if _is_newer(latest_version, current_version):
-        return latest_version
 
-    return None
+def _refresh_latest_version() -> None:
+    latest_version = _fetch_latest_version()
+    if latest_version is None:
+        return
+    UpdateCheckStore().save(UpdateCheckRecord(latest_version=latest_version, checked_at=_now_iso()))
 
 
+def _start_background_refresh(store: UpdateCheckStore, record: UpdateCheckRecord | None) -> None:
+    logger = get_logger()
+    # Mark the attempt first so concurrent or offline launches do not spawn a refresh each time.
+    try:
+        store.save(
+            UpdateCheckRecord(
+                latest_version=record.latest_version if record else "",
+                checked_at=_now_iso(),
+            )
+        )
+    except OSError as exc:
+        # The refresh could not store its result either; the update check is optional, so the launch goes on.
+        logger.warning("Failed to record version check attempt: %s", exc)
+        return
+    count_event(SUBPROCESS_COUNTER)
+    try:
+        subprocess.Popen(
+            [sys.executable, "-m", _REFRESH_MODULE],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=True,
+            start_new_session=True,
+        )
+    except OSError as exc:
+        logger.warning("Failed to start background version check: %s", exc)
+
+
+def _resolve_ttl() -> int:
+    raw_value = os.getenv(_TTL_ENV)
+    if raw_value is None:
+        return _DEFAULT_TTL_SECONDS
+    try:
+        return int(raw_value.strip())
+    except ValueError:
+        return _DEFAULT_TTL_SECONDS
+
+
+def _is_fresh(checked_at: str, ttl: int) -> bool:
+    try:
+        checked = datetime.fromisoformat(checked_at)
+    except ValueError:
+        return False
+    age = (datetime.now(timezone.utc) - checked).total_seconds()
+    return 0 <= age <= ttl
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+@traced("maybe_prompt_update")
 def maybe_prompt_update(current_version: str) -> None:
     if current_version == _UNKNOWN_VERSION:
         return
@@ -48,6 +132,7 @@ def maybe_prompt_update(current_version: str) -> None:
 
 def _run_upgrade() -> None:
     logger = get_logger()
+    count_event(SUBPROCESS_COUNTER)
     try:
         result = subprocess.run(
             _UPGRADE_COMMAND.split(),
@@ -85,3 +170,7 @@ def _parse_version(version: str) -> tuple[int, ...] | None:
     if not match:
         return None
     return tuple(int(part) for part in match.group(1).split("."))
+
+
+if __name__ == "__main__":
+    _refresh_latest_version()
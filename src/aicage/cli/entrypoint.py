@@ -4,8 +4,11 @@ from pathlib import Path
 
 from aicage import __version__
 from aicage._logging import get_logger
+from aicage._tracing import enable_tracing, trace_span, tracing_requested, write_trace
 from aicage.cli._errors import CliError
+from aicage.cli._gc_config import gc_project_configs
 from aicage.cli._info_config import info_project_config
+from aicage.cli._list_config import list_project_configs
 from aicage.cli._parse import parse_cli
 from aicage.cli._remove_config import remove_project_config
 from aicage.cli._version_check import maybe_prompt_update
@@ -16,25 +19,24 @@ from aicage.errors import AicageError
 from aicage.registry.ensure_image import ensure_image
 from aicage.runtime.run_args import DockerRunArgs
 from aicage.runtime.run_plan import build_run_args
+from aicage.runtime.run_plan_cache import load_cached_run_args, save_run_plan
 
 
 def main(argv: Sequence[str] | None = None) -> int:
     parsed_argv: Sequence[str] = argv if argv is not None else sys.argv[1:]
     logger = get_logger()
+    if tracing_requested() or _trace_requested(parsed_argv):
+        enable_tracing()
     try:
         parsed: ParsedArgs = parse_cli(parsed_argv)
         maybe_prompt_update(__version__)
-        if parsed.config_action == "info":
-            info_project_config()
+        if parsed.config_action is not None:
+            _run_config_action(parsed.config_action)
             return 0
-        if parsed.config_action == "remove":
-            remove_project_config()
-            return 0
-        run_config: RunConfig = load_run_config(parsed.agent, parsed)
-        _validate_home_mount_safety(run_config)
-        logger.info("Resolved run config for agent %s", run_config.agent)
-        ensure_image(run_config)
-        run_args: DockerRunArgs = build_run_args(config=run_config, parsed=parsed)
+        run_args: DockerRunArgs | None = load_cached_run_args(parsed.agent, parsed)
+        if run_args is None:
+            with trace_span("resolve_run_args"):
+                run_args = _resolve_run_args(parsed)
 
         if parsed.dry_run:
             print_run_command(run_args)
@@ -51,6 +53,38 @@ def main(argv: Sequence[str] | None = None) -> int:
         print(f"[aicage] {exc}", file=sys.stderr)
         logger.error("CLI error: %s", exc)
         return 1
+    finally:
+        trace_path = write_trace()
+        if trace_path is not None:
+            logger.info("Wrote launch trace to %s", trace_path)
+
+
+def _run_config_action(config_action: str) -> None:
+    if config_action == "info":
+        info_project_config()
+    elif config_action == "remove":
+        remove_project_config()
+    elif config_action == "list":
+        list_project_configs()
+    elif config_action == "gc":
+        gc_project_configs()
+
+
+def _trace_requested(argv: Sequence[str]) -> bool:
+    # Only aicage's own options count; '--trace' after '--' belongs to the agent.
+    pre_argv = argv[: list(argv).index("--")] if "--" in argv else argv
+    return "--trace" in pre_argv
+
+
+def _resolve_run_args(parsed: ParsedArgs) -> DockerRunArgs:
+    logger = get_logger()
+    run_config: RunConfig = load_run_config(parsed.agent, parsed)
+    _validate_home_mount_safety(run_config)
+    logger.info("Resolved run config for agent %s", run_config.agent)
+    ensure_image(run_config)
+    run_args = build_run_args(config=run_config, parsed=parsed)
+    save_run_plan(run_config, run_args, parsed)
+    return run_args
 
 
 def _validate_home_mount_safety(run_config: RunConfig) -> None:
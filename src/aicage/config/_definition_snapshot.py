@@ -0,0 +1,224 @@
+import json
+import os
+from collections.abc import Callable, Iterable, Mapping
+from functools import partial
+from pathlib import Path
+from typing import Any, TypeVar
+
+from aicage import __version__
+from aicage import paths as paths_module
+from aicage._tracing import traced
+from aicage.config._lazy_definitions import LazyDefinitions
+from aicage.config.agent.loader import load_agents
+from aicage.config.agent.models import AgentMetadata
+from aicage.config.base.loader import load_bases
+from aicage.config.base.models import BaseMetadata
+from aicage.config.extensions.loader import ExtensionMetadata, load_extensions
+from aicage.config.resources import packaged_config_root
+
+_VERSION_KEY: str = "version"
+_MANIFEST_KEY: str = "manifest"
+_BASES_KEY: str = "bases"
+_AGENTS_KEY: str = "agents"
+_EXTENSIONS_KEY: str = "extensions"
+_MISSING_STAT: str = "missing"
+
+_T = TypeVar("_T")
+_Definitions = tuple[Mapping[str, BaseMetadata], Mapping[str, AgentMetadata], Mapping[str, ExtensionMetadata]]
+
+
+class _DefinitionSnapshot:
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        payload = _load_payload(path)
+        if payload is None:
+            # Stat before loading so an edit racing with the load invalidates the snapshot next time.
+            payload = {
+                _VERSION_KEY: __version__,
+                _MANIFEST_KEY: _stat_manifest([*_manifest_paths(_source_roots()), *_schema_paths()]),
+                _BASES_KEY: {},
+                _AGENTS_KEY: {},
+                _EXTENSIONS_KEY: {},
+            }
+        self._payload: dict[str, Any] = payload
+
+    def wrap(
+        self,
+        kind: str,
+        source: Mapping[str, _T],
+        encode: Callable[[_T], dict[str, Any]],
+        decode: Callable[[dict[str, Any]], _T],
+    ) -> LazyDefinitions[_T]:
+        return LazyDefinitions({name: partial(self._resolve, kind, name, source, encode, decode) for name in source})
+
+    def _resolve(
+        self,
+        kind: str,
+        name: str,
+        source: Mapping[str, _T],
+        encode: Callable[[_T], dict[str, Any]],
+        decode: Callable[[dict[str, Any]], _T],
+    ) -> _T:
+        entries: dict[str, Any] = self._payload[kind]
+        cached = entries.get(name)
+        if isinstance(cached, dict):
+            try:
+                return decode(cached)
+            except (KeyError, TypeError):
+                pass
+        value = source[name]
+        entries[name] = encode(value)
+        self._save()
+        return value
+
+    def _save(self) -> None:
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._path.with_name(f"{self._path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(self._payload), encoding="utf-8")
+            os.replace(tmp_path, self._path)
+        except OSError:
+            return
+
+
+@traced("load_definitions")
+def load_definitions() -> _Definitions:
+    """
+    Returns bases, agents and extensions that are loaded on first access.
+    A definition is decoded from the compiled snapshot while none of the definition files changed;
+    otherwise it is read and validated from its source and added to the snapshot.
+    """
+    snapshot = _DefinitionSnapshot(paths_module.CONFIG_SNAPSHOT_STATE_PATH)
+    bases = snapshot.wrap(_BASES_KEY, load_bases(), _base_to_mapping, _read_base)
+    agents = snapshot.wrap(_AGENTS_KEY, load_agents(bases), _agent_to_mapping, _read_agent)
+    extensions = snapshot.wrap(_EXTENSIONS_KEY, load_extensions(), _extension_to_mapping, _read_extension)
+    return bases, agents, extensions
+
+
+def _source_roots() -> list[Path]:
+    config_root = packaged_config_root()
+    return [
+        config_root / "base-build/bases",
+        config_root / "agent-build/agents",
+        paths_module.CUSTOM_BASES_DIR,
+        paths_module.CUSTOM_AGENTS_DIR,
+        paths_module.CUSTOM_EXTENSIONS_DIR,
+    ]
+
+
+def _schema_paths() -> list[Path]:
+    # Snapshot entries were validated against these schemas, so a schema change invalidates them as well.
+    return sorted((packaged_config_root() / "validation").glob("*.schema.json"))
+
+
+def _manifest_paths(roots: Iterable[Path]) -> list[Path]:
+    # Adding or removing a definition changes its parent directory mtime, so only the files
+    # directly inside each definition directory need their own entry.
+    paths: list[Path] = []
+    for root in roots:
+        paths.append(root)
+        if not root.is_dir():
+            continue
+        for entry in sorted(root.iterdir()):
+            if not entry.is_dir():
+                continue
+            paths.append(entry)
+            paths.extend(sorted(child for child in entry.iterdir() if child.is_file()))
+    return paths
+
+
+def _stat_manifest(paths: Iterable[Path]) -> dict[str, str]:
+    manifest: dict[str, str] = {}
+    for path in paths:
+        try:
+            stat = path.stat()
+        except OSError:
+            manifest[str(path)] = _MISSING_STAT
+            continue
+        manifest[str(path)] = f"{stat.st_mtime_ns}:{stat.st_size}"
+    return manifest
+
+
+def _load_payload(path: Path) -> dict[str, Any] | None:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(payload, dict) or payload.get(_VERSION_KEY) != __version__:
+        return None
+    manifest = payload.get(_MANIFEST_KEY)
+    if not isinstance(manifest, dict) or _stat_manifest(Path(key) for key in manifest) != manifest:
+        return None
+    if not all(isinstance(payload.get(kind), dict) for kind in (_BASES_KEY, _AGENTS_KEY, _EXTENSIONS_KEY)):
+        return None
+    return payload
+
+
+def _base_to_mapping(base: BaseMetadata) -> dict[str, Any]:
+    return {
+        "from_image": base.from_image,
+        "base_image_distro": base.base_image_distro,
+        "base_image_description": base.base_image_description,
+        "build_local": base.build_local,
+        "local_definition_dir": str(base.local_definition_dir),
+    }
+
+
+def _read_base(item: dict[str, Any]) -> BaseMetadata:
+    return BaseMetadata(
+        from_image=item["from_image"],
+        base_image_distro=item["base_image_distro"],
+        base_image_description=item["base_image_description"],
+        build_local=item["build_local"],
+        local_definition_dir=Path(item["local_definition_dir"]),
+    )
+
+
+def _agent_to_mapping(agent: AgentMetadata) -> dict[str, Any]:
+    return {
+        "agent_path": agent.agent_path,
+        "agent_full_name": agent.agent_full_name,
+        "agent_homepage": agent.agent_homepage,
+        "build_local": agent.build_local,
+        "valid_bases": agent.valid_bases,
+        "local_definition_dir": str(agent.local_definition_dir),
+        "base_exclude": agent.base_exclude,
+        "base_distro_exclude": agent.base_distro_exclude,
+    }
+
+
+def _read_agent(item: dict[str, Any]) -> AgentMetadata:
+    return AgentMetadata(
+        agent_path=list(item["agent_path"]),
+        agent_full_name=item["agent_full_name"],
+        agent_homepage=item["agent_homepage"],
+        build_local=item["build_local"],
+        valid_bases=dict(item["valid_bases"]),
+        local_definition_dir=Path(item["local_definition_dir"]),
+        base_exclude=list(item["base_exclude"]),
+        base_distro_exclude=list(item["base_distro_exclude"]),
+    )
+
+
+def _extension_to_mapping(extension: ExtensionMetadata) -> dict[str, Any]:
+    dockerfile_path = extension.dockerfile_path
+    return {
+        "extension_id": extension.extension_id,
+        "name": extension.name,
+        "description": extension.description,
+        "directory": str(extension.directory),
+        "scripts_dir": str(extension.scripts_dir),
+        "dockerfile_path": str(dockerfile_path) if dockerfile_path is not None else None,
+    }
+
+
+def _read_extension(item: dict[str, Any]) -> ExtensionMetadata:
+    dockerfile_path = item["dockerfile_path"]
+    return ExtensionMetadata(
+        extension_id=item["extension_id"],
+        name=item["name"],
+        description=item["description"],
+        directory=Path(item["directory"]),
+        scripts_dir=Path(item["scripts_dir"]),
+        dockerfile_path=Path(dockerfile_path) if dockerfile_path is not None else None,
+    )
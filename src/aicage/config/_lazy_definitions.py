@@ -0,0 +1,41 @@
+from collections.abc import Callable, Iterator, Mapping
+from functools import partial
+from typing import TypeVar
+
+_T = TypeVar("_T")
+
+
+class LazyDefinitions(Mapping[str, _T]):
+    """
+    Read-only mapping of definition names whose values are loaded and validated on first access.
+    """
+
+    def __init__(self, loaders: Mapping[str, Callable[[], _T]]) -> None:
+        self._loaders: dict[str, Callable[[], _T]] = dict(loaders)
+        self._loaded: dict[str, _T] = {}
+
+    def __getitem__(self, name: str) -> _T:
+        if name not in self._loaded:
+            self._loaded[name] = self._loaders[name]()
+        return self._loaded[name]
+
+    def __contains__(self, name: object) -> bool:
+        # Mapping.__contains__ would load the definition just to test membership.
+        return name in self._loaders
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._loaders)
+
+    def __len__(self) -> int:
+        return len(self._loaders)
+
+
+def merge_definitions(*layers: Mapping[str, _T]) -> LazyDefinitions[_T]:
+    """
+    Merges definition mappings without loading them; later layers override earlier ones by name.
+    """
+    loaders: dict[str, Callable[[], _T]] = {}
+    for layer in layers:
+        for name in layer:
+            loaders[name] = partial(layer.__getitem__, name)
+    return LazyDefinitions(loaders)
@@ -0,0 +1,150 @@
+import json
+import os
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from aicage.config.errors import ConfigError
+from aicage.config.file_locking import lock_config_file
+from aicage.config.project_config import ProjectConfig
+from aicage.config.yaml_loader import load_yaml
+
+_INDEX_FILENAME: str = "index.json"
+_INDEX_VERSION: int = 1
+_VERSION_KEY: str = "version"
+_PROJECTS_KEY: str = "projects"
+
+_PROJECT_PATH_KEY: str = "project_path"
+_AGENTS_KEY: str = "agents"
+_BASES_KEY: str = "bases"
+_IMAGE_REFS_KEY: str = "image_refs"
+_LAST_USED_KEY: str = "last_used"
+
+
+@dataclass(frozen=True)
+class ProjectIndexEntry:
+    config_file: str
+    project_path: str
+    agents: list[str]
+    bases: list[str]
+    image_refs: list[str]
+    last_used: str
+
+
+class ProjectIndex:
+    """
+    Index over all project configs in the projects directory, keyed by config file name.
+    """
+
+    def __init__(self, projects_dir: Path) -> None:
+        self._projects_dir = projects_dir
+        self._path = projects_dir / _INDEX_FILENAME
+
+    def entries(self) -> list[ProjectIndexEntry]:
+        """
+        Returns all indexed projects; builds the index from the config files when it is missing or unreadable.
+        """
+        entries = self._load()
+        if entries is None:
+            with lock_config_file(self._path):
+                entries = self._load()
+                if entries is None:
+                    entries = self._rebuild()
+                    self._save(entries)
+        return sorted(entries.values(), key=lambda entry: entry.project_path)
+
+    def get(self, config_file: str) -> ProjectIndexEntry | None:
+        entries = self._load() or {}
+        return entries.get(config_file)
+
+    def put(self, entry: ProjectIndexEntry) -> None:
+        with lock_config_file(self._path):
+            entries = self._load()
+            if entries is None:
+                entries = self._rebuild()
+            entries[entry.config_file] = entry
+            self._save(entries)
+
+    def remove(self, config_files: list[str]) -> None:
+        with lock_config_file(self._path):
+            entries = self._load()
+            if entries is None:
+                entries = self._rebuild()
+            for config_file in config_files:
+                entries.pop(config_file, None)
+            self._save(entries)
+
+    def _load(self) -> dict[str, ProjectIndexEntry] | None:
+        try:
+            payload = json.loads(self._path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(payload, dict) or payload.get(_VERSION_KEY) != _INDEX_VERSION:
+            return None
+        projects = payload.get(_PROJECTS_KEY)
+        if not isinstance(projects, dict):
+            return None
+        try:
+            return {name: _read_entry(name, item) for name, item in projects.items()}
+        except (AttributeError, KeyError, TypeError):
+            return None
+
+    def _save(self, entries: dict[str, ProjectIndexEntry]) -> None:
+        payload = {
+            _VERSION_KEY: _INDEX_VERSION,
+            _PROJECTS_KEY: {name: _entry_to_mapping(entry) for name, entry in sorted(entries.items())},
+        }
+        self._projects_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._path.with_name(f"{self._path.name}.{os.getpid()}.tmp")
+        try:
+            tmp_path.write_text(json.dumps(payload, indent=1), encoding="utf-8")
+            os.replace(tmp_path, self._path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    def _rebuild(self) -> dict[str, ProjectIndexEntry]:
+        entries: dict[str, ProjectIndexEntry] = {}
+        for config_path in sorted(self._projects_dir.glob("*.yml")):
+            try:
+                data = load_yaml(config_path)
+                config = ProjectConfig.from_mapping(Path(), data)
+                last_used = datetime.fromtimestamp(config_path.stat().st_mtime, timezone.utc).isoformat()
+            except (AttributeError, ConfigError, OSError, TypeError):
+                # Unreadable configs stay unindexed, as they did for the per-file scans this index replaces.
+                continue
+            entries[config_path.name] = index_entry(config_path, config, last_used)
+        return entries
+
+
+def index_entry(config_path: Path, config: ProjectConfig, last_used: str) -> ProjectIndexEntry:
+    agents = config.agents
+    return ProjectIndexEntry(
+        config_file=config_path.name,
+        project_path=config.path,
+        agents=sorted(agents),
+        bases=sorted({cfg.base for cfg in agents.values() if cfg.base}),
+        image_refs=sorted({cfg.image_ref for cfg in agents.values() if cfg.image_ref}),
+        last_used=last_used,
+    )
+
+
+def _entry_to_mapping(entry: ProjectIndexEntry) -> dict[str, Any]:
+    return {
+        _PROJECT_PATH_KEY: entry.project_path,
+        _AGENTS_KEY: entry.agents,
+        _BASES_KEY: entry.bases,
+        _IMAGE_REFS_KEY: entry.image_refs,
+        _LAST_USED_KEY: entry.last_used,
+    }
+
+
+def _read_entry(config_file: str, item: dict[str, Any]) -> ProjectIndexEntry:
+    return ProjectIndexEntry(
+        config_file=config_file,
+        project_path=str(item[_PROJECT_PATH_KEY]),
+        agents=[str(value) for value in item[_AGENTS_KEY]],
+        bases=[str(value) for value in item[_BASES_KEY]],
+        image_refs=[str(value) for value in item[_IMAGE_REFS_KEY]],
+        last_used=str(item[_LAST_USED_KEY]),
+    )
@@ -1,6 +1,6 @@
 import json
 from collections.abc import Callable
-from functools import lru_cache
+from functools import cache
 from typing import Any
 
 from aicage.config.errors import ConfigError
@@ -10,45 +10,60 @@ _SchemaValidator = Callable[[Any, dict[str, Any], str], None]
 _Normalizer = Callable[[dict[str, Any]], dict[str, Any]]
 
 
-@lru_cache(maxsize=1)
+@cache
 def load_schema(path: str) -> dict[str, Any]:
     payload = find_packaged_path(path).read_text(encoding="utf-8")
     return json.loads(payload)
 
 
-def validate_schema_mapping(
-    mapping: dict[str, Any],
-    schema: dict[str, Any],
-    context: str,
-    *,
-    normalizer: _Normalizer | None = None,
-    value_validator: _SchemaValidator | None = None,
-) -> dict[str, Any]:
-    if not isinstance(mapping, dict):
-        raise ConfigError(f"{context} must be a mapping.")
-
-    properties = schema.get("properties", {})
-    required = set(schema.get("required", []))
-    additional = schema.get("additionalProperties", True)
-
-    missing = sorted(required - set(mapping))
-    if missing:
-        raise ConfigError(f"{context} missing required keys: {', '.join(missing)}.")
-
-    if additional is False:
-        unknown = sorted(set(mapping) - set(properties))
-        if unknown:
+class CompiledSchema:
+    """
+    Validator for one schema; key sets and per-key contexts are derived once instead of for every mapping.
+    """
+
+    def __init__(
+        self,
+        schema: dict[str, Any],
+        context: str,
+        *,
+        normalizer: _Normalizer | None = None,
+        value_validator: _SchemaValidator | None = None,
+    ) -> None:
+        properties: dict[str, dict[str, Any]] = schema.get("properties", {})
+        self._context = context
+        self._required = frozenset(schema.get("required", []))
+        self._known: frozenset[str] | None = (
+            frozenset(properties) if schema.get("additionalProperties", True) is False else None
+        )
+        self._normalizer = normalizer
+        self._value_validator = value_validator
+        self._entries: dict[str, tuple[dict[str, Any], str]] = {
+            key: (schema_entry, f"{context}.{key}") for key, schema_entry in properties.items()
+        }
+
+    def validate(self, mapping: dict[str, Any]) -> dict[str, Any]:
+        context = self._context
+        if not isinstance(mapping, dict):
+            raise ConfigError(f"{context} must be a mapping.")
+
+        if not self._required.issubset(mapping):
+            missing = sorted(self._required.difference(mapping))
+            raise ConfigError(f"{context} missing required keys: {', '.join(missing)}.")
+
+        if self._known is not None and not self._known.issuperset(mapping):
+            unknown = sorted(set(mapping).difference(self._known))
             raise ConfigError(f"{context} contains unsupported keys: {', '.join(unknown)}.")
 
-    normalized = dict(mapping)
-    if normalizer is not None:
-        normalized = normalizer(normalized)
+        normalized = dict(mapping)
+        if self._normalizer is not None:
+            normalized = self._normalizer(normalized)
 
-    if value_validator is not None:
-        for key, value in normalized.items():
-            schema_entry = properties.get(key)
-            if schema_entry is None:
-                continue
-            value_validator(value, schema_entry, f"{context}.{key}")
+        value_validator = self._value_validator
+        if value_validator is not None:
+            entries = self._entries
+            for key, value in normalized.items():
+                entry = entries.get(key)
+                if entry is not None:
+                    value_validator(value, entry[0], entry[1])
 
-    return normalized
+        return normalized
@@ -1,5 +1,8 @@
+from collections.abc import Mapping
+from functools import partial
 from pathlib import Path
 
+from aicage.config._lazy_definitions import LazyDefinitions
 from aicage.config.agent._metadata import build_agent_metadata
 from aicage.config.agent._validation import ensure_required_files
 from aicage.config.agent.models import AgentMetadata
@@ -10,27 +13,31 @@ from aicage.paths import CUSTOM_AGENT_DEFINITION_FILES, CUSTOM_AGENTS_DIR
 
 
 def load_custom_agents(
-    bases: dict[str, BaseMetadata],
-) -> dict[str, AgentMetadata]:
+    bases: Mapping[str, BaseMetadata],
+) -> LazyDefinitions[AgentMetadata]:
     agents_dir = CUSTOM_AGENTS_DIR
     if not agents_dir.is_dir():
-        return {}
-
-    custom_agents: dict[str, AgentMetadata] = {}
-    for entry in sorted(agents_dir.iterdir()):
-        if not entry.is_dir():
-            continue
-        agent_name = entry.name
-        agent_path = _find_agent_definition(entry)
-        agent_mapping = load_yaml(agent_path)
-        ensure_required_files(agent_name, entry)
-        custom_agents[agent_name] = build_agent_metadata(
-            agent_name=agent_name,
-            agent_mapping=agent_mapping,
-            bases=bases,
-            definition_dir=entry,
-        )
-    return custom_agents
+        return LazyDefinitions({})
+
+    return LazyDefinitions(
+        {
+            entry.name: partial(_load_custom_agent, entry, bases)
+            for entry in sorted(agents_dir.iterdir())
+            if entry.is_dir()
+        }
+    )
+
+
+def _load_custom_agent(agent_dir: Path, bases: Mapping[str, BaseMetadata]) -> AgentMetadata:
+    agent_path = _find_agent_definition(agent_dir)
+    agent_mapping = load_yaml(agent_path)
+    ensure_required_files(agent_dir.name, agent_dir)
+    return build_agent_metadata(
+        agent_name=agent_dir.name,
+        agent_mapping=agent_mapping,
+        bases=bases,
+        definition_dir=agent_dir,
+    )
 
 
 def _find_agent_definition(agent_dir: Path) -> Path:
@@ -1,3 +1,4 @@
+from collections.abc import Mapping
 from pathlib import Path
 from typing import Any
 
@@ -20,7 +21,7 @@ from aicage.constants import IMAGE_REGISTRY, IMAGE_REPOSITORY, LOCAL_IMAGE_REPOS
 def build_agent_metadata(
     agent_name: str,
     agent_mapping: dict[str, Any],
-    bases: dict[str, BaseMetadata],
+    bases: Mapping[str, BaseMetadata],
     definition_dir: Path,
 ) -> AgentMetadata:
     normalized_mapping = validate_agent_mapping(agent_mapping)
@@ -51,7 +52,7 @@ def build_agent_metadata(
 
 def _build_valid_bases(
     agent_name: str,
-    bases: dict[str, BaseMetadata],
+    bases: Mapping[str, BaseMetadata],
     base_exclude: list[str],
     base_distro_exclude: list[str],
     build_local: bool,
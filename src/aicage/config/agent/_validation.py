@@ -1,7 +1,8 @@
+from functools import cache
 from pathlib import Path
 from typing import Any
 
-from aicage.config._schema_validation import load_schema, validate_schema_mapping
+from aicage.config._schema_validation import CompiledSchema, load_schema
 from aicage.config._yaml import expect_bool, expect_string
 from aicage.config.agent.models import BUILD_LOCAL_KEY
 from aicage.config.errors import ConfigError
@@ -11,10 +12,13 @@ _AGENT_CONTEXT = "agent metadata"
 
 
 def validate_agent_mapping(mapping: dict[str, Any]) -> dict[str, Any]:
-    schema = load_schema(_AGENT_SCHEMA_PATH)
-    return validate_schema_mapping(
-        mapping,
-        schema,
+    return _compiled_schema().validate(mapping)
+
+
+@cache
+def _compiled_schema() -> CompiledSchema:
+    return CompiledSchema(
+        load_schema(_AGENT_SCHEMA_PATH),
         _AGENT_CONTEXT,
         normalizer=_apply_defaults,
         value_validator=_validate_value,
@@ -0,0 +1,13 @@
+import hashlib
+from pathlib import Path
+
+
+def agent_definition_hash(definition_dir: Path) -> str:
+    """
+    Returns a digest over the relative paths and contents of all files in the agent definition directory.
+    """
+    digest = hashlib.sha256()
+    for path in sorted(entry for entry in definition_dir.rglob("*") if entry.is_file()):
+        file_digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        digest.update(f"{path.relative_to(definition_dir).as_posix()}\0{file_digest}\n".encode())
+    return digest.hexdigest()
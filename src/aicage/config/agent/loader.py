@@ -1,50 +1,47 @@
+from collections.abc import Mapping
+from functools import partial
 from pathlib import Path
 
+from aicage._tracing import traced
+from aicage.config._lazy_definitions import LazyDefinitions, merge_definitions
 from aicage.config.agent._custom_loader import load_custom_agents
 from aicage.config.agent._metadata import build_agent_metadata
 from aicage.config.agent._validation import ensure_required_files
 from aicage.config.agent.models import AgentMetadata
 from aicage.config.base.models import BaseMetadata
 from aicage.config.errors import ConfigError
-from aicage.config.resources import find_packaged_path
+from aicage.config.resources import list_packaged_dirs
 from aicage.config.yaml_loader import load_yaml
 
+_AGENTS_DIR_NAME: str = "agent-build/agents"
 _AGENT_DEFINITION_FILES: tuple[str, str] = ("agent.yaml", "agent.yml")
 
 
-def load_agents(bases: dict[str, BaseMetadata]) -> dict[str, AgentMetadata]:
-    builtin_agents = _load_builtin_agents(bases)
-    custom_agents = load_custom_agents(bases)
-    merged_agents = dict(builtin_agents)
-    merged_agents.update(custom_agents)
-    return merged_agents
-
-
-def _load_builtin_agents(bases: dict[str, BaseMetadata]) -> dict[str, AgentMetadata]:
-    agents_dir = _builtin_agents_dir()
-    if not agents_dir.is_dir():
-        raise ConfigError(f"Built-in agent directory '{agents_dir}' is missing.")
-
-    agents: dict[str, AgentMetadata] = {}
-    for entry in sorted(agents_dir.iterdir()):
-        if not entry.is_dir():
-            continue
-        agent_name = entry.name
-        agent_path = _find_agent_definition(entry)
-        agent_mapping = load_yaml(agent_path)
-        ensure_required_files(agent_name, entry)
-        agents[agent_name] = build_agent_metadata(
-            agent_name=agent_name,
-            agent_mapping=agent_mapping,
-            bases=bases,
-            definition_dir=entry,
-        )
-    return agents
-
-
-def _builtin_agents_dir() -> Path:
-    dockerfile = find_packaged_path("agent-build/Dockerfile")
-    return dockerfile.parent / "agents"
+@traced("load_agents")
+def load_agents(bases: Mapping[str, BaseMetadata]) -> LazyDefinitions[AgentMetadata]:
+    """
+    Lists built-in and custom agents; each agent is read and validated on first access.
+    Custom agents override built-in agents with the same name.
+    """
+    return merge_definitions(_load_builtin_agents(bases), load_custom_agents(bases))
+
+
+def _load_builtin_agents(bases: Mapping[str, BaseMetadata]) -> Mapping[str, AgentMetadata]:
+    return LazyDefinitions(
+        {entry.name: partial(_load_builtin_agent, entry, bases) for entry in list_packaged_dirs(_AGENTS_DIR_NAME)}
+    )
+
+
+def _load_builtin_agent(agent_dir: Path, bases: Mapping[str, BaseMetadata]) -> AgentMetadata:
+    agent_path = _find_agent_definition(agent_dir)
+    agent_mapping = load_yaml(agent_path)
+    ensure_required_files(agent_dir.name, agent_dir)
+    return build_agent_metadata(
+        agent_name=agent_dir.name,
+        agent_mapping=agent_mapping,
+        bases=bases,
+        definition_dir=agent_dir,
+    )
 
 
 def _find_agent_definition(agent_dir: Path) -> Path:
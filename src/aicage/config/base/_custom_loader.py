@@ -1,5 +1,7 @@
+from functools import partial
 from pathlib import Path
 
+from aicage.config._lazy_definitions import LazyDefinitions
 from aicage.config._yaml import expect_string
 from aicage.config.base._validation import validate_base_mapping
 from aicage.config.base.models import BaseMetadata
@@ -14,18 +16,14 @@ _BASE_IMAGE_DESCRIPTION_KEY: str = "base_image_description"
 _DOCKERFILE_NAME: str = "Dockerfile"
 
 
-def load_custom_bases() -> dict[str, BaseMetadata]:
+def load_custom_bases() -> LazyDefinitions[BaseMetadata]:
     bases_dir = CUSTOM_BASES_DIR
     if not bases_dir.is_dir():
-        return {}
-
-    custom_bases: dict[str, BaseMetadata] = {}
-    for entry in sorted(bases_dir.iterdir()):
-        if not entry.is_dir():
-            continue
-        base_name = entry.name
-        custom_bases[base_name] = _load_custom_base(base_name)
-    return custom_bases
+        return LazyDefinitions({})
+
+    return LazyDefinitions(
+        {entry.name: partial(_load_custom_base, entry.name) for entry in sorted(bases_dir.iterdir()) if entry.is_dir()}
+    )
 
 
 def _load_custom_base(base_name: str) -> BaseMetadata:
@@ -1,6 +1,7 @@
+from functools import cache
 from typing import Any
 
-from aicage.config._schema_validation import load_schema, validate_schema_mapping
+from aicage.config._schema_validation import CompiledSchema, load_schema
 from aicage.config._yaml import expect_bool, expect_string
 from aicage.config.base.models import BUILD_LOCAL_KEY
 from aicage.config.errors import ConfigError
@@ -10,10 +11,13 @@ _BASE_CONTEXT: str = "base metadata"
 
 
 def validate_base_mapping(mapping: dict[str, Any]) -> dict[str, Any]:
-    schema = load_schema(_BASE_SCHEMA_PATH)
-    return validate_schema_mapping(
-        mapping,
-        schema,
+    return _compiled_schema().validate(mapping)
+
+
+@cache
+def _compiled_schema() -> CompiledSchema:
+    return CompiledSchema(
+        load_schema(_BASE_SCHEMA_PATH),
         _BASE_CONTEXT,
         normalizer=_apply_defaults,
         value_validator=_validate_value,
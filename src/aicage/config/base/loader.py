@@ -1,11 +1,15 @@
+from collections.abc import Mapping
+from functools import partial
 from pathlib import Path
 
+from aicage._tracing import traced
+from aicage.config._lazy_definitions import LazyDefinitions, merge_definitions
 from aicage.config._yaml import expect_bool, expect_string
 from aicage.config.base._custom_loader import load_custom_bases
 from aicage.config.base._validation import validate_base_mapping
 from aicage.config.base.models import BUILD_LOCAL_KEY, BaseMetadata
 from aicage.config.errors import ConfigError
-from aicage.config.resources import find_packaged_path
+from aicage.config.resources import list_packaged_dirs
 from aicage.config.yaml_loader import load_yaml
 
 _BASES_DIR_NAME: str = "base-build/bases"
@@ -15,42 +19,34 @@ _BASE_IMAGE_DISTRO_KEY: str = "base_image_distro"
 _BASE_IMAGE_DESCRIPTION_KEY: str = "base_image_description"
 
 
-def load_bases() -> dict[str, BaseMetadata]:
-    builtin_bases = _load_builtin_bases()
-    custom_bases = load_custom_bases()
-    merged_bases = dict(builtin_bases)
-    merged_bases.update(custom_bases)
-    return merged_bases
-
-
-def _load_builtin_bases() -> dict[str, BaseMetadata]:
-    bases_dir = _builtin_bases_dir()
-    if not bases_dir.is_dir():
-        raise ConfigError(f"Built-in base directory '{bases_dir}' is missing.")
-
-    bases: dict[str, BaseMetadata] = {}
-    for entry in sorted(bases_dir.iterdir()):
-        if not entry.is_dir():
-            continue
-        base_name = entry.name
-        definition_path = _find_base_definition(entry)
-        mapping = validate_base_mapping(load_yaml(definition_path))
-        bases[base_name] = BaseMetadata(
-            from_image=expect_string(mapping.get(_FROM_IMAGE_KEY), _FROM_IMAGE_KEY),
-            base_image_distro=expect_string(mapping.get(_BASE_IMAGE_DISTRO_KEY), _BASE_IMAGE_DISTRO_KEY),
-            base_image_description=expect_string(
-                mapping.get(_BASE_IMAGE_DESCRIPTION_KEY),
-                _BASE_IMAGE_DESCRIPTION_KEY,
-            ),
-            build_local=expect_bool(mapping.get(BUILD_LOCAL_KEY), BUILD_LOCAL_KEY),
-            local_definition_dir=entry,
-        )
-    return bases
-
-
-def _builtin_bases_dir() -> Path:
-    dockerfile = find_packaged_path("agent-build/Dockerfile")
-    return dockerfile.parent.parent / _BASES_DIR_NAME
+@traced("load_bases")
+def load_bases() -> LazyDefinitions[BaseMetadata]:
+    """
+    Lists built-in and custom bases; each base is read and validated on first access.
+    Custom bases override built-in bases with the same name.
+    """
+    return merge_definitions(_load_builtin_bases(), load_custom_bases())
+
+
+def _load_builtin_bases() -> Mapping[str, BaseMetadata]:
+    return LazyDefinitions(
+        {entry.name: partial(_load_builtin_base, entry) for entry in list_packaged_dirs(_BASES_DIR_NAME)}
+    )
+
+
+def _load_builtin_base(base_dir: Path) -> BaseMetadata:
+    definition_path = _find_base_definition(base_dir)
+    mapping = validate_base_mapping(load_yaml(definition_path))
+    return BaseMetadata(
+        from_image=expect_string(mapping.get(_FROM_IMAGE_KEY), _FROM_IMAGE_KEY),
+        base_image_distro=expect_string(mapping.get(_BASE_IMAGE_DISTRO_KEY), _BASE_IMAGE_DISTRO_KEY),
+        base_image_description=expect_string(
+            mapping.get(_BASE_IMAGE_DESCRIPTION_KEY),
+            _BASE_IMAGE_DESCRIPTION_KEY,
+        ),
+        build_local=expect_bool(mapping.get(BUILD_LOCAL_KEY), BUILD_LOCAL_KEY),
+        local_definition_dir=base_dir,
+    )
 
 
 def _find_base_definition(base_dir: Path) -> Path:
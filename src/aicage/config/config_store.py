@@ -1,14 +1,20 @@
 import hashlib
+import os
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
-import yaml
-
+from aicage._yaml_codec import dump_yaml_to
 from aicage.paths import PROJECTS_DIR
 
-from .project_config import ProjectConfig
+from ._project_index import ProjectIndex, ProjectIndexEntry, index_entry
+from .file_locking import lock_config_file
+from .project_config import PROJECT_REVISION_KEY, ProjectConfig
 from .yaml_loader import load_yaml
 
+# Launches only refresh the last-used timestamp of an index entry once per interval to keep them read-only.
+_LAST_USED_REFRESH_INTERVAL = timedelta(hours=1)
+
 
 class SettingsStore:
     """
@@ -18,12 +24,18 @@ class SettingsStore:
     def __init__(self) -> None:
         self.projects_dir = PROJECTS_DIR
         self.projects_dir.mkdir(parents=True, exist_ok=True)
+        self._index = ProjectIndex(self.projects_dir)
 
     @staticmethod
     def _save_yaml(path: Path, data: dict[str, Any]) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("w", encoding="utf-8") as handle:
-            yaml.safe_dump(data, handle, sort_keys=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            with tmp_path.open("w", encoding="utf-8") as handle:
+                dump_yaml_to(data, handle)
+            os.replace(tmp_path, path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
 
     def _project_path(self, project_realpath: Path) -> Path:
         digest = hashlib.sha256(str(project_realpath).encode("utf-8")).hexdigest()
@@ -38,10 +50,98 @@ class SettingsStore:
         return ProjectConfig.from_mapping(project_realpath, data)
 
     def save_project(self, project_realpath: Path, config: ProjectConfig) -> None:
-        self._save_yaml(self._project_path(project_realpath), config.to_mapping())
+        """
+        Writes the project config atomically; skips the write when nothing changed since it was loaded or saved.
+        When another launch saved in the meantime, its changes are merged field by field before writing.
+        """
+        if not config.is_dirty():
+            return
+        path = self._project_path(project_realpath)
+        # The lock only covers this read-modify-write; loads read the atomically replaced file without it.
+        with lock_config_file(path):
+            current = load_yaml(path) if path.exists() else {}
+            current_revision = ProjectConfig.from_mapping(project_realpath, current).revision
+            if current_revision != config.revision:
+                config.merge_from(current)
+            revision = current_revision + 1
+            self._save_yaml(path, {**config.to_mapping(), PROJECT_REVISION_KEY: revision})
+        config.mark_saved(revision)
+        self._index.put(index_entry(path, config, _now()))
+
+    def record_use(self, project_realpath: Path, config: ProjectConfig | None = None) -> None:
+        """
+        Refreshes the project's last-used timestamp in the index when it is older than the refresh interval.
+        Without a config, the project config is only loaded when the index entry has to be refreshed.
+        """
+        path = self._project_path(project_realpath)
+        if not path.exists():
+            return
+        entry = self._index.get(path.name)
+        if entry is not None and not _is_stale(entry.last_used):
+            return
+        if config is None:
+            config = self.load_project(project_realpath)
+        self._index.put(index_entry(path, config, _now()))
+
+    def list_projects(self) -> list[ProjectIndexEntry]:
+        return self._index.entries()
+
+    def find_projects_using_image(self, image_ref: str) -> list[tuple[str, Path]]:
+        """
+        Returns project paths and config files of all projects with an agent using the image.
+        """
+        if not image_ref:
+            return []
+        return [
+            (entry.project_path, self.projects_dir / entry.config_file)
+            for entry in self._index.entries()
+            if image_ref in entry.image_refs
+        ]
+
+    def remove_project(self, project_realpath: Path) -> bool:
+        """
+        Removes the project's config file and index entry; returns False when there was no config.
+        """
+        path = self._project_path(project_realpath)
+        existed = path.exists()
+        self._remove_config_files([path.name])
+        return existed
+
+    def prune_missing_projects(self) -> list[ProjectIndexEntry]:
+        """
+        Removes configs whose project directory or config file no longer exists and returns their index entries.
+        """
+        stale = [
+            entry
+            for entry in self._index.entries()
+            if not Path(entry.project_path).is_dir() or not (self.projects_dir / entry.config_file).exists()
+        ]
+        self._remove_config_files([entry.config_file for entry in stale])
+        return stale
+
+    def _remove_config_files(self, config_files: list[str]) -> None:
+        if not config_files:
+            return
+        for config_file in config_files:
+            path = self.projects_dir / config_file
+            with lock_config_file(path):
+                path.unlink(missing_ok=True)
+        self._index.remove(config_files)
 
     def project_config_path(self, project_realpath: Path) -> Path:
         """
         Returns the path to a project's config file under the base directory.
         """
         return self._project_path(project_realpath)
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _is_stale(last_used: str) -> bool:
+    try:
+        used_at = datetime.fromisoformat(last_used)
+    except ValueError:
+        return True
+    return datetime.now(timezone.utc) - used_at >= _LAST_USED_REFRESH_INTERVAL
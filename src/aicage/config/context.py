@@ -1,3 +1,4 @@
+from collections.abc import Mapping
 from dataclasses import dataclass
 
 from aicage.config.agent.models import AgentMetadata
@@ -13,9 +14,9 @@ from .project_config import ProjectConfig
 class ConfigContext:
     store: SettingsStore
     project_cfg: ProjectConfig
-    agents: dict[str, AgentMetadata]
-    bases: dict[str, BaseMetadata]
-    extensions: dict[str, ExtensionMetadata]
+    agents: Mapping[str, AgentMetadata]
+    bases: Mapping[str, BaseMetadata]
+    extensions: Mapping[str, ExtensionMetadata]
 
     @staticmethod
     def image_repository_ref() -> str:
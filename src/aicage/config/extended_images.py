@@ -1,11 +1,14 @@
+import json
+import os
 from dataclasses import dataclass
 from pathlib import Path
-
-import yaml
+from typing import Any
 
 from aicage._logging import get_logger
+from aicage._yaml_codec import dump_yaml
 from aicage.config._yaml import expect_keys, expect_string, read_str_list
 from aicage.config.errors import ConfigError
+from aicage.config.file_locking import lock_config_file
 from aicage.config.yaml_loader import load_yaml
 from aicage.paths import EXTENDED_IMAGE_DEFINITION_FILENAME, IMAGE_EXTENDED_STATE_DIR
 
@@ -14,6 +17,15 @@ _BASE_KEY: str = "base"
 _EXTENSIONS_KEY: str = "extensions"
 _IMAGE_REF_KEY: str = "image_ref"
 
+_CATALOG_FILENAME: str = "catalog.json"
+_CATALOG_VERSION: int = 1
+_VERSION_KEY: str = "version"
+_DIR_STAT_KEY: str = "dir_stat"
+_FILE_STAT_KEY: str = "file_stat"
+_IMAGES_KEY: str = "images"
+_BY_AGENT_KEY: str = "by_agent"
+_BY_EXTENSION_KEY: str = "by_extension"
+
 
 @dataclass(frozen=True)
 class ExtendedImageConfig:
@@ -25,12 +37,111 @@ class ExtendedImageConfig:
     path: Path
 
 
-def load_extended_images(available_extensions: set[str]) -> dict[str, ExtendedImageConfig]:
+def load_extended_images(agent: str, available_extensions: set[str]) -> dict[str, ExtendedImageConfig]:
+    """
+    Returns the extended images of an agent whose extensions are all available.
+    Reads the catalog and stats only the agent's image definitions; the catalog is rebuilt from the definitions
+    when it is missing, unreadable or out of date.
+    """
     images_dir = IMAGE_EXTENDED_STATE_DIR
     if not images_dir.is_dir():
         return {}
+    catalog = _load_catalog(images_dir)
+    if catalog is None or not _catalog_entries_current(catalog, agent):
+        with lock_config_file(_catalog_path(images_dir)):
+            catalog = _scan_catalog(images_dir)
+            _save_catalog(images_dir, catalog)
+    unavailable: set[str] = set()
+    for extension, names in catalog[_BY_EXTENSION_KEY].items():
+        if extension not in available_extensions:
+            unavailable.update(names)
     configs: dict[str, ExtendedImageConfig] = {}
     logger = get_logger()
+    for name in catalog[_BY_AGENT_KEY].get(agent, []):
+        item = catalog[_IMAGES_KEY][name]
+        if name in unavailable:
+            missing = [ext for ext in item[_EXTENSIONS_KEY] if ext not in available_extensions]
+            logger.warning(
+                "Skipping extended image %s; missing extensions: %s",
+                name,
+                ", ".join(sorted(missing)),
+            )
+            continue
+        configs[name] = _config_from_item(images_dir, name, item)
+    return configs
+
+
+def write_extended_image_config(config: ExtendedImageConfig) -> None:
+    config.path.parent.mkdir(parents=True, exist_ok=True)
+    payload = _config_to_mapping(config)
+    config.path.write_text(dump_yaml(payload), encoding="utf-8")
+    images_dir = IMAGE_EXTENDED_STATE_DIR
+    if config.path.parent.parent != images_dir:
+        return
+    with lock_config_file(_catalog_path(images_dir)):
+        catalog = _load_catalog(images_dir)
+        if catalog is None:
+            catalog = _scan_catalog(images_dir)
+        else:
+            catalog[_DIR_STAT_KEY] = _stat_key(images_dir)
+            catalog[_IMAGES_KEY][config.name] = {**payload, _FILE_STAT_KEY: _stat_key(config.path)}
+            _index_catalog(catalog)
+        _save_catalog(images_dir, catalog)
+
+
+def extended_image_config_path(name: str) -> Path:
+    return (
+        IMAGE_EXTENDED_STATE_DIR
+        / name
+        / EXTENDED_IMAGE_DEFINITION_FILENAME
+    )
+
+
+def _catalog_path(images_dir: Path) -> Path:
+    # Kept next to the image directories: writing it inside would change the directory mtime it records.
+    return images_dir.parent / _CATALOG_FILENAME
+
+
+def _stat_key(path: Path) -> str:
+    stat = path.stat()
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def _load_catalog(images_dir: Path) -> dict[str, Any] | None:
+    try:
+        catalog = json.loads(_catalog_path(images_dir).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(catalog, dict) or catalog.get(_VERSION_KEY) != _CATALOG_VERSION:
+        return None
+    if not all(isinstance(catalog.get(key), dict) for key in (_IMAGES_KEY, _BY_AGENT_KEY, _BY_EXTENSION_KEY)):
+        return None
+    try:
+        if catalog.get(_DIR_STAT_KEY) != _stat_key(images_dir):
+            return None
+    except OSError:
+        return None
+    return catalog
+
+
+def _catalog_entries_current(catalog: dict[str, Any], agent: str) -> bool:
+    # Adding or removing an image changes the directory stat; edits in place only show on the definition file.
+    images_dir = IMAGE_EXTENDED_STATE_DIR
+    for name in catalog[_BY_AGENT_KEY].get(agent, []):
+        item = catalog[_IMAGES_KEY].get(name)
+        if not isinstance(item, dict):
+            return False
+        try:
+            if item.get(_FILE_STAT_KEY) != _stat_key(images_dir / name / EXTENDED_IMAGE_DEFINITION_FILENAME):
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def _scan_catalog(images_dir: Path) -> dict[str, Any]:
+    images: dict[str, dict[str, Any]] = {}
+    dir_stat = _stat_key(images_dir)
     for entry in sorted(images_dir.iterdir()):
         if not entry.is_dir():
             continue
@@ -39,6 +150,7 @@ def load_extended_images(available_extensions: set[str]) -> dict[str, ExtendedIm
             raise ConfigError(
                 f"Extended image '{entry.name}' is missing {EXTENDED_IMAGE_DEFINITION_FILENAME}."
             )
+        file_stat = _stat_key(config_path)
         mapping = load_yaml(config_path)
         expect_keys(
             mapping,
@@ -46,40 +158,56 @@ def load_extended_images(available_extensions: set[str]) -> dict[str, ExtendedIm
             optional=set(),
             context=f"extended image config at {config_path}",
         )
-        extensions = read_str_list(mapping.get(_EXTENSIONS_KEY), _EXTENSIONS_KEY)
-        missing = [ext for ext in extensions if ext not in available_extensions]
-        if missing:
-            logger.warning(
-                "Skipping extended image %s; missing extensions: %s",
-                entry.name,
-                ", ".join(sorted(missing)),
-            )
-            continue
-        configs[entry.name] = ExtendedImageConfig(
-            name=entry.name,
-            agent=expect_string(mapping.get(_AGENT_KEY), _AGENT_KEY),
-            base=expect_string(mapping.get(_BASE_KEY), _BASE_KEY),
-            extensions=extensions,
-            image_ref=expect_string(mapping.get(_IMAGE_REF_KEY), _IMAGE_REF_KEY),
-            path=config_path,
-        )
-    return configs
+        images[entry.name] = {
+            _AGENT_KEY: expect_string(mapping.get(_AGENT_KEY), _AGENT_KEY),
+            _BASE_KEY: expect_string(mapping.get(_BASE_KEY), _BASE_KEY),
+            _EXTENSIONS_KEY: read_str_list(mapping.get(_EXTENSIONS_KEY), _EXTENSIONS_KEY),
+            _IMAGE_REF_KEY: expect_string(mapping.get(_IMAGE_REF_KEY), _IMAGE_REF_KEY),
+            _FILE_STAT_KEY: file_stat,
+        }
+    catalog: dict[str, Any] = {_VERSION_KEY: _CATALOG_VERSION, _DIR_STAT_KEY: dir_stat, _IMAGES_KEY: images}
+    _index_catalog(catalog)
+    return catalog
 
 
-def write_extended_image_config(config: ExtendedImageConfig) -> None:
-    config.path.parent.mkdir(parents=True, exist_ok=True)
-    payload = {
+def _index_catalog(catalog: dict[str, Any]) -> None:
+    by_agent: dict[str, list[str]] = {}
+    by_extension: dict[str, list[str]] = {}
+    for name, item in sorted(catalog[_IMAGES_KEY].items()):
+        by_agent.setdefault(item[_AGENT_KEY], []).append(name)
+        for extension in item[_EXTENSIONS_KEY]:
+            by_extension.setdefault(extension, []).append(name)
+    catalog[_BY_AGENT_KEY] = by_agent
+    catalog[_BY_EXTENSION_KEY] = by_extension
+
+
+def _save_catalog(images_dir: Path, catalog: dict[str, Any]) -> None:
+    path = _catalog_path(images_dir)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text(json.dumps(catalog, sort_keys=True), encoding="utf-8")
+        os.replace(tmp_path, path)
+    except OSError:
+        get_logger().warning("Failed to write extended image catalog %s", path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def _config_to_mapping(config: ExtendedImageConfig) -> dict[str, Any]:
+    return {
         _AGENT_KEY: config.agent,
         _BASE_KEY: config.base,
         _EXTENSIONS_KEY: list(config.extensions),
         _IMAGE_REF_KEY: config.image_ref,
     }
-    config.path.write_text(yaml.safe_dump(payload, sort_keys=True), encoding="utf-8")
 
 
-def extended_image_config_path(name: str) -> Path:
-    return (
-        IMAGE_EXTENDED_STATE_DIR
-        / name
-        / EXTENDED_IMAGE_DEFINITION_FILENAME
+def _config_from_item(images_dir: Path, name: str, item: dict[str, Any]) -> ExtendedImageConfig:
+    return ExtendedImageConfig(
+        name=name,
+        agent=item[_AGENT_KEY],
+        base=item[_BASE_KEY],
+        extensions=list(item[_EXTENSIONS_KEY]),
+        image_ref=item[_IMAGE_REF_KEY],
+        path=images_dir / name / EXTENDED_IMAGE_DEFINITION_FILENAME,
     )
@@ -0,0 +1,70 @@
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+_CHUNK_SIZE: int = 1024 * 1024
+# Files modified this recently may change again within the same mtime tick without a visible stat change.
+_RACY_WINDOW_NS: int = 2_000_000_000
+_VERSION_KEY: str = "version"
+_FILES_KEY: str = "files"
+_CACHE_VERSION: int = 1
+
+
+class FileHashCache:
+    """
+    Persistent SHA-256 digests of files, reused while size, mtime and inode are unchanged.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._files: dict[str, list[Any]] = _load_files(path)
+        self._dirty = False
+
+    def file_hash(self, path: Path) -> str:
+        stat = path.stat()
+        key = str(path)
+        fingerprint = [stat.st_size, stat.st_mtime_ns, stat.st_ino]
+        cached = self._files.get(key)
+        if isinstance(cached, list) and cached[:3] == fingerprint:
+            return str(cached[3])
+        digest = _hash_file(path)
+        if time.time_ns() - stat.st_mtime_ns > _RACY_WINDOW_NS:
+            self._files[key] = [*fingerprint, digest]
+            self._dirty = True
+        return digest
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        tmp_path = self._path.with_name(f"{self._path.name}.{os.getpid()}.tmp")
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps({_VERSION_KEY: _CACHE_VERSION, _FILES_KEY: self._files}), encoding="utf-8")
+            os.replace(tmp_path, self._path)
+            self._dirty = False
+        except OSError:
+            return
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+
+def _load_files(path: Path) -> dict[str, list[Any]]:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(payload, dict) or payload.get(_VERSION_KEY) != _CACHE_VERSION:
+        return {}
+    files = payload.get(_FILES_KEY)
+    return files if isinstance(files, dict) else {}
+
+
+def _hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        while chunk := handle.read(_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
@@ -1,6 +1,7 @@
+from functools import cache
 from typing import Any
 
-from aicage.config._schema_validation import load_schema, validate_schema_mapping
+from aicage.config._schema_validation import CompiledSchema, load_schema
 from aicage.config._yaml import expect_string
 from aicage.config.errors import ConfigError
 
@@ -9,9 +10,12 @@ _EXTENSION_CONTEXT = "extension metadata"
 
 
 def validate_extension_mapping(mapping: dict[str, Any]) -> dict[str, Any]:
-    context = _EXTENSION_CONTEXT
-    schema = load_schema(_EXTENSION_SCHEMA_PATH)
-    return validate_schema_mapping(mapping, schema, context, value_validator=_validate_value)
+    return _compiled_schema().validate(mapping)
+
+
+@cache
+def _compiled_schema() -> CompiledSchema:
+    return CompiledSchema(load_schema(_EXTENSION_SCHEMA_PATH), _EXTENSION_CONTEXT, value_validator=_validate_value)
 
 
 def _validate_value(value: Any, schema_entry: dict[str, Any], context: str) -> None:
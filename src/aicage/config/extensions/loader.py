@@ -1,13 +1,16 @@
 import hashlib
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import Protocol
 
+from aicage._tracing import traced
+from aicage.config._lazy_definitions import LazyDefinitions
 from aicage.config._yaml import expect_string
 from aicage.config.errors import ConfigError
+from aicage.config.extensions._file_hashes import FileHashCache
 from aicage.config.extensions._validation import validate_extension_mapping
 from aicage.config.yaml_loader import load_yaml
-from aicage.paths import CUSTOM_EXTENSION_DEFINITION_FILES, CUSTOM_EXTENSIONS_DIR
+from aicage.paths import CUSTOM_EXTENSION_DEFINITION_FILES, CUSTOM_EXTENSIONS_DIR, EXTENSION_FILE_HASH_STATE_PATH
 
 _EXTENSION_NAME_KEY: str = "name"
 _EXTENSION_DESCRIPTION_KEY: str = "description"
@@ -15,14 +18,6 @@ _SCRIPTS_DIRNAME: str = "scripts"
 _DOCKERFILE_NAME: str = "Dockerfile"
 
 
-class _HashWriter(Protocol):
-    def update(self, data: bytes, /) -> None:
-        ...
-
-    def hexdigest(self) -> str:
-        ...
-
-
 @dataclass(frozen=True)
 class ExtensionMetadata:
     extension_id: str
@@ -33,44 +28,54 @@ class ExtensionMetadata:
     dockerfile_path: Path | None
 
 
-def load_extensions() -> dict[str, ExtensionMetadata]:
+@traced("load_extensions")
+def load_extensions() -> LazyDefinitions[ExtensionMetadata]:
+    """
+    Lists custom extensions; each extension is read and validated on first access.
+    """
     extensions_dir = CUSTOM_EXTENSIONS_DIR
     if not extensions_dir.is_dir():
-        return {}
-    extensions: dict[str, ExtensionMetadata] = {}
-    for entry in sorted(extensions_dir.iterdir()):
-        if not entry.is_dir():
-            continue
-        extension_id = entry.name
-        definition_path = _find_extension_definition(entry)
-        mapping = validate_extension_mapping(load_yaml(definition_path))
-        scripts_dir = entry / _SCRIPTS_DIRNAME
-        if not scripts_dir.is_dir():
-            raise ConfigError(f"Extension '{extension_id}' is missing scripts/ directory.")
-        dockerfile_path = entry / _DOCKERFILE_NAME
-        extensions[extension_id] = ExtensionMetadata(
-            extension_id=extension_id,
-            name=expect_string(mapping.get(_EXTENSION_NAME_KEY), _EXTENSION_NAME_KEY),
-            description=expect_string(mapping.get(_EXTENSION_DESCRIPTION_KEY), _EXTENSION_DESCRIPTION_KEY),
-            directory=entry,
-            scripts_dir=scripts_dir,
-            dockerfile_path=dockerfile_path if dockerfile_path.is_file() else None,
-        )
-    return extensions
+        return LazyDefinitions({})
+    return LazyDefinitions(
+        {entry.name: partial(_load_extension, entry) for entry in sorted(extensions_dir.iterdir()) if entry.is_dir()}
+    )
 
 
 def extension_hash(extension: ExtensionMetadata) -> str:
-    digest = hashlib.sha256()
-    definition_path = _find_extension_definition(extension.directory)
-    _update_hash(digest, definition_path)
+    """
+    Returns a digest over the names and content digests of the extension's definition, Dockerfile and scripts.
+    Content digests are cached per file, so unchanged files only cost a stat.
+    """
+    files = [_find_extension_definition(extension.directory)]
     if extension.dockerfile_path is not None:
-        _update_hash(digest, extension.dockerfile_path)
-    for script in sorted(extension.scripts_dir.glob("*.sh")):
-        if script.is_file():
-            _update_hash(digest, script)
+        files.append(extension.dockerfile_path)
+    files.extend(script for script in sorted(extension.scripts_dir.glob("*.sh")) if script.is_file())
+    hash_cache = FileHashCache(EXTENSION_FILE_HASH_STATE_PATH)
+    digest = hashlib.sha256()
+    for path in files:
+        digest.update(f"{path.name}\0{hash_cache.file_hash(path)}\n".encode())
+    hash_cache.save()
     return digest.hexdigest()
 
 
+def _load_extension(extension_dir: Path) -> ExtensionMetadata:
+    extension_id = extension_dir.name
+    definition_path = _find_extension_definition(extension_dir)
+    mapping = validate_extension_mapping(load_yaml(definition_path))
+    scripts_dir = extension_dir / _SCRIPTS_DIRNAME
+    if not scripts_dir.is_dir():
+        raise ConfigError(f"Extension '{extension_id}' is missing scripts/ directory.")
+    dockerfile_path = extension_dir / _DOCKERFILE_NAME
+    return ExtensionMetadata(
+        extension_id=extension_id,
+        name=expect_string(mapping.get(_EXTENSION_NAME_KEY), _EXTENSION_NAME_KEY),
+        description=expect_string(mapping.get(_EXTENSION_DESCRIPTION_KEY), _EXTENSION_DESCRIPTION_KEY),
+        directory=extension_dir,
+        scripts_dir=scripts_dir,
+        dockerfile_path=dockerfile_path if dockerfile_path.is_file() else None,
+    )
+
+
 def _find_extension_definition(extension_dir: Path) -> Path:
     for filename in CUSTOM_EXTENSION_DEFINITION_FILES:
         candidate = extension_dir / filename
@@ -78,8 +83,3 @@ def _find_extension_definition(extension_dir: Path) -> Path:
             return candidate
     expected = ", ".join(CUSTOM_EXTENSION_DEFINITION_FILES)
     raise ConfigError(f"Extension '{extension_dir.name}' is missing {expected}.")
-
-
-def _update_hash(digest: _HashWriter, path: Path) -> None:
-    digest.update(path.name.encode("utf-8"))
-    digest.update(path.read_bytes())
@@ -7,15 +7,20 @@ import portalocker
 from aicage.config.errors import ConfigError
 
 _LOCK_TIMEOUT_SECONDS = 30
+_LOCK_SUFFIX = ".lock"
 
 
 @contextmanager
-def _lock_project_config(project_config_path: Path) -> Iterator[None]:
+def lock_config_file(config_path: Path) -> Iterator[None]:
+    # Lock a sidecar file: the config itself is replaced by rename on every write.
+    # The sidecar is never deleted: a waiter could otherwise lock the unlinked file while another process locks a new
+    # sidecar at the same path.
+    lock_path = config_path.with_name(f"{config_path.name}{_LOCK_SUFFIX}")
     try:
-        with _lock_file(project_config_path):
+        with _lock_file(lock_path):
             yield
     except portalocker.exceptions.LockException as exc:  # pragma: no cover - rare file lock failure
-        raise ConfigError(f"Failed to lock project configuration file: {exc}") from exc
+        raise ConfigError(f"Failed to lock configuration file {config_path}: {exc}") from exc
 
 
 def _lock_file(path: Path) -> portalocker.Lock:
@@ -1,9 +1,10 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 from typing import Any
 
 from aicage._lists import read_str_list_or_empty
 
+PROJECT_REVISION_KEY: str = "revision"
 _PROJECT_PATH_KEY: str = "path"
 _PROJECT_AGENTS_KEY: str = "agents"
 _DOCKER_ARGS_KEY: str = "docker_args"
@@ -19,6 +20,9 @@ _MOUNT_GNUPG_KEY: str = "gnupg"
 _MOUNT_SSH_KEY: str = "ssh"
 _MOUNT_DOCKER_KEY: str = "docker"
 
+# Marks a key that is absent from one side of a three-way merge.
+_ABSENT = object()
+
 
 @dataclass
 class _AgentMounts:
@@ -92,6 +96,9 @@ class AgentConfig:
 class ProjectConfig:
     path: str
     agents: dict[str, AgentConfig] = field(default_factory=dict)
+    revision: int = field(default=0, init=False, compare=False)
+    # Mapping as last read from or written to disk; None until the config was persisted.
+    _persisted: dict[str, Any] | None = field(default=None, init=False, repr=False, compare=False)
 
     @classmethod
     def from_mapping(cls, project_path: Path, data: dict[str, Any]) -> "ProjectConfig":
@@ -102,11 +109,72 @@ class ProjectConfig:
             for agent_cfg in agents.values():
                 if not agent_cfg.docker_args:
                     agent_cfg.docker_args = legacy_docker_args
-        return cls(
+        config = cls(
             path=data.get(_PROJECT_PATH_KEY, str(project_path)),
             agents=agents,
         )
+        config.revision = _read_revision(data)
+        config._persisted = {key: value for key, value in data.items() if key != PROJECT_REVISION_KEY}
+        return config
 
     def to_mapping(self) -> dict[str, Any]:
         agents_payload = {name: cfg.to_mapping() for name, cfg in self.agents.items()}
         return {_PROJECT_PATH_KEY: self.path, _PROJECT_AGENTS_KEY: agents_payload}
+
+    def is_dirty(self) -> bool:
+        """
+        Returns True when the config, including its agent configs, differs from what is on disk.
+        """
+        return self._persisted is None or self.to_mapping() != self._persisted
+
+    def mark_saved(self, revision: int) -> None:
+        self.revision = revision
+        self._persisted = self.to_mapping()
+
+    def merge_from(self, data: dict[str, Any]) -> None:
+        """
+        Merges a newer on-disk mapping into this config field by field.
+        Fields changed locally since the last load or save keep the local value; all others take the newer value.
+        Existing AgentConfig objects are updated in place so callers holding them keep seeing current values.
+        """
+        theirs = ProjectConfig.from_mapping(Path(self.path), data)
+        merged = _merge_values(self._persisted or {}, self.to_mapping(), theirs.to_mapping())
+        if not isinstance(merged, dict):
+            merged = {}
+        updated = ProjectConfig.from_mapping(Path(self.path), merged)
+        self.path = updated.path
+        for name in list(self.agents):
+            if name not in updated.agents:
+                del self.agents[name]
+        for name, agent_cfg in updated.agents.items():
+            current = self.agents.get(name)
+            if current is None:
+                self.agents[name] = agent_cfg
+                continue
+            for agent_field in fields(AgentConfig):
+                setattr(current, agent_field.name, getattr(agent_cfg, agent_field.name))
+
+
+def _read_revision(data: dict[str, Any]) -> int:
+    revision = data.get(PROJECT_REVISION_KEY, 0)
+    if isinstance(revision, bool) or not isinstance(revision, int):
+        return 0
+    return revision
+
+
+def _merge_values(base: Any, ours: Any, theirs: Any) -> Any:
+    if isinstance(ours, dict) and isinstance(theirs, dict):
+        base_mapping = base if isinstance(base, dict) else {}
+        merged: dict[str, Any] = {}
+        for key in [*theirs, *(key for key in ours if key not in theirs)]:
+            value = _merge_values(
+                base_mapping.get(key, _ABSENT),
+                ours.get(key, _ABSENT),
+                theirs.get(key, _ABSENT),
+            )
+            if value is not _ABSENT:
+                merged[key] = value
+        return merged
+    if ours == base:
+        return theirs
+    return ours
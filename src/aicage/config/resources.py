@@ -1,11 +1,41 @@
+from functools import cache, lru_cache
 from pathlib import Path
 
 from .errors import ConfigError
 
+_CONFIG_DIR_NAME = "config"
+# Present in every layout that ships the packaged config: wheel shared-data and source checkout.
+_CONFIG_ROOT_MARKER = "agent-build/Dockerfile"
 
-def find_packaged_path(filename: str) -> Path:
+
+@lru_cache(maxsize=1)
+def packaged_config_root() -> Path:
+    """
+    Returns the packaged config directory, located once per process.
+    Wheels install it as shared data under the installation prefix, a source checkout keeps it at the repo root;
+    both are parents of this module.
+    """
     for parent in Path(__file__).resolve().parents:
-        candidate = parent / "config" / filename
-        if candidate.is_file():
+        candidate = parent / _CONFIG_DIR_NAME
+        if (candidate / _CONFIG_ROOT_MARKER).is_file():
             return candidate
-    raise ConfigError(f"Packaged config file '{filename}' was not found.")
+    raise ConfigError("Packaged config directory was not found.")
+
+
+@cache
+def find_packaged_path(filename: str) -> Path:
+    candidate = packaged_config_root() / filename
+    if not candidate.is_file():
+        raise ConfigError(f"Packaged config file '{filename}' was not found.")
+    return candidate
+
+
+@cache
+def list_packaged_dirs(relative_dir: str) -> tuple[Path, ...]:
+    """
+    Returns the sorted subdirectories of a packaged config directory such as 'agent-build/agents'.
+    """
+    directory = packaged_config_root() / relative_dir
+    if not directory.is_dir():
+        raise ConfigError(f"Packaged config directory '{directory}' is missing.")
+    return tuple(sorted(entry for entry in directory.iterdir() if entry.is_dir()))
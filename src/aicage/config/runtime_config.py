@@ -2,11 +2,9 @@ from dataclasses import dataclass
 from pathlib import Path
 
 from aicage.cli_types import ParsedArgs
-from aicage.config.agent.loader import load_agents
-from aicage.config.base.loader import load_bases
+from aicage.config._definition_snapshot import load_definitions
 from aicage.config.config_store import SettingsStore
 from aicage.config.context import ConfigContext
-from aicage.config.extensions.loader import load_extensions
 from aicage.config.project_config import AgentConfig
 from aicage.registry.image_selection.models import ImageSelection
 from aicage.registry.image_selection.selection import select_agent_image
@@ -29,18 +27,14 @@ class RunConfig:
 def load_run_config(agent: str, parsed: ParsedArgs | None = None) -> RunConfig:
     store = SettingsStore()
     project_path = Path.cwd().resolve()
-    # project_config_path = store.project_config_path(project_path)
-
-    # with _lock_project_config(project_config_path):
-    bases = load_bases()
-    agents = load_agents(bases)
+    bases, agents, extensions = load_definitions()
     project_cfg = store.load_project(project_path)
     context = ConfigContext(
         store=store,
         project_cfg=project_cfg,
         agents=agents,
         bases=bases,
-        extensions=load_extensions(),
+        extensions=extensions,
     )
     selection = select_agent_image(agent, context)
     agent_cfg = project_cfg.agents.setdefault(agent, AgentConfig())
@@ -53,6 +47,7 @@ def load_run_config(agent: str, parsed: ParsedArgs | None = None) -> RunConfig:
 
     _persist_docker_args(agent_cfg, parsed)
     store.save_project(project_path, project_cfg)
+    store.record_use(project_path, project_cfg)
 
     return RunConfig(
         project_path=project_path,
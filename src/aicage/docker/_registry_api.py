@@ -3,6 +3,8 @@ import urllib.request
 from collections.abc import Mapping
 from typing import Any
 
+from aicage._tracing import HTTP_REQUEST_COUNTER, count_event
+
 from ._timeouts import REGISTRY_REQUEST_TIMEOUT_SECONDS
 from .errors import RegistryDiscoveryError
 from .types import RegistryApiConfig
@@ -18,6 +20,7 @@ def _fetch_pull_token_for_repository(api_config: RegistryApiConfig, repository:
 
 
 def _fetch_json(url: str, headers: dict[str, str] | None) -> tuple[dict[str, Any], Mapping[str, str]]:
+    count_event(HTTP_REQUEST_COUNTER)
     request = urllib.request.Request(url, headers=headers or {})
     try:
         with urllib.request.urlopen(request, timeout=REGISTRY_REQUEST_TIMEOUT_SECONDS) as response:
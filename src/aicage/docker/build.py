@@ -1,19 +1,40 @@
+import os
 import subprocess
+import tempfile
+from collections.abc import Sequence
 from pathlib import Path
+from typing import TextIO
 
 from aicage._logging import get_logger
+from aicage._tracing import SUBPROCESS_COUNTER, count_event, traced
+from aicage.config.agent.definition_hash import agent_definition_hash
 from aicage.config.extensions.loader import ExtensionMetadata
 from aicage.config.resources import find_packaged_path
 from aicage.config.runtime_config import RunConfig
 from aicage.docker.errors import DockerError
+from aicage.docker.query import get_image_inspector
 
+_NO_CACHE_ENV: str = "AICAGE_BUILD_NO_CACHE"
+_TRUTHY_VALUES: set[str] = {"1", "true", "yes", "on"}
+_SCRIPTS_MOUNT: str = "--mount=type=bind,source=scripts,"
+# Declared in every stage of the agent Dockerfile, so the installer layer is only reused for the same agent version
+# and definition. They are added here because the packaged Dockerfile is synced verbatim from aicage-image.
+_AGENT_CACHE_KEY_ARGS: tuple[str, str] = ("AGENT_VERSION", "AGENT_DEFINITION_HASH")
 
+
+@traced("run_build")
 def run_build(
     run_config: RunConfig,
     base_image_ref: str,
     image_ref: str,
+    agent_version: str,
     log_path: Path,
 ) -> None:
+    """
+    Builds the local agent image with the Docker layer cache.
+    The agent version and definition hash are build args of the installer layer, so it only re-runs when one of them
+    or the base image changed.
+    """
     logger = get_logger()
     log_path.parent.mkdir(parents=True, exist_ok=True)
     print(f"[aicage] Building local image {image_ref} (logs: {log_path})...")
@@ -21,24 +42,37 @@ def run_build(
 
     dockerfile_path = find_packaged_path("agent-build/Dockerfile")
     build_root = _build_context_dir(run_config, dockerfile_path)
-    # Docker SDK does not support BuildKit; keep CLI build for compatibility.
-    # See: https://github.com/docker/docker-py/issues/2230
-    command = [
-        "docker",
-        "build",
-        "--no-cache",
-        "--file",
-        str(dockerfile_path),
-        "--build-arg",
-        f"BASE_IMAGE={base_image_ref}",
-        "--build-arg",
-        f"AGENT={run_config.agent}",
-        "--tag",
-        image_ref,
-        str(build_root),
-    ]
-    with log_path.open("w", encoding="utf-8") as log_handle:
+    definition_hash = agent_definition_hash(run_config.context.agents[run_config.agent].local_definition_dir)
+    with (
+        tempfile.TemporaryDirectory(prefix="aicage-agent-") as dockerfile_dir,
+        log_path.open("w", encoding="utf-8") as log_handle,
+    ):
+        keyed_dockerfile = _add_agent_cache_keys(dockerfile_path.read_text(encoding="utf-8"))
+        keyed_dockerfile_path = Path(dockerfile_dir) / "Dockerfile"
+        keyed_dockerfile_path.write_text(keyed_dockerfile, encoding="utf-8")
+        # Docker SDK does not support BuildKit; keep CLI build for compatibility.
+        # See: https://github.com/docker/docker-py/issues/2230
+        command = [
+            "docker",
+            "build",
+            *_cache_args(),
+            "--file",
+            str(keyed_dockerfile_path),
+            "--build-arg",
+            f"BASE_IMAGE={base_image_ref}",
+            "--build-arg",
+            f"AGENT={run_config.agent}",
+            "--build-arg",
+            f"AGENT_VERSION={agent_version}",
+            "--build-arg",
+            f"AGENT_DEFINITION_HASH={definition_hash}",
+            "--tag",
+            image_ref,
+            str(build_root),
+        ]
+        count_event(SUBPROCESS_COUNTER)
         result = subprocess.run(command, check=False, stdout=log_handle, stderr=subprocess.STDOUT)
+        get_image_inspector().invalidate()
     if result.returncode != 0:
         logger.error("Local image build failed for %s (logs: %s)", image_ref, log_path)
         raise DockerError(
@@ -48,61 +82,40 @@ def run_build(
     logger.info("Local image build succeeded for %s", image_ref)
 
 
+@traced("run_extended_build")
 def run_extended_build(
     run_config: RunConfig,
     base_image_ref: str,
     extensions: list[ExtensionMetadata],
     log_path: Path,
+    prefix_refs: Sequence[str] = (),
 ) -> None:
+    """
+    Builds the extended image in a single multi-stage build with one stage per extension.
+    Extensions with their own Dockerfile are built as a chain of builds with intermediate images instead.
+    When prefix_refs is given, the image after each extension but the last is kept under the matching ref.
+    """
     logger = get_logger()
     log_path.parent.mkdir(parents=True, exist_ok=True)
     print(f"[aicage] Building extended image {run_config.selection.image_ref} (logs: {log_path})...")
     logger.info("Building extended image %s (logs: %s)", run_config.selection.image_ref, log_path)
 
-    dockerfile_builtin = find_packaged_path("extension-build/Dockerfile")
-    current_image_ref = base_image_ref
-    intermediate_refs: list[str] = []
     with log_path.open("w", encoding="utf-8") as log_handle:
-        for idx, extension in enumerate(extensions):
-            target_ref = (
-                run_config.selection.image_ref
-                if idx == len(extensions) - 1
-                else _intermediate_image_ref(run_config, extension, idx)
-            )
-            if target_ref != run_config.selection.image_ref:
-                intermediate_refs.append(target_ref)
-            dockerfile_path = extension.dockerfile_path or dockerfile_builtin
-            # Docker SDK does not support BuildKit; keep CLI build for compatibility.
-            # See: https://github.com/docker/docker-py/issues/2230
-            command = [
-                "docker",
-                "build",
-                "--no-cache",
-                "--file",
-                str(dockerfile_path),
-                "--build-arg",
-                f"BASE_IMAGE={current_image_ref}",
-                "--build-arg",
-                f"EXTENSION={extension.extension_id}",
-                "--tag",
-                target_ref,
-                str(extension.directory),
-            ]
-            result = subprocess.run(command, check=False, stdout=log_handle, stderr=subprocess.STDOUT)
-            if result.returncode != 0:
-                logger.error(
-                    "Extended image build failed for %s (logs: %s)",
-                    run_config.selection.image_ref,
-                    log_path,
-                )
-                raise DockerError(
-                    f"Extended image build failed for {run_config.selection.image_ref}. See log at {log_path}."
-                )
-            current_image_ref = target_ref
-    _cleanup_intermediate_images(intermediate_refs)
+        if all(extension.dockerfile_path is None for extension in extensions):
+            succeeded = _run_synthesized_extended_build(run_config, base_image_ref, extensions, prefix_refs, log_handle)
+        else:
+            succeeded = _run_chained_extended_build(run_config, base_image_ref, extensions, prefix_refs, log_handle)
+    if not succeeded:
+        logger.error(
+            "Extended image build failed for %s (logs: %s)",
+            run_config.selection.image_ref,
+            log_path,
+        )
+        raise DockerError(f"Extended image build failed for {run_config.selection.image_ref}. See log at {log_path}.")
     logger.info("Extended image build succeeded for %s", run_config.selection.image_ref)
 
 
+@traced("run_custom_base_build")
 def run_custom_base_build(
     dockerfile_path: Path,
     build_root: Path,
@@ -118,7 +131,7 @@ def run_custom_base_build(
     command = [
         "docker",
         "build",
-        "--no-cache",
+        *_cache_args(),
         "--file",
         str(dockerfile_path),
         "--build-arg",
@@ -127,8 +140,10 @@ def run_custom_base_build(
         image_ref,
         str(build_root),
     ]
+    count_event(SUBPROCESS_COUNTER)
     with log_path.open("w", encoding="utf-8") as log_handle:
         result = subprocess.run(command, check=False, stdout=log_handle, stderr=subprocess.STDOUT)
+        get_image_inspector().invalidate()
     if result.returncode != 0:
         logger.error("Custom base image build failed for %s (logs: %s)", image_ref, log_path)
         raise DockerError(
@@ -138,6 +153,24 @@ def run_custom_base_build(
     logger.info("Custom base image build succeeded for %s", image_ref)
 
 
+def _cache_args() -> list[str]:
+    if os.getenv(_NO_CACHE_ENV, "").strip().lower() in _TRUTHY_VALUES:
+        return ["--no-cache"]
+    return []
+
+
+def _add_agent_cache_keys(dockerfile: str) -> str:
+    lines = dockerfile.splitlines()
+    if not any(line.startswith("FROM ") for line in lines):
+        raise DockerError("Agent Dockerfile has an unexpected layout.")
+    keyed: list[str] = []
+    for line in lines:
+        keyed.append(line)
+        if line.startswith("FROM "):
+            keyed.extend(f"ARG {name}" for name in _AGENT_CACHE_KEY_ARGS)
+    return "\n".join(keyed) + "\n"
+
+
 def _build_context_dir(run_config: RunConfig, dockerfile_path: Path) -> Path:
     agent_metadata = run_config.context.agents[run_config.agent]
     local_definition_dir = agent_metadata.local_definition_dir
@@ -146,6 +179,118 @@ def _build_context_dir(run_config: RunConfig, dockerfile_path: Path) -> Path:
     return local_definition_dir.parent.parent
 
 
+def _run_synthesized_extended_build(
+    run_config: RunConfig,
+    base_image_ref: str,
+    extensions: list[ExtensionMetadata],
+    prefix_refs: Sequence[str],
+    log_handle: TextIO,
+) -> bool:
+    dockerfile = _synthesize_extended_dockerfile(base_image_ref, extensions)
+    context_args: list[str] = []
+    for idx, extension in enumerate(extensions):
+        context_args.extend(["--build-context", f"{_extension_context_name(idx)}={extension.directory}"])
+    builds: list[tuple[list[str], str]] = [(_cache_args(), run_config.selection.image_ref)]
+    # Prefix stages are tagged from the build cache filled by the full build, so these builds run no steps.
+    builds.extend((["--target", _extension_stage_name(idx)], prefix_ref) for idx, prefix_ref in enumerate(prefix_refs))
+    with tempfile.TemporaryDirectory(prefix="aicage-extended-") as build_root:
+        dockerfile_path = Path(build_root) / "Dockerfile"
+        dockerfile_path.write_text(dockerfile, encoding="utf-8")
+        for build_args, target_ref in builds:
+            command = [
+                "docker",
+                "build",
+                *build_args,
+                "--file",
+                str(dockerfile_path),
+                *context_args,
+                "--tag",
+                target_ref,
+                build_root,
+            ]
+            count_event(SUBPROCESS_COUNTER)
+            result = subprocess.run(command, check=False, stdout=log_handle, stderr=subprocess.STDOUT)
+            get_image_inspector().invalidate()
+            if result.returncode != 0:
+                return False
+    return True
+
+
+def _synthesize_extended_dockerfile(base_image_ref: str, extensions: list[ExtensionMetadata]) -> str:
+    """
+    Chains one stage per extension, each running the body of the built-in extension Dockerfile with the scripts
+    bound from the extension's named build context.
+    """
+    template = find_packaged_path("extension-build/Dockerfile").read_text(encoding="utf-8")
+    lines = template.splitlines()
+    from_index = next((idx for idx, line in enumerate(lines) if line.startswith("FROM ")), None)
+    if from_index is None or _SCRIPTS_MOUNT not in template:
+        raise DockerError("Built-in extension Dockerfile has an unexpected layout.")
+    body = "\n".join(lines[from_index + 1 :]).strip()
+
+    stages: list[str] = []
+    previous = base_image_ref
+    for idx in range(len(extensions)):
+        stage = _extension_stage_name(idx)
+        scripts_mount = f"--mount=type=bind,from={_extension_context_name(idx)},source=scripts,"
+        stages.append(f"FROM {previous} AS {stage}\n\n{body.replace(_SCRIPTS_MOUNT, scripts_mount)}\n")
+        previous = stage
+    return "\n".join(stages)
+
+
+def _extension_stage_name(idx: int) -> str:
+    return f"extension-{idx + 1}"
+
+
+def _extension_context_name(idx: int) -> str:
+    return f"extension-{idx + 1}-context"
+
+
+def _run_chained_extended_build(
+    run_config: RunConfig,
+    base_image_ref: str,
+    extensions: list[ExtensionMetadata],
+    prefix_refs: Sequence[str],
+    log_handle: TextIO,
+) -> bool:
+    dockerfile_builtin = find_packaged_path("extension-build/Dockerfile")
+    current_image_ref = base_image_ref
+    intermediate_refs: list[str] = []
+    for idx, extension in enumerate(extensions):
+        if idx == len(extensions) - 1:
+            target_ref = run_config.selection.image_ref
+        elif prefix_refs:
+            target_ref = prefix_refs[idx]
+        else:
+            target_ref = _intermediate_image_ref(run_config, extension, idx)
+            intermediate_refs.append(target_ref)
+        dockerfile_path = extension.dockerfile_path or dockerfile_builtin
+        # Docker SDK does not support BuildKit; keep CLI build for compatibility.
+        # See: https://github.com/docker/docker-py/issues/2230
+        command = [
+            "docker",
+            "build",
+            *_cache_args(),
+            "--file",
+            str(dockerfile_path),
+            "--build-arg",
+            f"BASE_IMAGE={current_image_ref}",
+            "--build-arg",
+            f"EXTENSION={extension.extension_id}",
+            "--tag",
+            target_ref,
+            str(extension.directory),
+        ]
+        count_event(SUBPROCESS_COUNTER)
+        result = subprocess.run(command, check=False, stdout=log_handle, stderr=subprocess.STDOUT)
+        get_image_inspector().invalidate()
+        if result.returncode != 0:
+            return False
+        current_image_ref = target_ref
+    _cleanup_intermediate_images(intermediate_refs)
+    return True
+
+
 def _intermediate_image_ref(run_config: RunConfig, extension: ExtensionMetadata, idx: int) -> str:
     repository, _ = _parse_image_ref(run_config.selection.image_ref)
     tag = f"tmp-{run_config.agent}-{run_config.selection.base}-{idx + 1}-{extension.extension_id}"
@@ -163,6 +308,7 @@ def _parse_image_ref(image_ref: str) -> tuple[str, str]:
 def _cleanup_intermediate_images(intermediate_refs: list[str]) -> None:
     logger = get_logger()
     for image_ref in intermediate_refs:
+        count_event(SUBPROCESS_COUNTER)
         result = subprocess.run(
             ["docker", "image", "rm", "-f", image_ref],
             check=False,
@@ -171,3 +317,4 @@ def _cleanup_intermediate_images(intermediate_refs: list[str]) -> None:
         )
         if result.returncode != 0:
             logger.warning("Failed to remove intermediate image %s", image_ref)
+    get_image_inspector().invalidate()
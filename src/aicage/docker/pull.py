@@ -1,10 +1,16 @@
 import json
 from pathlib import Path
 
+from docker.errors import DockerException
+
 from aicage._logging import get_logger
+from aicage._tracing import DOCKER_API_COUNTER, count_event, traced
 from aicage.docker._client import get_docker_client
+from aicage.docker.errors import DockerError
+from aicage.docker.query import get_image_inspector
 
 
+@traced("run_pull")
 def run_pull(image_ref: str, log_path: Path) -> None:
     logger = get_logger()
     log_path.parent.mkdir(parents=True, exist_ok=True)
@@ -12,14 +18,38 @@ def run_pull(image_ref: str, log_path: Path) -> None:
     logger.info("Pulling image %s (logs: %s)", image_ref, log_path)
 
     client = get_docker_client()
-    with log_path.open("w", encoding="utf-8") as log_handle:
-        for event in client.api.pull(image_ref, stream=True, decode=True):
-            log_handle.write(f"{_format_pull_event(event)}\n")
-            log_handle.flush()
+    count_event(DOCKER_API_COUNTER)
+    try:
+        with log_path.open("w", encoding="utf-8") as log_handle:
+            for event in client.api.pull(image_ref, stream=True, decode=True):
+                log_handle.write(f"{_format_pull_event(event)}\n")
+                log_handle.flush()
+    finally:
+        get_image_inspector().invalidate()
 
     logger.info("Image pull succeeded for %s", image_ref)
 
 
+def tag_image(source_ref: str, target_ref: str) -> None:
+    repository, tag = _split_tag(target_ref)
+    client = get_docker_client()
+    count_event(DOCKER_API_COUNTER)
+    try:
+        client.api.tag(source_ref, repository, tag, force=True)
+    except DockerException as exc:
+        raise DockerError(f"Failed to tag {source_ref} as {target_ref}: {exc}") from exc
+    finally:
+        get_image_inspector().invalidate()
+    get_logger().info("Tagged %s as %s", source_ref, target_ref)
+
+
+def _split_tag(image_ref: str) -> tuple[str, str]:
+    last_colon = image_ref.rfind(":")
+    if last_colon > image_ref.rfind("/"):
+        return image_ref[:last_colon], image_ref[last_colon + 1 :]
+    return image_ref, "latest"
+
+
 def _format_pull_event(event: object) -> str:
     if isinstance(event, bytes):
         return event.decode("utf-8", errors="replace").rstrip("\n")
@@ -1,20 +1,78 @@
 import subprocess
+import threading
+from functools import lru_cache
+from typing import Any
 
 from docker.errors import DockerException, ImageNotFound
 
 from aicage._logging import get_logger
+from aicage._tracing import DOCKER_API_COUNTER, SUBPROCESS_COUNTER, count_event
 
 from ._client import get_docker_client
 from .types import ImageRefRepository
 
 
+class _ImageInspector:
+    """
+    Caches `docker image inspect` attrs per image ref for the lifetime of the process.
+    Missing images are cached too; anything that pulls, builds, tags or removes images must call invalidate().
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._attrs: dict[str, dict[str, Any] | None] = {}
+
+    def attrs(self, image_ref: str) -> dict[str, Any] | None:
+        """
+        Returns the inspect attrs of a local image, or None when it does not exist.
+        Docker errors other than a missing image propagate and are not cached.
+        """
+        with self._lock:
+            if image_ref in self._attrs:
+                return self._attrs[image_ref]
+        client = get_docker_client()
+        count_event(DOCKER_API_COUNTER)
+        try:
+            attrs: dict[str, Any] | None = client.images.get(image_ref).attrs
+        except ImageNotFound:
+            attrs = None
+        with self._lock:
+            self._attrs[image_ref] = attrs
+        return attrs
+
+    def invalidate(self) -> None:
+        # Tags and digest refs alias each other, so any change drops every entry.
+        with self._lock:
+            self._attrs.clear()
+
+
+@lru_cache(maxsize=1)
+def get_image_inspector() -> _ImageInspector:
+    return _ImageInspector()
+
+
 def local_image_exists(image_ref: str) -> bool:
-    client = get_docker_client()
-    try:
-        client.images.get(image_ref)
-    except ImageNotFound:
-        return False
-    return True
+    return get_image_inspector().attrs(image_ref) is not None
+
+
+def get_local_image_id(image_ref: str) -> str | None:
+    attrs = _safe_attrs(image_ref)
+    if attrs is None:
+        return None
+    image_id = attrs.get("Id")
+    if not isinstance(image_id, str) or not image_id:
+        return None
+    return image_id
+
+
+def get_local_image_size(image_ref: str) -> int | None:
+    attrs = _safe_attrs(image_ref)
+    if attrs is None:
+        return None
+    size = attrs.get("Size")
+    if not isinstance(size, int):
+        return None
+    return size
 
 
 def get_local_repo_digest(image: ImageRefRepository) -> str | None:
@@ -22,13 +80,11 @@ def get_local_repo_digest(image: ImageRefRepository) -> str | None:
 
 
 def get_local_repo_digest_for_repo(image_ref: str, repository: str) -> str | None:
-    try:
-        client = get_docker_client()
-        image = client.images.get(image_ref)
-    except (ImageNotFound, DockerException):
+    attrs = _safe_attrs(image_ref)
+    if attrs is None:
         return None
 
-    repo_digests = image.attrs.get("RepoDigests")
+    repo_digests = attrs.get("RepoDigests")
     if not isinstance(repo_digests, list):
         return None
 
@@ -43,13 +99,11 @@ def get_local_repo_digest_for_repo(image_ref: str, repository: str) -> str | Non
 
 
 def get_local_rootfs_layers(image_ref: str) -> list[str] | None:
-    try:
-        client = get_docker_client()
-        image = client.images.get(image_ref)
-    except (ImageNotFound, DockerException):
+    attrs = _safe_attrs(image_ref)
+    if attrs is None:
         return None
 
-    rootfs = image.attrs.get("RootFS")
+    rootfs = attrs.get("RootFS")
     if not isinstance(rootfs, dict):
         return None
     layers = rootfs.get("Layers")
@@ -61,21 +115,45 @@ def get_local_rootfs_layers(image_ref: str) -> list[str] | None:
     return filtered
 
 
+def _safe_attrs(image_ref: str) -> dict[str, Any] | None:
+    try:
+        return get_image_inspector().attrs(image_ref)
+    except DockerException:
+        return None
+
+
 def _remove_old_image_digest(repository: str, old_digest: str) -> None:
     image_ref = f"{repository}@{old_digest}"
     logger = get_logger()
+    count_event(SUBPROCESS_COUNTER)
     result = subprocess.run(
         ["docker", "image", "rm", image_ref],
         check=False,
         stdout=subprocess.DEVNULL,
         stderr=subprocess.DEVNULL,
     )
+    get_image_inspector().invalidate()
     if result.returncode != 0:
         logger.warning("Failed to remove old image digest %s", image_ref)
         return
     logger.info("Removed old image digest %s", image_ref)
 
 
+def remove_image(image_ref: str) -> bool:
+    logger = get_logger()
+    try:
+        client = get_docker_client()
+        count_event(DOCKER_API_COUNTER)
+        client.api.remove_image(image_ref)
+    except DockerException as exc:
+        logger.warning("Failed to remove image %s: %s", image_ref, exc)
+        return False
+    finally:
+        get_image_inspector().invalidate()
+    logger.info("Removed image %s", image_ref)
+    return True
+
+
 def cleanup_old_digest(
     repository: str,
     local_digest: str | None,
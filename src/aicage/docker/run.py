@@ -1,19 +1,35 @@
 import os
 import shlex
 import subprocess
+import sys
 from pathlib import Path
 
 from docker.errors import ContainerError, DockerException, ImageNotFound
 
+from aicage._logging import get_logger
+from aicage._tracing import DOCKER_API_COUNTER, count_event, write_trace
 from aicage.docker._client import get_docker_client
 from aicage.paths import CONTAINER_WORKSPACE_DIR, container_project_path
 from aicage.runtime.env_vars import AICAGE_GID, AICAGE_UID, AICAGE_USER, AICAGE_WORKSPACE
 from aicage.runtime.run_args import DockerRunArgs
 
+_RUN_MODE_ENV: str = "AICAGE_RUN_MODE"
+_RUN_MODE_EXEC: str = "exec"
+_RUN_MODE_SUBPROCESS: str = "subprocess"
+VERSION_CHECK_MARKER: str = "@@aicage-version-check"
+
 
 def run_container(args: DockerRunArgs) -> None:
+    """
+    Starts the agent container.
+    By default the aicage process is replaced by `docker run`; AICAGE_RUN_MODE=subprocess keeps it as the parent.
+    """
     command = _assemble_docker_run(args)
-    subprocess.run(command, check=True)
+    if _resolve_run_mode() == _RUN_MODE_EXEC:
+        _prepare_exec()
+        os.execvp(command[0], command)
+    else:
+        subprocess.run(command, check=True)
 
 
 def print_run_command(args: DockerRunArgs) -> None:
@@ -30,14 +46,52 @@ def run_builder_version_check(image_ref: str, definition_dir: Path) -> subproces
         "&& chmod +x /tmp/version.sh "
         "&& /bin/bash /tmp/version.sh",
     ]
-    volume_src = str(definition_dir.resolve())
+    volumes = {str(definition_dir.resolve()): {"bind": "/agent", "mode": "ro"}}
+    return _run_util_container(image_ref, command, volumes, "/agent")
+
+
+def run_builder_version_checks(image_ref: str, definition_dirs: list[Path]) -> subprocess.CompletedProcess[str]:
+    """
+    Runs the version.sh of every definition dir concurrently in one container, each from its own definition dir.
+    Each result is printed as a marker line with the definition index and exit status, followed by its stdout on
+    success or its stderr on failure.
+    """
+    command = [
+        "/bin/bash",
+        "-c",
+        "for dir in /agents/*; do "
+        "index=${dir##*/}; "
+        "( cd \"$dir\" && sed 's/\\r$//' version.sh > \"/tmp/$index.sh\" "
+        "&& /bin/bash \"/tmp/$index.sh\" > \"/tmp/$index.out\" 2> \"/tmp/$index.err\"; "
+        "echo $? > \"/tmp/$index.status\" ) & "
+        "done; wait; "
+        "for dir in /agents/*; do "
+        "index=${dir##*/}; status=$(cat \"/tmp/$index.status\" 2>/dev/null || echo 1); "
+        f"echo \"{VERSION_CHECK_MARKER} $index $status\"; "
+        "if [ \"$status\" = 0 ]; then cat \"/tmp/$index.out\"; else cat \"/tmp/$index.err\" 2>/dev/null; fi; "
+        "done",
+    ]
+    volumes = {
+        str(definition_dir.resolve()): {"bind": f"/agents/{index}", "mode": "ro"}
+        for index, definition_dir in enumerate(definition_dirs)
+    }
+    return _run_util_container(image_ref, command, volumes, "/agents")
+
+
+def _run_util_container(
+    image_ref: str,
+    command: list[str],
+    volumes: dict[str, dict[str, str]],
+    working_dir: str,
+) -> subprocess.CompletedProcess[str]:
     client = get_docker_client()
+    count_event(DOCKER_API_COUNTER)
     try:
         output = client.containers.run(
             image=image_ref,
             command=command,
-            volumes={volume_src: {"bind": "/agent", "mode": "ro"}},
-            working_dir="/agent",
+            volumes=volumes,
+            working_dir=working_dir,
             remove=True,
             stdout=True,
             stderr=True,
@@ -53,6 +107,30 @@ def run_builder_version_check(image_ref: str, definition_dir: Path) -> subproces
         return subprocess.CompletedProcess(command, 1, stdout="", stderr=str(exc))
 
 
+def _resolve_run_mode() -> str:
+    # Windows has no real exec; os.execvp spawns a detached child there.
+    if os.name == "nt":
+        return _RUN_MODE_SUBPROCESS
+    raw_value = os.getenv(_RUN_MODE_ENV, _RUN_MODE_EXEC).strip().lower()
+    if raw_value == _RUN_MODE_SUBPROCESS:
+        return _RUN_MODE_SUBPROCESS
+    return _RUN_MODE_EXEC
+
+
+def _prepare_exec() -> None:
+    # Nothing after exec runs, so flush everything that would normally be written on exit.
+    # Open files, sockets and lock files are non-inheritable and are closed by the exec itself.
+    logger = get_logger()
+    trace_path = write_trace()
+    if trace_path is not None:
+        logger.info("Wrote launch trace to %s", trace_path)
+    logger.info("Replacing aicage process with docker run.")
+    for handler in logger.handlers:
+        handler.flush()
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+
 def _decode_container_output(output: object) -> str:
     if isinstance(output, bytes):
         return output.decode("utf-8", errors="replace")
@@ -12,12 +12,21 @@ PROJECTS_DIR: Path = _CONFIG_BASE_DIR / "projects"
 
 BASE_IMAGE_BUILD_STATE_DIR: Path = _CONFIG_BASE_DIR / "state/base-image/build"
 IMAGE_BUILD_STATE_DIR: Path = _CONFIG_BASE_DIR / "state/image/build"
+IMAGE_VERIFICATION_STATE_DIR: Path = _CONFIG_BASE_DIR / "state/image/verification"
 AGENT_VERSION_CHECK_STATE_DIR: Path = _CONFIG_BASE_DIR / "state/agent/version-check/state"
 IMAGE_EXTENDED_STATE_DIR: Path = _CONFIG_BASE_DIR / "state/image-extended/state"
 IMAGE_EXTENDED_BUILD_STATE_DIR: Path =  _CONFIG_BASE_DIR / "state/image-extended/build"
+EXTENSION_FILE_HASH_STATE_PATH: Path = _CONFIG_BASE_DIR / "state/image-extended/file-hashes.json"
+EXTENSION_PREFIX_CACHE_STATE_PATH: Path = _CONFIG_BASE_DIR / "state/image-extended/prefix-cache.json"
+RUN_PLAN_STATE_DIR: Path = _CONFIG_BASE_DIR / "state/run-plan"
+CONFIG_SNAPSHOT_STATE_PATH: Path = _CONFIG_BASE_DIR / "state/config/definitions.json"
+UPDATE_CHECK_STATE_PATH: Path = _CONFIG_BASE_DIR / "state/update-check/pypi.yml"
+REGISTRY_TOKEN_STATE_PATH: Path = _CONFIG_BASE_DIR / "state/registry/tokens.yml"
+REMOTE_DIGEST_STATE_DIR: Path = _CONFIG_BASE_DIR / "state/registry/digest"
 
 _LOG_DIR: Path = _CONFIG_BASE_DIR / "logs"
 GLOBAL_LOG_PATH: Path = _LOG_DIR / "aicage.log"
+TRACE_LOG_DIR: Path = _LOG_DIR
 IMAGE_PULL_LOG_DIR: Path = _LOG_DIR / "image/pull"
 BASE_IMAGE_BUILD_LOG_DIR: Path = _LOG_DIR / "base-image/build"
 IMAGE_BUILD_LOG_DIR: Path = _LOG_DIR / "image/build"
@@ -48,6 +57,10 @@ CUSTOM_EXTENSION_DEFINITION_FILES: tuple[str, str] = (
 
 HOST_SSH_DIR: Path = Path.home() / ".ssh"
 HOST_GNUPG_DIR: Path = Path.home() / ".gnupg"
+HOST_GIT_CONFIG_FILES: tuple[Path, Path] = (
+    Path.home() / ".gitconfig",
+    Path.home() / ".config/git/config",
+)
 HOST_DOCKER_SOCKET_PATH: Path = Path("/run/docker.sock")
 
 # CONTAINER PATHS (for mounts to container)
@@ -3,3 +3,7 @@ from aicage.errors import AicageError
 
 class RegistryError(AicageError):
     pass
+
+
+class ImageSignatureError(RegistryError):
+    """Raised when cosign rejects the signature of an image digest."""
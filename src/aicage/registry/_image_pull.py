@@ -1,10 +1,9 @@
 from aicage._logging import get_logger
 from aicage.constants import IMAGE_REGISTRY, IMAGE_REPOSITORY
-from aicage.docker.pull import run_pull
 from aicage.docker.query import cleanup_old_digest, get_local_repo_digest_for_repo
 from aicage.registry._logs import pull_log_path
 from aicage.registry._pull_decision import decide_pull
-from aicage.registry._signature import resolve_verified_digest
+from aicage.registry._verified_pull import pull_verified_image
 
 
 def pull_image(image_ref: str) -> None:
@@ -16,7 +15,6 @@ def pull_image(image_ref: str) -> None:
         logger.info("Image pull not required for %s", image_ref)
         return
 
-    resolve_verified_digest(image_ref)
     log_path = pull_log_path(image_ref)
-    run_pull(image_ref, log_path)
+    pull_verified_image(image_ref, log_path)
     cleanup_old_digest(repository, local_digest, image_ref)
@@ -1,6 +1,8 @@
 import subprocess
+from datetime import datetime, timezone
 
 from aicage._logging import get_logger
+from aicage._tracing import SUBPROCESS_COUNTER, count_event, traced
 from aicage.constants import COSIGN_IDENTITY_REGEXP, COSIGN_IMAGE_REF, COSIGN_OIDC_ISSUER
 from aicage.docker.pull import run_pull
 from aicage.docker.query import (
@@ -8,18 +10,30 @@ from aicage.docker.query import (
     get_local_repo_digest_for_repo,
     local_image_exists,
 )
-from aicage.registry._errors import RegistryError
+from aicage.registry._errors import ImageSignatureError, RegistryError
 from aicage.registry._logs import pull_log_path
+from aicage.registry._verification_store import VerificationRecord, VerificationStore
 from aicage.registry.digest.remote_digest import get_remote_digest
 
 
-def resolve_verified_digest(image_ref: str) -> str:
-    logger = get_logger()
+def resolve_digest_ref(image_ref: str) -> str:
+    """
+    Returns `<repository>@<remote digest>` for an image ref.
+    The digest ref is what gets verified and pulled, so both act on identical content.
+    """
     digest = get_remote_digest(image_ref)
     if digest is None:
         raise RegistryError(f"Failed to resolve remote digest for {image_ref}.")
+    return _with_digest(image_ref, digest)
+
 
-    digest_ref = _with_digest(image_ref, digest)
+@traced("verify_image_signature")
+def verify_image_signature(digest_ref: str) -> None:
+    logger = get_logger()
+    store = VerificationStore()
+    if _is_verified(store.load(digest_ref)):
+        logger.info("Image signature already verified for %s", digest_ref)
+        return
     _ensure_cosign_image()
     logger.info("Verifying image signature for %s", digest_ref)
     result = _run_cosign_verify(digest_ref)
@@ -28,15 +42,34 @@ def resolve_verified_digest(image_ref: str) -> str:
         if output:
             logger.info("Image signature verification output for %s:\n%s", digest_ref, output)
         logger.info("Image signature verification succeeded for %s", digest_ref)
-        return digest_ref
+        store.save(
+            VerificationRecord(
+                digest_ref=digest_ref,
+                cosign_image=COSIGN_IMAGE_REF,
+                oidc_issuer=COSIGN_OIDC_ISSUER,
+                identity_regexp=COSIGN_IDENTITY_REGEXP,
+                verified_at=datetime.now(timezone.utc).isoformat(),
+            )
+        )
+        return
     if output:
         logger.error("Image signature verification output for %s:\n%s", digest_ref, output)
-    raise RegistryError(
+    raise ImageSignatureError(
         "Image signature verification failed for "
         f"{digest_ref}.\nCosign output:\n{output}"
     )
 
 
+def _is_verified(record: VerificationRecord | None) -> bool:
+    # A digest is immutable, so a result only goes stale when the verification policy changes.
+    return (
+        record is not None
+        and record.cosign_image == COSIGN_IMAGE_REF
+        and record.oidc_issuer == COSIGN_OIDC_ISSUER
+        and record.identity_regexp == COSIGN_IDENTITY_REGEXP
+    )
+
+
 def _with_digest(image_ref: str, digest: str) -> str:
     name = image_ref.split("@", 1)[0]
     if ":" in name and name.rfind(":") > name.rfind("/"):
@@ -57,6 +90,7 @@ def _run_cosign_verify(image_ref: str) -> subprocess.CompletedProcess[str]:
         COSIGN_IDENTITY_REGEXP,
         image_ref,
     ]
+    count_event(SUBPROCESS_COUNTER)
     return subprocess.run(
         command,
         check=False,
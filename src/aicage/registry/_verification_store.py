@@ -0,0 +1,62 @@
+import hashlib
+from dataclasses import dataclass
+from pathlib import Path
+
+import yaml
+
+from aicage import paths as paths_module
+from aicage._yaml_codec import dump_yaml, parse_yaml
+
+_DIGEST_REF_KEY: str = "digest_ref"
+_COSIGN_IMAGE_KEY: str = "cosign_image"
+_OIDC_ISSUER_KEY: str = "oidc_issuer"
+_IDENTITY_REGEXP_KEY: str = "identity_regexp"
+_VERIFIED_AT_KEY: str = "verified_at"
+
+
+@dataclass(frozen=True)
+class VerificationRecord:
+    digest_ref: str
+    cosign_image: str
+    oidc_issuer: str
+    identity_regexp: str
+    verified_at: str
+
+
+class VerificationStore:
+    def __init__(self) -> None:
+        self._base_dir = paths_module.IMAGE_VERIFICATION_STATE_DIR
+
+    def load(self, digest_ref: str) -> VerificationRecord | None:
+        path = self._path(digest_ref)
+        if not path.is_file():
+            return None
+        try:
+            payload = parse_yaml(path.read_text(encoding="utf-8")) or {}
+        except (OSError, yaml.YAMLError):
+            return None
+        if not isinstance(payload, dict) or payload.get(_DIGEST_REF_KEY) != digest_ref:
+            return None
+        return VerificationRecord(
+            digest_ref=digest_ref,
+            cosign_image=str(payload.get(_COSIGN_IMAGE_KEY, "") or ""),
+            oidc_issuer=str(payload.get(_OIDC_ISSUER_KEY, "") or ""),
+            identity_regexp=str(payload.get(_IDENTITY_REGEXP_KEY, "") or ""),
+            verified_at=str(payload.get(_VERIFIED_AT_KEY, "") or ""),
+        )
+
+    def save(self, record: VerificationRecord) -> Path:
+        self._base_dir.mkdir(parents=True, exist_ok=True)
+        path = self._path(record.digest_ref)
+        payload = {
+            _DIGEST_REF_KEY: record.digest_ref,
+            _COSIGN_IMAGE_KEY: record.cosign_image,
+            _OIDC_ISSUER_KEY: record.oidc_issuer,
+            _IDENTITY_REGEXP_KEY: record.identity_regexp,
+            _VERIFIED_AT_KEY: record.verified_at,
+        }
+        path.write_text(dump_yaml(payload), encoding="utf-8")
+        return path
+
+    def _path(self, digest_ref: str) -> Path:
+        return self._base_dir / f"{hashlib.sha256(digest_ref.encode('utf-8')).hexdigest()}.yml"
@@ -0,0 +1,39 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from aicage._logging import get_logger
+from aicage.docker.pull import run_pull, tag_image
+from aicage.docker.query import local_image_exists, remove_image
+from aicage.registry._signature import resolve_digest_ref, verify_image_signature
+
+
+def pull_verified_image(image_ref: str, log_path: Path, digest_ref: str | None = None) -> str:
+    """
+    Pulls the remote digest of an image while its signature is verified in parallel.
+    `image_ref` is only pointed at the pulled content once verification succeeded;
+    content that was not present before is removed again when it fails.
+    Returns the verified digest ref.
+    """
+    logger = get_logger()
+    digest_ref = digest_ref or resolve_digest_ref(image_ref)
+    already_present = local_image_exists(digest_ref)
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="aicage-verify") as executor:
+        verification = executor.submit(verify_image_signature, digest_ref)
+        pull_error: Exception | None = None
+        try:
+            run_pull(digest_ref, log_path)
+        except Exception as exc:  # pylint: disable=broad-except
+            pull_error = exc
+        # Always wait for cosign; a rejected signature outranks any pull failure.
+        verification_error = verification.exception()
+
+    if verification_error is not None:
+        if pull_error is None and not already_present:
+            logger.warning("Removing %s after failed signature verification", digest_ref)
+            remove_image(digest_ref)
+        raise verification_error
+    if pull_error is not None:
+        raise pull_error
+
+    tag_image(digest_ref, image_ref)
+    return digest_ref
@@ -4,22 +4,47 @@ from dataclasses import dataclass
 from pathlib import Path
 
 from aicage._logging import get_logger
-from aicage.docker.run import run_builder_version_check
+from aicage._tracing import SUBPROCESS_COUNTER, count_event
+from aicage.docker.run import VERSION_CHECK_MARKER, run_builder_version_check, run_builder_version_checks
+
+_MARKER_FIELDS: int = 3
 
 
 @dataclass(frozen=True)
-class _CommandResult:
+class CommandResult:
     success: bool
     output: str
     error: str
 
 
-def run_version_check_image(image_ref: str, definition_dir: Path) -> _CommandResult:
+def run_version_check_image(image_ref: str, definition_dir: Path) -> CommandResult:
     process = run_builder_version_check(image_ref, definition_dir)
     return _from_process(process, "version check image")
 
 
-def run_host(script_path: Path) -> _CommandResult:
+def run_version_check_images(image_ref: str, definition_dirs: list[Path]) -> list[CommandResult]:
+    """
+    Runs several version checks in one container; results are returned in the order of definition_dirs.
+    """
+    process = run_builder_version_checks(image_ref, definition_dirs)
+    sections = _split_sections(process.stdout or "")
+    missing = subprocess.CompletedProcess(process.args, process.returncode or 1, stdout="", stderr=process.stderr)
+    results: list[CommandResult] = []
+    for index in range(len(definition_dirs)):
+        section = sections.get(index)
+        if section is None:
+            results.append(_from_process(missing, "version check image"))
+            continue
+        status, output = section
+        if status == 0:
+            section_process = subprocess.CompletedProcess(process.args, status, stdout=output, stderr="")
+        else:
+            section_process = subprocess.CompletedProcess(process.args, status, stdout="", stderr=output)
+        results.append(_from_process(section_process, "version check image"))
+    return results
+
+
+def run_host(script_path: Path) -> CommandResult:
     if not os.access(script_path, os.X_OK):
         get_logger().warning(
             "version.sh at %s is not executable; running with /bin/bash.",
@@ -28,20 +53,38 @@ def run_host(script_path: Path) -> _CommandResult:
     return _run_command(["bash", str(script_path)], "host")
 
 
-def _run_command(command: list[str], context: str) -> _CommandResult:
+def _run_command(command: list[str], context: str) -> CommandResult:
+    count_event(SUBPROCESS_COUNTER)
     try:
         process = subprocess.run(command, check=False, capture_output=True, text=True)
     except Exception as exc:
         get_logger().warning("Version check failed in %s: %s", context, exc)
-        return _CommandResult(success=False, output="", error=str(exc))
+        return CommandResult(success=False, output="", error=str(exc))
     return _from_process(process, context)
 
 
-def _from_process(process: subprocess.CompletedProcess[str], context: str) -> _CommandResult:
+def _from_process(process: subprocess.CompletedProcess[str], context: str) -> CommandResult:
     output = process.stdout.strip() if process.stdout else ""
     if process.returncode == 0 and output:
-        return _CommandResult(success=True, output=output, error="")
+        return CommandResult(success=True, output=output, error="")
 
     stderr = process.stderr.strip() if process.stderr else ""
     error = stderr or output or f"Version check failed in {context}."
-    return _CommandResult(success=False, output=output, error=error)
+    return CommandResult(success=False, output=output, error=error)
+
+
+def _split_sections(stdout: str) -> dict[int, tuple[int, str]]:
+    sections: dict[int, tuple[int, str]] = {}
+    index: int | None = None
+    for line in stdout.splitlines():
+        parts = line.split()
+        if len(parts) == _MARKER_FIELDS and parts[0] == VERSION_CHECK_MARKER:
+            try:
+                index = int(parts[1])
+                sections[index] = (int(parts[2]), "")
+            except ValueError:
+                index = None
+        elif index is not None:
+            status, output = sections[index]
+            sections[index] = (status, f"{output}\n{line}" if output else line)
+    return sections
@@ -1,10 +1,9 @@
 from aicage._logging import get_logger
 from aicage.constants import IMAGE_REGISTRY
-from aicage.docker.pull import run_pull
 from aicage.docker.query import cleanup_old_digest, get_local_repo_digest_for_repo
 from aicage.registry._errors import RegistryError
 from aicage.registry._logs import pull_log_path
-from aicage.registry._signature import resolve_verified_digest
+from aicage.registry._verified_pull import pull_verified_image
 from aicage.registry.digest.remote_digest import get_remote_digest
 
 
@@ -33,8 +32,7 @@ def _pull_version_check_image(
     logger = get_logger()
     log_path = pull_log_path(image_ref)
     try:
-        resolve_verified_digest(image_ref)
-        run_pull(image_ref, log_path)
+        pull_verified_image(image_ref, log_path)
     except RegistryError:
         logger.warning("Version check image pull failed; using local image (logs: %s).", log_path)
         return
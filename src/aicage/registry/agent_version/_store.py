@@ -1,31 +1,66 @@
+from dataclasses import dataclass
 from pathlib import Path
 
 import yaml
 
 from aicage import paths as paths_module
+from aicage._yaml_codec import dump_yaml_to, parse_yaml
 from aicage.registry._time import now_iso
 
 _AGENT_KEY: str = "agent"
 _VERSION_KEY: str = "version"
 _CHECKED_AT_KEY: str = "checked_at"
+_DEFINITION_HASH_KEY: str = "definition_hash"
+
+
+@dataclass(frozen=True)
+class VersionCheckRecord:
+    agent: str
+    version: str
+    checked_at: str
+    definition_hash: str = ""
 
 
 class VersionCheckStore:
     def __init__(self) -> None:
         self._base_dir = paths_module.AGENT_VERSION_CHECK_STATE_DIR
 
-    def save(self, agent: str, version: str) -> Path:
+    def load(self, agent: str) -> VersionCheckRecord | None:
+        path = self._path(agent)
+        if not path.is_file():
+            return None
+        try:
+            payload = parse_yaml(path.read_text(encoding="utf-8")) or {}
+        except (OSError, yaml.YAMLError):
+            return None
+        if not isinstance(payload, dict):
+            return None
+        version = str(payload.get(_VERSION_KEY, "") or "")
+        if payload.get(_AGENT_KEY) != agent or not version:
+            return None
+        return VersionCheckRecord(
+            agent=agent,
+            version=version,
+            checked_at=str(payload.get(_CHECKED_AT_KEY, "") or ""),
+            definition_hash=str(payload.get(_DEFINITION_HASH_KEY, "") or ""),
+        )
+
+    def save(self, agent: str, version: str, definition_hash: str) -> Path:
         self._base_dir.mkdir(parents=True, exist_ok=True)
-        path = self._base_dir / f"{_sanitize_agent_name(agent)}.yml"
+        path = self._path(agent)
         with path.open("w", encoding="utf-8") as handle:
             payload = {
                 _AGENT_KEY: agent,
                 _VERSION_KEY: version,
                 _CHECKED_AT_KEY: now_iso(),
+                _DEFINITION_HASH_KEY: definition_hash,
             }
-            yaml.safe_dump(payload, handle, sort_keys=True)
+            dump_yaml_to(payload, handle)
         return path
 
+    def _path(self, agent: str) -> Path:
+        return self._base_dir / f"{_sanitize_agent_name(agent)}.yml"
+
 
 def _sanitize_agent_name(agent_name: str) -> str:
     return agent_name.replace("/", "_")
@@ -1,56 +1,146 @@
+import os
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
 
 from aicage._logging import get_logger
+from aicage._tracing import traced
+from aicage.config.agent.definition_hash import agent_definition_hash
 from aicage.config.agent.models import AgentMetadata
 from aicage.constants import VERSION_CHECK_IMAGE
 from aicage.registry._errors import RegistryError
 
-from ._command import run_host, run_version_check_image
+from ._command import CommandResult, run_host, run_version_check_image, run_version_check_images
 from ._images import ensure_version_check_image
-from ._store import VersionCheckStore
+from ._store import VersionCheckRecord, VersionCheckStore
+
+_MAX_AGE_ENV: str = "AICAGE_AGENT_VERSION_MAX_AGE"
+_DEFAULT_MAX_AGE_SECONDS: int = 60 * 60
+_MAX_HOST_WORKERS: int = 8
 
 
 class AgentVersionChecker:
     def __init__(self, store: VersionCheckStore | None = None) -> None:
         self._store = store or VersionCheckStore()
 
+    @traced("AgentVersionChecker.get_version")
     def get_version(
         self,
         agent_name: str,
         _agent_metadata: AgentMetadata,
         definition_dir: Path,
     ) -> str:
+        """
+        Returns the agent version, reusing the last checked version while it is fresh and the definition is unchanged.
+        A stale stored version is still returned when the version check fails on the host and in the image, unless
+        AICAGE_AGENT_VERSION_MAX_AGE disables reuse.
+        """
+        return self.get_versions({agent_name: definition_dir})[agent_name]
+
+    @traced("AgentVersionChecker.get_versions")
+    def get_versions(self, definition_dirs: Mapping[str, Path]) -> dict[str, str]:
+        """
+        Returns the versions of several agents, keyed by agent name.
+        Host checks run concurrently; agents failing on the host are checked together in one container.
+        """
+        logger = get_logger()
+        for agent_name, definition_dir in definition_dirs.items():
+            script_path = definition_dir / "version.sh"
+            if not script_path.is_file():
+                raise RegistryError(f"Agent '{agent_name}' is missing version.sh at {script_path}.")
+
+        max_age = _resolve_max_age()
+        definition_hashes = {name: agent_definition_hash(path) for name, path in definition_dirs.items()}
+        versions: dict[str, str] = {}
+        cached: dict[str, VersionCheckRecord] = {}
+        pending: list[str] = []
+        for agent_name in definition_dirs:
+            record = self._load_record(agent_name, definition_hashes[agent_name])
+            if record is not None and _is_fresh(record.checked_at, max_age):
+                logger.info("Using cached version %s for %s", record.version, agent_name)
+                versions[agent_name] = record.version
+                continue
+            if record is not None and max_age > 0:
+                cached[agent_name] = record
+            pending.append(agent_name)
+
+        errors: dict[str, list[str]] = {}
+        host_results = _run_on_host([definition_dirs[name] / "version.sh" for name in pending])
+        for agent_name, result in zip(pending, host_results, strict=True):
+            if self._accept(agent_name, result, "host", definition_hashes[agent_name]):
+                versions[agent_name] = result.output
+                continue
+            errors[agent_name] = [result.error]
+
+        if errors:
+            ensure_version_check_image(VERSION_CHECK_IMAGE)
+            failed = list(errors)
+            image_results = _run_in_image([definition_dirs[name] for name in failed])
+            for agent_name, result in zip(failed, image_results, strict=True):
+                if self._accept(agent_name, result, "version check image", definition_hashes[agent_name]):
+                    versions[agent_name] = result.output
+                    del errors[agent_name]
+                    continue
+                errors[agent_name].append(result.error)
+                record = cached.get(agent_name)
+                if record is not None:
+                    logger.warning("Version check failed for %s; using cached version %s", agent_name, record.version)
+                    versions[agent_name] = record.version
+                    del errors[agent_name]
+
+        if errors:
+            message = "; ".join(f"{agent_name}: {'; '.join(messages)}" for agent_name, messages in errors.items())
+            logger.error("Version check failed: %s", message)
+            raise RegistryError(message)
+        return versions
+
+    def _load_record(self, agent_name: str, definition_hash: str) -> VersionCheckRecord | None:
+        record = self._store.load(agent_name)
+        # A version checked against another definition says nothing about the current one.
+        if record is None or record.definition_hash != definition_hash:
+            return None
+        return record
+
+    def _accept(self, agent_name: str, result: CommandResult, context: str, definition_hash: str) -> bool:
         logger = get_logger()
-        script_path = definition_dir / "version.sh"
-        if not script_path.is_file():
-            raise RegistryError(f"Agent '{agent_name}' is missing version.sh at {script_path}.")
-
-        errors: list[str] = []
-        host_result = run_host(script_path)
-        if host_result.success:
-            logger.info("Version check succeeded on host for %s", agent_name)
-            self._store.save(agent_name, host_result.output)
-            return host_result.output
-
-        logger.warning(
-            "Version check failed on host for %s: %s",
-            agent_name,
-            host_result.error,
-        )
-        errors.append(host_result.error)
-
-        ensure_version_check_image(VERSION_CHECK_IMAGE)
-        image_result = run_version_check_image(VERSION_CHECK_IMAGE, definition_dir)
-        if image_result.success:
-            logger.info("Version check succeeded in version check image for %s", agent_name)
-            self._store.save(agent_name, image_result.output)
-            return image_result.output
-
-        logger.warning(
-            "Version check failed in version check image for %s: %s",
-            agent_name,
-            image_result.error,
-        )
-        errors.append(image_result.error)
-        logger.error("Version check failed for %s: %s", agent_name, "; ".join(errors))
-        raise RegistryError("; ".join(errors))
+        if not result.success:
+            logger.warning("Version check failed in %s for %s: %s", context, agent_name, result.error)
+            return False
+        logger.info("Version check succeeded in %s for %s", context, agent_name)
+        self._store.save(agent_name, result.output, definition_hash)
+        return True
+
+
+def _run_on_host(script_paths: list[Path]) -> list[CommandResult]:
+    if len(script_paths) <= 1:
+        return [run_host(script_path) for script_path in script_paths]
+    with ThreadPoolExecutor(max_workers=min(_MAX_HOST_WORKERS, len(script_paths))) as executor:
+        return list(executor.map(run_host, script_paths))
+
+
+def _run_in_image(definition_dirs: list[Path]) -> list[CommandResult]:
+    if len(definition_dirs) == 1:
+        return [run_version_check_image(VERSION_CHECK_IMAGE, definition_dirs[0])]
+    return run_version_check_images(VERSION_CHECK_IMAGE, definition_dirs)
+
+
+def _resolve_max_age() -> int:
+    raw_value = os.getenv(_MAX_AGE_ENV)
+    if raw_value is None:
+        return _DEFAULT_MAX_AGE_SECONDS
+    try:
+        return int(raw_value.strip())
+    except ValueError:
+        return _DEFAULT_MAX_AGE_SECONDS
+
+
+def _is_fresh(checked_at: str, max_age: int) -> bool:
+    if max_age <= 0:
+        return False
+    try:
+        checked = datetime.fromisoformat(checked_at)
+    except ValueError:
+        return False
+    age = (datetime.now(timezone.utc) - checked).total_seconds()
+    return 0 <= age <= max_age
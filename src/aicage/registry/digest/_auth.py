@@ -1,12 +1,24 @@
 import json
 import re
-import urllib.error
+import time
 import urllib.parse
-import urllib.request
+from dataclasses import dataclass
+from datetime import datetime
+from http import HTTPStatus
+
+from aicage._http_client import http_request
 
 from ._timeouts import REGISTRY_REQUEST_TIMEOUT_SECONDS
 
 _AUTH_HEADER_SPLIT_PARTS: int = 2
+# Docker token spec: tokens without expires_in are valid for 60 seconds.
+_DEFAULT_EXPIRES_IN_SECONDS: int = 60
+
+
+@dataclass(frozen=True)
+class BearerToken:
+    value: str
+    expires_at: float
 
 
 def parse_auth_header(value: str) -> tuple[str, dict[str, str]]:
@@ -20,22 +32,36 @@ def parse_auth_header(value: str) -> tuple[str, dict[str, str]]:
     return scheme, params
 
 
-def fetch_bearer_token(realm: str, service: str, scope: str) -> str | None:
+def fetch_bearer_token(realm: str, service: str, scope: str) -> BearerToken | None:
     if not realm:
         return None
     query = {"service": service, "scope": scope} if service else {"scope": scope}
     url = f"{realm}?{urllib.parse.urlencode(query)}"
-    request = urllib.request.Request(url, headers={"Accept": "application/json"})
-    try:
-        with urllib.request.urlopen(request, timeout=REGISTRY_REQUEST_TIMEOUT_SECONDS) as response:
-            payload = response.read().decode("utf-8")
-    except urllib.error.URLError:
+    response = http_request("GET", url, {"Accept": "application/json"}, timeout=REGISTRY_REQUEST_TIMEOUT_SECONDS)
+    if response is None or response.status != HTTPStatus.OK:
         return None
     try:
-        data = json.loads(payload)
-    except json.JSONDecodeError:
+        data = json.loads(response.body.decode("utf-8"))
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        return None
+    if not isinstance(data, dict):
         return None
     token = data.get("token") or data.get("access_token")
     if not isinstance(token, str) or not token:
         return None
-    return token
+    return BearerToken(value=token, expires_at=_resolve_expires_at(data))
+
+
+def _resolve_expires_at(data: dict[str, object]) -> float:
+    expires_in = data.get("expires_in")
+    if not isinstance(expires_in, int) or expires_in <= 0:
+        expires_in = _DEFAULT_EXPIRES_IN_SECONDS
+    issued_at = time.time()
+    raw_issued_at = data.get("issued_at")
+    if isinstance(raw_issued_at, str):
+        try:
+            issued_at = datetime.fromisoformat(raw_issued_at.replace("Z", "+00:00")).timestamp()
+        except ValueError:
+            pass
+    # Never trust an issue time ahead of the local clock.
+    return min(issued_at, time.time()) + expires_in
@@ -0,0 +1,68 @@
+import hashlib
+from dataclasses import dataclass
+from pathlib import Path
+
+import yaml
+
+from aicage import paths as paths_module
+from aicage._yaml_codec import dump_yaml, parse_yaml
+
+from ._parser import ParsedImageRef
+
+_IMAGE_KEY: str = "image"
+_DIGEST_KEY: str = "digest"
+_CHECKED_AT_KEY: str = "checked_at"
+
+
+@dataclass(frozen=True)
+class RemoteDigestRecord:
+    image: str
+    digest: str
+    checked_at: str
+
+
+class RemoteDigestStore:
+    def __init__(self) -> None:
+        self._base_dir = paths_module.REMOTE_DIGEST_STATE_DIR
+
+    def load(self, parsed: ParsedImageRef) -> RemoteDigestRecord | None:
+        path = self._path(parsed)
+        if not path.is_file():
+            return None
+        try:
+            payload = parse_yaml(path.read_text(encoding="utf-8")) or {}
+        except (OSError, yaml.YAMLError):
+            return None
+        if not isinstance(payload, dict):
+            return None
+        image = str(payload.get(_IMAGE_KEY, "") or "")
+        digest = str(payload.get(_DIGEST_KEY, "") or "")
+        if image != image_key(parsed) or not digest:
+            return None
+        return RemoteDigestRecord(
+            image=image,
+            digest=digest,
+            checked_at=str(payload.get(_CHECKED_AT_KEY, "") or ""),
+        )
+
+    def save(self, record: RemoteDigestRecord) -> Path:
+        self._base_dir.mkdir(parents=True, exist_ok=True)
+        path = self._base_dir / _filename(record.image)
+        payload = {
+            _IMAGE_KEY: record.image,
+            _DIGEST_KEY: record.digest,
+            _CHECKED_AT_KEY: record.checked_at,
+        }
+        path.write_text(dump_yaml(payload), encoding="utf-8")
+        return path
+
+    def _path(self, parsed: ParsedImageRef) -> Path:
+        return self._base_dir / _filename(image_key(parsed))
+
+
+def image_key(parsed: ParsedImageRef) -> str:
+    return f"{parsed.full_repository}:{parsed.reference}"
+
+
+def _filename(image: str) -> str:
+    return f"{hashlib.sha256(image.encode('utf-8')).hexdigest()}.yml"
@@ -1,19 +1,15 @@
-import urllib.error
-import urllib.request
 from collections.abc import Mapping
 
+from aicage._http_client import HttpResponse, http_request
+
 from ._timeouts import REGISTRY_REQUEST_TIMEOUT_SECONDS
 
 
 def head_request(url: str, headers: Mapping[str, str]) -> tuple[int | None, dict[str, str]]:
-    request = urllib.request.Request(url, headers=dict(headers), method="HEAD")
-    try:
-        with urllib.request.urlopen(request, timeout=REGISTRY_REQUEST_TIMEOUT_SECONDS) as response:
-            return response.status, dict(response.headers)
-    except urllib.error.HTTPError as exc:
-        return exc.code, dict(exc.headers)
-    except urllib.error.URLError:
+    response: HttpResponse | None = http_request("HEAD", url, headers, timeout=REGISTRY_REQUEST_TIMEOUT_SECONDS)
+    if response is None:
         return None, {}
+    return response.status, response.headers
 
 
 def get_header(headers: Mapping[str, str], key: str) -> str | None:
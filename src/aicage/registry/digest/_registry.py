@@ -1,7 +1,11 @@
 from collections.abc import Mapping
+from functools import lru_cache
+
+from aicage.registry._errors import RegistryError
 
 from ._auth import fetch_bearer_token, parse_auth_header
 from ._http import get_header, head_request
+from ._token_cache import AuthChallenge, BearerTokenCache
 
 _ACCEPT_HEADERS = ",".join(
     [
@@ -12,16 +16,47 @@ _ACCEPT_HEADERS = ",".join(
     ]
 )
 
+
+class RegistryUnreachableError(RegistryError):
+    """Raised when a manifest request gets no HTTP response, e.g. on network errors or timeouts."""
+
+
 def get_manifest_digest(registry: str, repository: str, reference: str) -> str | None:
+    """
+    Returns the manifest digest, or None when the registry answers without one (missing image, denied access).
+    Raises RegistryUnreachableError when the registry does not answer at all.
+    """
     url = f"https://{registry}/v2/{repository}/manifests/{reference}"
-    headers = {"Accept": _ACCEPT_HEADERS}
-    status, response_headers = head_request(url, headers)
+    scope = _pull_scope(repository)
+    cache = _token_cache()
+    challenge = cache.get_challenge(registry)
+    token = cache.get_token(challenge, scope) if challenge else None
+    status, response_headers = head_request(url, _request_headers(token))
+    if status is None:
+        raise RegistryUnreachableError(f"Registry {registry} is unreachable.")
     digest = _read_digest(response_headers)
     if digest:
         return digest
     if status not in {401, 403}:
         return None
+    if challenge and token:
+        cache.invalidate_token(challenge, scope)
+
+    token = _authenticate(registry, repository, response_headers)
+    if not token:
+        return None
+    status, response_headers = head_request(url, _request_headers(token))
+    if status is None:
+        raise RegistryUnreachableError(f"Registry {registry} is unreachable.")
+    return _read_digest(response_headers)
 
+
+@lru_cache(maxsize=1)
+def _token_cache() -> BearerTokenCache:
+    return BearerTokenCache()
+
+
+def _authenticate(registry: str, repository: str, response_headers: Mapping[str, str]) -> str | None:
     auth_header = get_header(response_headers, "www-authenticate")
     if not auth_header:
         return None
@@ -29,17 +64,24 @@ def get_manifest_digest(registry: str, repository: str, reference: str) -> str |
     scheme, params = parse_auth_header(auth_header)
     if scheme != "bearer":
         return None
-    token = fetch_bearer_token(
-        realm=params.get("realm", ""),
-        service=params.get("service", ""),
-        scope=params.get("scope") or f"repository:{repository}:pull",
-    )
-    if not token:
+    challenge = AuthChallenge(realm=params.get("realm", ""), service=params.get("service", ""))
+    scope = params.get("scope") or _pull_scope(repository)
+    token = fetch_bearer_token(realm=challenge.realm, service=challenge.service, scope=scope)
+    if token is None:
         return None
+    _token_cache().put_token(registry, challenge, scope, token)
+    return token.value
 
-    auth_headers = {"Accept": _ACCEPT_HEADERS, "Authorization": f"Bearer {token}"}
-    _, response_headers = head_request(url, auth_headers)
-    return _read_digest(response_headers)
+
+def _pull_scope(repository: str) -> str:
+    return f"repository:{repository}:pull"
+
+
+def _request_headers(token: str | None) -> dict[str, str]:
+    headers = {"Accept": _ACCEPT_HEADERS}
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    return headers
 
 
 def _read_digest(headers: Mapping[str, str]) -> str | None:
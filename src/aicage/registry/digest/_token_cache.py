@@ -0,0 +1,150 @@
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from aicage import paths as paths_module
+from aicage._yaml_codec import dump_yaml, parse_yaml
+
+from ._auth import BearerToken
+
+_CHALLENGES_KEY: str = "challenges"
+_TOKENS_KEY: str = "tokens"
+_REALM_KEY: str = "realm"
+_SERVICE_KEY: str = "service"
+_SCOPE_KEY: str = "scope"
+_TOKEN_KEY: str = "token"
+_EXPIRES_AT_KEY: str = "expires_at"
+# Tokens this close to expiry are refetched so they cannot expire in flight.
+_EXPIRY_MARGIN_SECONDS: float = 10.0
+_FILE_MODE: int = 0o600
+
+
+@dataclass(frozen=True)
+class AuthChallenge:
+    realm: str
+    service: str
+
+
+@dataclass(frozen=True)
+class _TokenKey:
+    realm: str
+    service: str
+    scope: str
+
+
+class BearerTokenCache:
+    """
+    In-memory and on-disk cache of registry bearer tokens and of the auth challenge each registry answered with.
+    The disk copy lets the next launch send its first manifest HEAD already authorized.
+    """
+
+    def __init__(self) -> None:
+        self._path = paths_module.REGISTRY_TOKEN_STATE_PATH
+        self._loaded = False
+        self._challenges: dict[str, AuthChallenge] = {}
+        self._tokens: dict[_TokenKey, BearerToken] = {}
+
+    def get_challenge(self, registry: str) -> AuthChallenge | None:
+        self._ensure_loaded()
+        return self._challenges.get(registry)
+
+    def get_token(self, challenge: AuthChallenge, scope: str) -> str | None:
+        self._ensure_loaded()
+        token = self._tokens.get(_TokenKey(challenge.realm, challenge.service, scope))
+        if token is None or not _is_valid(token):
+            return None
+        return token.value
+
+    def put_token(self, registry: str, challenge: AuthChallenge, scope: str, token: BearerToken) -> None:
+        self._ensure_loaded()
+        self._challenges[registry] = challenge
+        self._tokens[_TokenKey(challenge.realm, challenge.service, scope)] = token
+        self._save()
+
+    def invalidate_token(self, challenge: AuthChallenge, scope: str) -> None:
+        self._ensure_loaded()
+        if self._tokens.pop(_TokenKey(challenge.realm, challenge.service, scope), None) is not None:
+            self._save()
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        payload = _read_payload(self._path)
+        challenges = payload.get(_CHALLENGES_KEY)
+        if isinstance(challenges, dict):
+            for registry, entry in challenges.items():
+                if isinstance(entry, dict):
+                    self._challenges[str(registry)] = AuthChallenge(
+                        realm=str(entry.get(_REALM_KEY, "")),
+                        service=str(entry.get(_SERVICE_KEY, "")),
+                    )
+        tokens = payload.get(_TOKENS_KEY)
+        if isinstance(tokens, list):
+            for entry in tokens:
+                _load_token_entry(entry, self._tokens)
+
+    def _save(self) -> None:
+        payload = {
+            _CHALLENGES_KEY: {
+                registry: {_REALM_KEY: challenge.realm, _SERVICE_KEY: challenge.service}
+                for registry, challenge in self._challenges.items()
+            },
+            _TOKENS_KEY: [
+                {
+                    _REALM_KEY: key.realm,
+                    _SERVICE_KEY: key.service,
+                    _SCOPE_KEY: key.scope,
+                    _TOKEN_KEY: token.value,
+                    _EXPIRES_AT_KEY: token.expires_at,
+                }
+                for key, token in self._tokens.items()
+                if _is_valid(token)
+            ],
+        }
+        try:
+            _write_private(self._path, dump_yaml(payload))
+        except OSError:
+            return
+
+
+def _is_valid(token: BearerToken) -> bool:
+    return token.expires_at - _EXPIRY_MARGIN_SECONDS > time.time()
+
+
+def _read_payload(path: Path) -> dict[str, Any]:
+    if not path.is_file():
+        return {}
+    try:
+        payload = parse_yaml(path.read_text(encoding="utf-8")) or {}
+    except (OSError, yaml.YAMLError):
+        return {}
+    return payload if isinstance(payload, dict) else {}
+
+
+def _load_token_entry(entry: object, tokens: dict[_TokenKey, BearerToken]) -> None:
+    if not isinstance(entry, dict):
+        return
+    value = entry.get(_TOKEN_KEY)
+    expires_at = entry.get(_EXPIRES_AT_KEY)
+    if not isinstance(value, str) or not isinstance(expires_at, (int, float)):
+        return
+    key = _TokenKey(
+        realm=str(entry.get(_REALM_KEY, "")),
+        service=str(entry.get(_SERVICE_KEY, "")),
+        scope=str(entry.get(_SCOPE_KEY, "")),
+    )
+    tokens[key] = BearerToken(value=value, expires_at=float(expires_at))
+
+
+def _write_private(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, _FILE_MODE)
+    with os.fdopen(fd, "w", encoding="utf-8") as handle:
+        handle.write(content)
+    if os.name != "nt":
+        path.chmod(_FILE_MODE)
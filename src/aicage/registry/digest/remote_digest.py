@@ -1,13 +1,77 @@
+import os
+from datetime import datetime, timezone
+
+from aicage._logging import get_logger
+from aicage._tracing import traced
+
+from ._digest_store import RemoteDigestRecord, RemoteDigestStore, image_key
 from ._docker_io import get_docker_io_digest
 from ._ghcr import get_ghcr_digest
-from ._parser import parse_image_ref
+from ._parser import ParsedImageRef, parse_image_ref
+from ._registry import RegistryUnreachableError
+
+_MAX_AGE_ENV: str = "AICAGE_DIGEST_MAX_AGE"
+_DEFAULT_MAX_AGE_SECONDS: int = 10 * 60
 
 
+@traced("get_remote_digest")
 def get_remote_digest(image_ref: str) -> str | None:
+    """
+    Returns the registry digest for an image ref, served from the local cache while it is fresh.
+    A stale cached digest is still returned when the registry cannot be reached, but not when it answers without a
+    digest (missing image, denied access).
+    """
     parsed = parse_image_ref(image_ref)
     if parsed.is_digest:
         return parsed.reference
+    store = RemoteDigestStore()
+    cached = store.load(parsed)
+    if cached is not None and _is_fresh(cached.checked_at, _resolve_max_age()):
+        return cached.digest
+
+    try:
+        digest = _lookup_remote_digest(parsed)
+    except RegistryUnreachableError:
+        if cached is None:
+            return None
+        get_logger().warning("Registry lookup failed for %s; using cached digest %s", image_ref, cached.digest)
+        return cached.digest
+    if not digest:
+        return None
+    try:
+        store.save(RemoteDigestRecord(image=image_key(parsed), digest=digest, checked_at=_now_iso()))
+    except OSError as exc:
+        get_logger().warning("Failed to cache remote digest for %s: %s", image_ref, exc)
+    return digest
+
+
+def _lookup_remote_digest(parsed: ParsedImageRef) -> str | None:
     digest = get_ghcr_digest(parsed)
     if digest:
         return digest
     return get_docker_io_digest(parsed)
+
+
+def _resolve_max_age() -> int:
+    raw_value = os.getenv(_MAX_AGE_ENV)
+    if raw_value is None:
+        return _DEFAULT_MAX_AGE_SECONDS
+    try:
+        return int(raw_value.strip())
+    except ValueError:
+        return _DEFAULT_MAX_AGE_SECONDS
+
+
+def _is_fresh(checked_at: str, max_age: int) -> bool:
+    if max_age <= 0:
+        return False
+    try:
+        checked = datetime.fromisoformat(checked_at)
+    except ValueError:
+        return False
+    age = (datetime.now(timezone.utc) - checked).total_seconds()
+    return 0 <= age <= max_age
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
@@ -1,3 +1,4 @@
+from aicage._tracing import traced
 from aicage.config.runtime_config import RunConfig
 from aicage.paths import CUSTOM_BASES_DIR
 from aicage.registry._image_pull import pull_image
@@ -5,6 +6,7 @@ from aicage.registry.extension_build.ensure_extended_image import ensure_extende
 from aicage.registry.local_build.ensure_local_image import ensure_local_image
 
 
+@traced("ensure_image")
 def ensure_image(run_config: RunConfig) -> None:
     agent_metadata = run_config.context.agents[run_config.agent]
     base_metadata = run_config.context.bases[run_config.selection.base]
@@ -1,10 +1,9 @@
 from dataclasses import dataclass
 from pathlib import Path
 
-import yaml
-
 from aicage import paths as paths_module
 from aicage._lists import read_str_list_or_empty
+from aicage._yaml_codec import dump_yaml, parse_yaml
 from aicage.registry._sanitize import sanitize
 
 _AGENT_KEY: str = "agent"
@@ -35,7 +34,7 @@ class ExtendedBuildStore:
         path = self._path(image_ref)
         if not path.is_file():
             return None
-        payload = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+        payload = parse_yaml(path.read_text(encoding="utf-8")) or {}
         if not isinstance(payload, dict):
             return None
         return ExtendedBuildRecord(
@@ -60,7 +59,7 @@ class ExtendedBuildStore:
             _BASE_IMAGE_KEY: record.base_image,
             _BUILT_AT_KEY: record.built_at,
         }
-        path.write_text(yaml.safe_dump(payload, sort_keys=True), encoding="utf-8")
+        path.write_text(dump_yaml(payload), encoding="utf-8")
         return path
 
     def _path(self, image_ref: str) -> Path:
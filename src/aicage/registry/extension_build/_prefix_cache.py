@@ -0,0 +1,190 @@
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from aicage import paths as paths_module
+from aicage._logging import get_logger
+from aicage.config.extensions.loader import ExtensionMetadata
+from aicage.config.file_locking import lock_config_file
+from aicage.constants import DEFAULT_EXTENDED_IMAGE_NAME
+from aicage.docker.query import get_local_image_id, get_local_image_size, local_image_exists, remove_image
+
+_BUDGET_ENV: str = "AICAGE_PREFIX_CACHE_MB"
+_DEFAULT_BUDGET_MB: int = 10 * 1024
+_BYTES_PER_MB: int = 1024 * 1024
+_CACHE_VERSION: int = 1
+_VERSION_KEY: str = "version"
+_ENTRIES_KEY: str = "entries"
+_IMAGE_REF_KEY: str = "image_ref"
+_SIZE_KEY: str = "size"
+_LAST_USED_KEY: str = "last_used"
+
+
+@dataclass(frozen=True)
+class _PrefixCacheEntry:
+    image_ref: str
+    size: int
+    last_used: float
+
+
+@dataclass(frozen=True)
+class PrefixBuildPlan:
+    """
+    Where an extended build starts and which prefix images it keeps.
+    start_image_ref already contains the first cached_length extensions; new_refs are the images to keep after each
+    further extension but the last, keyed by new_keys.
+    """
+
+    base_image_ref: str
+    start_image_ref: str
+    cached_length: int
+    new_keys: list[str] = field(default_factory=list)
+    new_refs: list[str] = field(default_factory=list)
+
+
+class ExtensionPrefixCache:
+    """
+    Images of extension prefixes kept for reuse by extended images that start with the same extensions.
+    Entries are keyed by base image ID and the ordered extension ids and content hashes, and the least recently used
+    are removed once their added layers exceed the disk budget.
+    """
+
+    def __init__(self) -> None:
+        self._path = paths_module.EXTENSION_PREFIX_CACHE_STATE_PATH
+
+    def plan(self, base_image_ref: str, extensions: list[ExtensionMetadata], hashes: list[str]) -> PrefixBuildPlan:
+        uncached = PrefixBuildPlan(base_image_ref=base_image_ref, start_image_ref=base_image_ref, cached_length=0)
+        if _resolve_budget() <= 0 or len(extensions) <= 1:
+            return uncached
+        base_image_id = get_local_image_id(base_image_ref)
+        if base_image_id is None:
+            return uncached
+
+        keys = _prefix_keys(base_image_id, extensions, hashes)
+        with lock_config_file(self._path):
+            entries = self._load()
+            for length in range(len(keys), 0, -1):
+                entry = entries.get(keys[length - 1])
+                if entry is None or not local_image_exists(entry.image_ref):
+                    continue
+                entries[keys[length - 1]] = _PrefixCacheEntry(entry.image_ref, entry.size, time.time())
+                self._save(entries)
+                get_logger().info("Reusing cached extension prefix %s for %d extensions", entry.image_ref, length)
+                return PrefixBuildPlan(
+                    base_image_ref=base_image_ref,
+                    start_image_ref=entry.image_ref,
+                    cached_length=length,
+                    new_keys=keys[length:],
+                    new_refs=[_prefix_image_ref(key) for key in keys[length:]],
+                )
+        return PrefixBuildPlan(
+            base_image_ref=base_image_ref,
+            start_image_ref=base_image_ref,
+            cached_length=0,
+            new_keys=keys,
+            new_refs=[_prefix_image_ref(key) for key in keys],
+        )
+
+    def commit(self, plan: PrefixBuildPlan) -> None:
+        """
+        Records the prefix images kept by a finished build, then evicts down to the disk budget.
+        The state file stays locked from load to save so concurrent builds do not drop each other's entries.
+        """
+        if not plan.new_keys:
+            return
+        base_size = get_local_image_size(plan.base_image_ref) or 0
+        now = time.time()
+        new_entries: dict[str, _PrefixCacheEntry] = {}
+        for key, image_ref in zip(plan.new_keys, plan.new_refs, strict=True):
+            size = get_local_image_size(image_ref)
+            if size is not None:
+                new_entries[key] = _PrefixCacheEntry(image_ref, max(size - base_size, 0), now)
+        with lock_config_file(self._path):
+            entries = self._load()
+            entries.update(new_entries)
+            self._evict(entries, _resolve_budget() * _BYTES_PER_MB)
+            self._save(entries)
+
+    def _evict(self, entries: dict[str, _PrefixCacheEntry], budget: int) -> None:
+        total = sum(entry.size for entry in entries.values())
+        for key, entry in sorted(entries.items(), key=lambda item: item[1].last_used):
+            if total <= budget:
+                return
+            if remove_image(entry.image_ref) or not local_image_exists(entry.image_ref):
+                del entries[key]
+                total -= entry.size
+
+    def _load(self) -> dict[str, _PrefixCacheEntry]:
+        try:
+            payload = json.loads(self._path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(payload, dict) or payload.get(_VERSION_KEY) != _CACHE_VERSION:
+            return {}
+        items = payload.get(_ENTRIES_KEY)
+        if not isinstance(items, dict):
+            return {}
+        try:
+            return {key: _read_entry(item) for key, item in items.items()}
+        except (KeyError, TypeError, ValueError):
+            return {}
+
+    def _save(self, entries: dict[str, _PrefixCacheEntry]) -> None:
+        payload = {
+            _VERSION_KEY: _CACHE_VERSION,
+            _ENTRIES_KEY: {key: _entry_to_mapping(entry) for key, entry in sorted(entries.items())},
+        }
+        tmp_path = self._path.with_name(f"{self._path.name}.{os.getpid()}.tmp")
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(payload, indent=1), encoding="utf-8")
+            os.replace(tmp_path, self._path)
+        except OSError:
+            return
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+
+def _prefix_keys(base_image_id: str, extensions: list[ExtensionMetadata], hashes: list[str]) -> list[str]:
+    """
+    Returns one key per proper prefix of the extensions, shortest first.
+    """
+    digest = hashlib.sha256(f"{base_image_id}\n".encode())
+    keys: list[str] = []
+    for extension, content_hash in zip(extensions[:-1], hashes[:-1], strict=True):
+        digest.update(f"{extension.extension_id}\0{content_hash}\n".encode())
+        keys.append(digest.copy().hexdigest())
+    return keys
+
+
+def _prefix_image_ref(key: str) -> str:
+    return f"{DEFAULT_EXTENDED_IMAGE_NAME}:prefix-{key[:32]}"
+
+
+def _resolve_budget() -> int:
+    raw_value = os.getenv(_BUDGET_ENV)
+    if raw_value is None:
+        return _DEFAULT_BUDGET_MB
+    try:
+        return int(raw_value.strip())
+    except ValueError:
+        return _DEFAULT_BUDGET_MB
+
+
+def _entry_to_mapping(entry: _PrefixCacheEntry) -> dict[str, Any]:
+    return {
+        _IMAGE_REF_KEY: entry.image_ref,
+        _SIZE_KEY: entry.size,
+        _LAST_USED_KEY: entry.last_used,
+    }
+
+
+def _read_entry(item: dict[str, Any]) -> _PrefixCacheEntry:
+    return _PrefixCacheEntry(
+        image_ref=str(item[_IMAGE_REF_KEY]),
+        size=int(item[_SIZE_KEY]),
+        last_used=float(item[_LAST_USED_KEY]),
+    )
@@ -1,4 +1,5 @@
 import hashlib
+from collections.abc import Mapping
 
 from aicage.config.extensions.loader import ExtensionMetadata, extension_hash
 from aicage.config.runtime_config import RunConfig
@@ -9,6 +10,7 @@ from aicage.registry._time import now_iso
 from ._extended_plan import should_build_extended
 from ._extended_store import ExtendedBuildRecord, ExtendedBuildStore
 from ._logs import build_log_path_for_image
+from ._prefix_cache import ExtensionPrefixCache, PrefixBuildPlan
 
 
 def ensure_extended_image(run_config: RunConfig) -> None:
@@ -16,7 +18,8 @@ def ensure_extended_image(run_config: RunConfig) -> None:
         raise RegistryError("No extensions selected for extended image build.")
 
     resolved = _resolve_extensions(run_config.selection.extensions, run_config.context.extensions)
-    combined_hash = _combined_extension_hash(resolved)
+    hashes = [extension_hash(extension) for extension in resolved]
+    combined_hash = _combined_extension_hash(resolved, hashes)
     store = ExtendedBuildStore()
     record = store.load(run_config.selection.image_ref)
     needs_build = should_build_extended(
@@ -28,13 +31,17 @@ def ensure_extended_image(run_config: RunConfig) -> None:
     if not needs_build:
         return
 
+    prefix_cache = ExtensionPrefixCache()
+    prefix_plan: PrefixBuildPlan = prefix_cache.plan(run_config.selection.base_image_ref, resolved, hashes)
     log_path = build_log_path_for_image(run_config.selection.image_ref)
     run_extended_build(
         run_config=run_config,
-        base_image_ref=run_config.selection.base_image_ref,
-        extensions=resolved,
+        base_image_ref=prefix_plan.start_image_ref,
+        extensions=resolved[prefix_plan.cached_length :],
         log_path=log_path,
+        prefix_refs=prefix_plan.new_refs,
     )
+    prefix_cache.commit(prefix_plan)
     store.save(
         ExtendedBuildRecord(
             agent=run_config.agent,
@@ -50,7 +57,7 @@ def ensure_extended_image(run_config: RunConfig) -> None:
 
 def _resolve_extensions(
     extension_ids: list[str],
-    extensions: dict[str, ExtensionMetadata],
+    extensions: Mapping[str, ExtensionMetadata],
 ) -> list[ExtensionMetadata]:
     missing = [ext for ext in extension_ids if ext not in extensions]
     if missing:
@@ -58,9 +65,9 @@ def _resolve_extensions(
     return [extensions[ext] for ext in extension_ids]
 
 
-def _combined_extension_hash(extensions: list[ExtensionMetadata]) -> str:
+def _combined_extension_hash(extensions: list[ExtensionMetadata], hashes: list[str]) -> str:
     digest = hashlib.sha256()
-    for extension in extensions:
+    for extension, content_hash in zip(extensions, hashes, strict=True):
         digest.update(extension.extension_id.encode("utf-8"))
-        digest.update(extension_hash(extension).encode("utf-8"))
+        digest.update(content_hash.encode("utf-8"))
     return digest.hexdigest()
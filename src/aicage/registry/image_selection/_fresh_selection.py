@@ -1,3 +1,5 @@
+from collections.abc import Mapping
+
 from aicage.config.context import ConfigContext
 from aicage.config.extensions.loader import ExtensionMetadata
 from aicage.config.project_config import AgentConfig
@@ -19,7 +21,7 @@ from .models import ImageSelection
 def fresh_selection(
     agent: str,
     context: ConfigContext,
-    extensions: dict[str, ExtensionMetadata],
+    extensions: Mapping[str, ExtensionMetadata],
 ) -> ImageSelection:
     agent_metadata = require_agent_metadata(agent, context)
     bases = available_bases(agent, context)
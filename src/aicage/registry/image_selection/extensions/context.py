@@ -1,3 +1,4 @@
+from collections.abc import Mapping
 from dataclasses import dataclass
 
 from aicage.config.agent.models import AgentMetadata
@@ -12,5 +13,5 @@ class ExtensionSelectionContext:
     base: str
     agent_cfg: AgentConfig
     agent_metadata: AgentMetadata
-    extensions: dict[str, ExtensionMetadata]
+    extensions: Mapping[str, ExtensionMetadata]
     context: ConfigContext
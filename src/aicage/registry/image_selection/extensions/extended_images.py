@@ -16,11 +16,9 @@ def load_extended_image_options(
     context: ConfigContext,
 ) -> list[ExtendedImageOption]:
     extensions = context.extensions
-    configs = load_extended_images(set(extensions))
+    configs = load_extended_images(agent, set(extensions))
     options: list[ExtendedImageOption] = []
     for config in configs.values():
-        if config.agent != agent:
-            continue
         options.append(
             ExtendedImageOption(
                 name=config.name,
@@ -38,27 +38,21 @@ def _find_projects_using_image(
     context: ConfigContext,
     image_ref: str,
 ) -> list[tuple[str, Path]]:
-    if not image_ref:
-        return []
-    store = context.store
-    matches: list[tuple[str, Path]] = []
-    for path in sorted(store.projects_dir.glob("*.yml")):
-        data = _load_yaml(path)
-        if not isinstance(data, dict):
-            continue
-        project_path = str(data.get("path", ""))
-        agents = data.get("agents", {}) or {}
-        if not isinstance(agents, dict):
-            continue
-        for cfg in agents.values():
-            if isinstance(cfg, dict) and cfg.get("image_ref") == image_ref:
-                matches.append((project_path, path))
-                break
-    return matches
+    # The index only narrows the candidates; a config edited by hand may no longer use the image.
+    return [
+        (project_path, config_path)
+        for project_path, config_path in context.store.find_projects_using_image(image_ref)
+        if _uses_image(config_path, image_ref)
+    ]
 
 
-def _load_yaml(path: Path) -> dict[str, object]:
+def _uses_image(config_path: Path, image_ref: str) -> bool:
     try:
-        return load_yaml(path)
+        data = load_yaml(config_path)
     except ConfigError:
-        return {}
+        return False
+    agents = data.get("agents", {}) or {}
+    if not isinstance(agents, dict):
+        return False
+    return any(isinstance(cfg, dict) and cfg.get("image_ref") == image_ref for cfg in agents.values())
+
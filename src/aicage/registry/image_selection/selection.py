@@ -1,3 +1,4 @@
+from aicage._tracing import traced
 from aicage.config.context import ConfigContext
 from aicage.config.project_config import AgentConfig
 
@@ -10,6 +11,7 @@ from .extensions.refs import base_image_ref
 from .models import ImageSelection
 
 
+@traced("select_agent_image")
 def select_agent_image(agent: str, context: ConfigContext) -> ImageSelection:
     extensions = context.extensions
     agent_cfg = context.project_cfg.agents.setdefault(agent, AgentConfig())
@@ -1,9 +1,9 @@
 from aicage._logging import get_logger
-from aicage.docker.pull import run_pull
 from aicage.docker.query import cleanup_old_digest, get_local_repo_digest_for_repo
-from aicage.registry._errors import RegistryError
+from aicage.registry._errors import ImageSignatureError, RegistryError
 from aicage.registry._logs import pull_log_path
-from aicage.registry._signature import resolve_verified_digest
+from aicage.registry._signature import resolve_digest_ref, verify_image_signature
+from aicage.registry._verified_pull import pull_verified_image
 
 
 def refresh_base_digest(
@@ -12,14 +12,17 @@ def refresh_base_digest(
 ) -> str:
     logger = get_logger()
     local_digest = get_local_repo_digest_for_repo(base_image_ref, base_repository)
-    digest_ref = resolve_verified_digest(base_image_ref)
+    digest_ref = resolve_digest_ref(base_image_ref)
     remote_digest = digest_ref.split("@", 1)[1]
     if remote_digest == local_digest:
+        verify_image_signature(digest_ref)
         return digest_ref
 
     log_path = pull_log_path(base_image_ref)
     try:
-        run_pull(base_image_ref, log_path)
+        pull_verified_image(base_image_ref, log_path, digest_ref)
+    except ImageSignatureError:
+        raise
     except RegistryError:
         if local_digest:
             logger.warning(
@@ -1,9 +1,8 @@
 from dataclasses import dataclass
 from pathlib import Path
 
-import yaml
-
 from aicage import paths as paths_module
+from aicage._yaml_codec import dump_yaml, parse_yaml
 from aicage.registry._sanitize import sanitize
 
 _AGENT_KEY: str = "agent"
@@ -32,7 +31,7 @@ class BuildStore:
         path = self._path(agent, base)
         if not path.is_file():
             return None
-        payload = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+        payload = parse_yaml(path.read_text(encoding="utf-8")) or {}
         if not isinstance(payload, dict):
             return None
         return BuildRecord(
@@ -55,7 +54,7 @@ class BuildStore:
             _IMAGE_REF_KEY: record.image_ref,
             _BUILT_AT_KEY: record.built_at,
         }
-        path.write_text(yaml.safe_dump(payload, sort_keys=True), encoding="utf-8")
+        path.write_text(dump_yaml(payload), encoding="utf-8")
         return path
 
     def _path(self, agent: str, base: str) -> Path:
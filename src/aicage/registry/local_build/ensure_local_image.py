@@ -53,6 +53,7 @@ def ensure_local_image(run_config: RunConfig) -> None:
         run_config=run_config,
         base_image_ref=base_image,
         image_ref=image_ref,
+        agent_version=agent_version,
         log_path=log_path,
     )
 
@@ -0,0 +1,122 @@
+import hashlib
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+from typing import Any
+
+import yaml
+
+from aicage import paths as paths_module
+from aicage._yaml_codec import dump_yaml, parse_yaml
+from aicage.runtime.run_args import EnvVar, MountSpec
+
+_PROJECT_PATH_KEY: str = "project_path"
+_AGENT_KEY: str = "agent"
+_FINGERPRINT_KEY: str = "fingerprint"
+_IMAGE_REF_KEY: str = "image_ref"
+_PROJECT_DOCKER_ARGS_KEY: str = "project_docker_args"
+_AGENT_CONFIG_MOUNTS_KEY: str = "agent_config_mounts"
+_MOUNTS_KEY: str = "mounts"
+_ENV_KEY: str = "env"
+_RESOLVED_AT_KEY: str = "resolved_at"
+_GIT_ROOT_KEY: str = "git_root"
+
+_HOST_PATH_KEY: str = "host_path"
+_CONTAINER_PATH_KEY: str = "container_path"
+_READ_ONLY_KEY: str = "read_only"
+_ENV_NAME_KEY: str = "name"
+_ENV_VALUE_KEY: str = "value"
+
+
+@dataclass(frozen=True)
+class RunPlanRecord:
+    project_path: str
+    agent: str
+    fingerprint: str
+    image_ref: str
+    project_docker_args: str
+    agent_config_mounts: list[MountSpec]
+    mounts: list[MountSpec]
+    env: list[EnvVar]
+    resolved_at: str
+    git_root: str = ""
+
+
+class RunPlanStore:
+    def __init__(self) -> None:
+        self._base_dir = paths_module.RUN_PLAN_STATE_DIR
+
+    def load(self, project_path: Path, agent: str) -> RunPlanRecord | None:
+        path = self._path(project_path, agent)
+        if not path.is_file():
+            return None
+        try:
+            payload = parse_yaml(path.read_text(encoding="utf-8")) or {}
+        except (OSError, yaml.YAMLError):
+            return None
+        if not isinstance(payload, dict):
+            return None
+        try:
+            return RunPlanRecord(
+                project_path=str(payload.get(_PROJECT_PATH_KEY, "")),
+                agent=str(payload.get(_AGENT_KEY, "")),
+                fingerprint=str(payload.get(_FINGERPRINT_KEY, "")),
+                image_ref=str(payload.get(_IMAGE_REF_KEY, "")),
+                project_docker_args=str(payload.get(_PROJECT_DOCKER_ARGS_KEY, "")),
+                agent_config_mounts=_read_mounts(payload.get(_AGENT_CONFIG_MOUNTS_KEY)),
+                mounts=_read_mounts(payload.get(_MOUNTS_KEY)),
+                env=_read_env(payload.get(_ENV_KEY)),
+                resolved_at=str(payload.get(_RESOLVED_AT_KEY, "")),
+                git_root=str(payload.get(_GIT_ROOT_KEY, "")),
+            )
+        except (KeyError, TypeError):
+            return None
+
+    def save(self, record: RunPlanRecord) -> Path:
+        self._base_dir.mkdir(parents=True, exist_ok=True)
+        path = self._path(Path(record.project_path), record.agent)
+        payload = {
+            _PROJECT_PATH_KEY: record.project_path,
+            _AGENT_KEY: record.agent,
+            _FINGERPRINT_KEY: record.fingerprint,
+            _IMAGE_REF_KEY: record.image_ref,
+            _PROJECT_DOCKER_ARGS_KEY: record.project_docker_args,
+            _AGENT_CONFIG_MOUNTS_KEY: [_mount_to_mapping(mount) for mount in record.agent_config_mounts],
+            _MOUNTS_KEY: [_mount_to_mapping(mount) for mount in record.mounts],
+            _ENV_KEY: [{_ENV_NAME_KEY: env.name, _ENV_VALUE_KEY: env.value} for env in record.env],
+            _RESOLVED_AT_KEY: record.resolved_at,
+            _GIT_ROOT_KEY: record.git_root,
+        }
+        path.write_text(dump_yaml(payload), encoding="utf-8")
+        return path
+
+    def _path(self, project_path: Path, agent: str) -> Path:
+        key = f"{project_path}\n{agent}"
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self._base_dir / f"{digest}.yml"
+
+
+def _mount_to_mapping(mount: MountSpec) -> dict[str, Any]:
+    return {
+        _HOST_PATH_KEY: str(mount.host_path),
+        _CONTAINER_PATH_KEY: mount.container_path.as_posix(),
+        _READ_ONLY_KEY: mount.read_only,
+    }
+
+
+def _read_mounts(value: Any) -> list[MountSpec]:
+    if not isinstance(value, list):
+        return []
+    return [
+        MountSpec(
+            host_path=Path(item[_HOST_PATH_KEY]),
+            container_path=PurePosixPath(item[_CONTAINER_PATH_KEY]),
+            read_only=bool(item.get(_READ_ONLY_KEY, False)),
+        )
+        for item in value
+    ]
+
+
+def _read_env(value: Any) -> list[EnvVar]:
+    if not isinstance(value, list):
+        return []
+    return [EnvVar(name=str(item[_ENV_NAME_KEY]), value=str(item[_ENV_VALUE_KEY])) for item in value]
@@ -1,8 +1,11 @@
 import subprocess
 from pathlib import Path
 
+from aicage._tracing import SUBPROCESS_COUNTER, count_event
+
 
 def capture_stdout(command: list[str], cwd: Path | None = None) -> str | None:
+    count_event(SUBPROCESS_COUNTER)
     try:
         result = subprocess.run(
             command, check=True, capture_output=True, text=True, cwd=str(cwd) if cwd else None
@@ -1,5 +1,6 @@
 from pathlib import Path
 
+from aicage._tracing import traced
 from aicage.cli_types import ParsedArgs
 from aicage.config.context import ConfigContext
 from aicage.config.project_config import AgentConfig
@@ -8,11 +9,12 @@ from aicage.runtime.run_args import EnvVar, MountSpec
 from ._docker_socket import resolve_docker_socket_mount
 from ._git_config import resolve_git_config_mount
 from ._git_root import resolve_git_root_mount
-from ._git_support import resolve_git_support_prefs
+from ._git_support import resolve_git_root, resolve_git_support_prefs
 from ._gpg import resolve_gpg_mount
 from ._ssh_keys import resolve_ssh_mount
 
 
+@traced("resolve_docker_args")
 def resolve_docker_args(
     context: ConfigContext,
     agent: str,
@@ -40,3 +42,10 @@ def resolve_docker_args(
     env: list[EnvVar] = []
     env.extend(docker_env)
     return mounts, env
+
+
+def resolve_project_git_root(project_path: Path) -> Path | None:
+    """
+    Returns the Git root used for the git-root mount, or None outside a repository.
+    """
+    return resolve_git_root(project_path)
@@ -0,0 +1,165 @@
+import hashlib
+import os
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from pathlib import Path
+
+from aicage import __version__
+from aicage._logging import get_logger
+from aicage._tracing import traced
+from aicage.cli_types import ParsedArgs
+from aicage.config.config_store import SettingsStore
+from aicage.config.runtime_config import RunConfig
+from aicage.docker.query import get_local_image_id
+from aicage.paths import (
+    CUSTOM_AGENTS_DIR,
+    CUSTOM_BASES_DIR,
+    CUSTOM_EXTENSIONS_DIR,
+    HOST_GIT_CONFIG_FILES,
+)
+from aicage.runtime._run_plan_store import RunPlanRecord, RunPlanStore
+from aicage.runtime.docker_args.resolver import resolve_project_git_root
+from aicage.runtime.run_args import DockerRunArgs, merge_docker_args
+
+_MAX_AGE_ENV: str = "AICAGE_RUN_PLAN_MAX_AGE"
+_DEFAULT_MAX_AGE_SECONDS: int = 60 * 60
+
+
+@traced("load_cached_run_args")
+def load_cached_run_args(agent: str, parsed: ParsedArgs) -> DockerRunArgs | None:
+    """
+    Returns run args from the persisted run plan when all of its inputs are unchanged.
+    Returns None when the plan is missing, too old or stale; the caller then resolves from scratch.
+    """
+    if not _is_cacheable(parsed):
+        return None
+    max_age = _resolve_max_age()
+    if max_age <= 0:
+        return None
+    project_path = Path.cwd().resolve()
+    record = _load_valid_record(project_path, agent, max_age)
+    if record is None:
+        return None
+
+    get_logger().info("Using cached run plan for agent %s in %s", agent, project_path)
+    SettingsStore().record_use(project_path)
+    return DockerRunArgs(
+        image_ref=record.image_ref,
+        project_path=project_path,
+        agent_config_mounts=record.agent_config_mounts,
+        merged_docker_args=merge_docker_args(record.project_docker_args, parsed.docker_args),
+        agent_args=parsed.agent_args,
+        env=record.env,
+        mounts=record.mounts,
+    )
+
+
+def save_run_plan(run_config: RunConfig, run_args: DockerRunArgs, parsed: ParsedArgs) -> None:
+    if not _is_cacheable(parsed) or _resolve_max_age() <= 0:
+        return
+    git_root = resolve_project_git_root(run_config.project_path)
+    fingerprint = _fingerprint(run_config.project_path, run_config.agent, run_args.image_ref, git_root)
+    if fingerprint is None:
+        return
+    RunPlanStore().save(
+        RunPlanRecord(
+            project_path=str(run_config.project_path),
+            agent=run_config.agent,
+            fingerprint=fingerprint,
+            image_ref=run_args.image_ref,
+            project_docker_args=run_config.project_docker_args,
+            agent_config_mounts=run_args.agent_config_mounts,
+            mounts=run_args.mounts,
+            env=run_args.env,
+            resolved_at=datetime.now(timezone.utc).isoformat(),
+            git_root=str(git_root) if git_root else "",
+        )
+    )
+
+
+def _load_valid_record(project_path: Path, agent: str, max_age: int) -> RunPlanRecord | None:
+    record = RunPlanStore().load(project_path, agent)
+    if record is None or not _is_fresh(record.resolved_at, max_age):
+        return None
+    if not all(mount.host_path.exists() for mount in [*record.agent_config_mounts, *record.mounts]):
+        return None
+    git_root = Path(record.git_root) if record.git_root else None
+    fingerprint = _fingerprint(project_path, agent, record.image_ref, git_root)
+    if fingerprint is None or fingerprint != record.fingerprint:
+        return None
+    return record
+
+
+def _is_cacheable(parsed: ParsedArgs) -> bool:
+    # CLI docker args and --docker can trigger persist prompts, so they always take the full path.
+    return not parsed.docker_args and not parsed.docker_socket
+
+
+def _resolve_max_age() -> int:
+    raw_value = os.getenv(_MAX_AGE_ENV)
+    if raw_value is None:
+        return _DEFAULT_MAX_AGE_SECONDS
+    try:
+        return int(raw_value.strip())
+    except ValueError:
+        return _DEFAULT_MAX_AGE_SECONDS
+
+
+def _is_fresh(resolved_at: str, max_age: int) -> bool:
+    try:
+        resolved = datetime.fromisoformat(resolved_at)
+    except ValueError:
+        return False
+    age = (datetime.now(timezone.utc) - resolved).total_seconds()
+    return 0 <= age <= max_age
+
+
+def _fingerprint(project_path: Path, agent: str, image_ref: str, git_root: Path | None) -> str | None:
+    image_id = get_local_image_id(image_ref)
+    if image_id is None:
+        return None
+    digest = hashlib.sha256()
+    for part in (__version__, str(project_path), agent, image_ref, image_id, str(git_root or "")):
+        digest.update(f"{part}\n".encode())
+    project_config_path = SettingsStore().project_config_path(project_path)
+    for entry in _stat_entries(_fingerprint_paths(project_path, project_config_path, git_root)):
+        digest.update(f"{entry}\n".encode())
+    return digest.hexdigest()
+
+
+def _fingerprint_paths(project_path: Path, project_config_path: Path, git_root: Path | None) -> list[Path]:
+    paths: list[Path] = [
+        project_config_path,
+        *HOST_GIT_CONFIG_FILES,
+        project_path / ".git",
+        project_path / ".git" / "config",
+    ]
+    # Launches from a subdirectory take the git-root mount and Git config from the enclosing repository.
+    if git_root is not None and git_root != project_path:
+        paths.extend([git_root, git_root / ".git", git_root / ".git" / "config"])
+    for root in (CUSTOM_BASES_DIR, CUSTOM_AGENTS_DIR, CUSTOM_EXTENSIONS_DIR):
+        paths.append(root)
+        paths.extend(_walk(root))
+    return paths
+
+
+def _walk(root: Path) -> list[Path]:
+    found: list[Path] = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        current = Path(dirpath)
+        found.extend(current / name for name in dirnames)
+        found.extend(current / name for name in sorted(filenames))
+    return found
+
+
+def _stat_entries(paths: Iterable[Path]) -> list[str]:
+    entries: list[str] = []
+    for path in paths:
+        try:
+            stat = path.stat()
+        except OSError:
+            entries.append(f"{path}:missing")
+            continue
+        entries.append(f"{path}:{stat.st_mtime_ns}:{stat.st_size}")
+    return entries
@@ -0,0 +1,42 @@
+import io
+from pathlib import Path
+from unittest import TestCase, mock
+
+from aicage.cli import _gc_config as gc_config
+from aicage.config._project_index import ProjectIndexEntry
+
+
+class GcConfigTests(TestCase):
+    def test_gc_project_configs_nothing_to_remove(self) -> None:
+        store = mock.Mock()
+        store.prune_missing_projects.return_value = []
+        with (
+            mock.patch("aicage.cli._gc_config.SettingsStore", return_value=store),
+            mock.patch("sys.stdout", new_callable=io.StringIO) as stdout,
+        ):
+            gc_config.gc_project_configs()
+
+        self.assertIn("No stale project configs found.", stdout.getvalue())
+
+    def test_gc_project_configs_prints_removed(self) -> None:
+        store = mock.Mock()
+        store.projects_dir = Path("/tmp/projects")
+        store.prune_missing_projects.return_value = [
+            ProjectIndexEntry(
+                config_file="a.yml",
+                project_path="/tmp/gone",
+                agents=[],
+                bases=[],
+                image_refs=[],
+                last_used="2026-01-01T00:00:00+00:00",
+            )
+        ]
+        with (
+            mock.patch("aicage.cli._gc_config.SettingsStore", return_value=store),
+            mock.patch("sys.stdout", new_callable=io.StringIO) as stdout,
+        ):
+            gc_config.gc_project_configs()
+
+        output = stdout.getvalue()
+        self.assertIn("Removed project configs:", output)
+        self.assertIn("/tmp/gone (/tmp/projects/a.yml)", output)
@@ -0,0 +1,52 @@
+import io
+import tempfile
+from pathlib import Path
+from unittest import TestCase, mock
+
+from aicage.cli import _list_config as list_config
+from aicage.config._project_index import ProjectIndexEntry
+
+
+class ListConfigTests(TestCase):
+    def test_list_project_configs_empty(self) -> None:
+        store = mock.Mock()
+        store.list_projects.return_value = []
+        with (
+            mock.patch("aicage.cli._list_config.SettingsStore", return_value=store),
+            mock.patch("sys.stdout", new_callable=io.StringIO) as stdout,
+        ):
+            list_config.list_project_configs()
+
+        self.assertIn("No project configs found.", stdout.getvalue())
+
+    def test_list_project_configs_prints_entries_and_summary(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            store = mock.Mock()
+            store.projects_dir = Path(tmp_dir)
+            store.list_projects.return_value = [
+                _entry("a.yml", tmp_dir, ["codex"], ["aicage-extended:codex-ubuntu-tools"]),
+                _entry("b.yml", str(Path(tmp_dir) / "gone"), [], []),
+            ]
+            with (
+                mock.patch("aicage.cli._list_config.SettingsStore", return_value=store),
+                mock.patch("sys.stdout", new_callable=io.StringIO) as stdout,
+            ):
+                list_config.list_project_configs()
+
+        output = stdout.getvalue()
+        self.assertIn(f"{tmp_dir}\n  agents: codex", output)
+        self.assertIn("images: aicage-extended:codex-ubuntu-tools", output)
+        self.assertIn(f"{Path(tmp_dir) / 'gone'} (missing)\n  agents: -", output)
+        self.assertIn("2 project configs, 1 with missing project directories.", output)
+        self.assertIn("aicage --config gc", output)
+
+
+def _entry(config_file: str, project_path: str, agents: list[str], image_refs: list[str]) -> ProjectIndexEntry:
+    return ProjectIndexEntry(
+        config_file=config_file,
+        project_path=project_path,
+        agents=agents,
+        bases=["ubuntu"] if agents else [],
+        image_refs=image_refs,
+        last_used="2026-01-01T00:00:00+00:00",
+    )
@@ -98,6 +98,14 @@ class ParseCliTests(TestCase):
         with self.assertRaises(CliError):
             parse_cli(["--config", "remove", "codex"])
 
+    def test_parse_cli_config_list(self) -> None:
+        parsed = parse_cli(["--config", "list"])
+        self.assertEqual("list", parsed.config_action)
+
+    def test_parse_cli_config_gc(self) -> None:
+        parsed = parse_cli(["--config", "gc"])
+        self.assertEqual("gc", parsed.config_action)
+
     def test_parse_cli_flags_before_separator(self) -> None:
         parsed = parse_cli(
             [
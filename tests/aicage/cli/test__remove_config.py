@@ -12,6 +12,7 @@ class RemoveConfigTests(TestCase):
             config_path = Path(tmp_dir) / "project.yml"
             store = mock.Mock()
             store.project_config_path.return_value = config_path
+            store.remove_project.return_value = False
             with (
                 mock.patch("aicage.cli._remove_config.SettingsStore", return_value=store),
                 mock.patch("sys.stdout", new_callable=io.StringIO) as stdout,
@@ -25,9 +26,9 @@ class RemoveConfigTests(TestCase):
     def test_remove_project_config_existing(self) -> None:
         with tempfile.TemporaryDirectory() as tmp_dir:
             config_path = Path(tmp_dir) / "project.yml"
-            config_path.write_text("agents: {}", encoding="utf-8")
             store = mock.Mock()
             store.project_config_path.return_value = config_path
+            store.remove_project.return_value = True
             with (
                 mock.patch("aicage.cli._remove_config.SettingsStore", return_value=store),
                 mock.patch("sys.stdout", new_callable=io.StringIO) as stdout,
@@ -37,4 +38,4 @@ class RemoveConfigTests(TestCase):
         output = stdout.getvalue()
         self.assertIn("Project config removed:", output)
         self.assertIn(str(config_path), output)
-        self.assertFalse(config_path.exists())
+        store.remove_project.assert_called_once()
@@ -0,0 +1,33 @@
+import tempfile
+from pathlib import Path
+from unittest import TestCase, mock
+
+from aicage.cli._update_store import UpdateCheckRecord, UpdateCheckStore
+
+
+class UpdateCheckStoreTests(TestCase):
+    def test_save_and_load_round_trip(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            state_path = Path(tmp_dir) / "update-check" / "pypi.yml"
+            with mock.patch("aicage.cli._update_store.paths_module.UPDATE_CHECK_STATE_PATH", state_path):
+                store = UpdateCheckStore()
+                record = UpdateCheckRecord(latest_version="1.2.3", checked_at="2026-01-01T00:00:00+00:00")
+
+                path = store.save(record)
+                loaded = store.load()
+
+            self.assertEqual(state_path, path)
+            self.assertEqual(record, loaded)
+
+    def test_load_returns_none_when_missing(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            state_path = Path(tmp_dir) / "pypi.yml"
+            with mock.patch("aicage.cli._update_store.paths_module.UPDATE_CHECK_STATE_PATH", state_path):
+                self.assertIsNone(UpdateCheckStore().load())
+
+    def test_load_returns_none_for_invalid_yaml(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            state_path = Path(tmp_dir) / "pypi.yml"
+            state_path.write_text("- not\n- a mapping\n", encoding="utf-8")
+            with mock.patch("aicage.cli._update_store.paths_module.UPDATE_CHECK_STATE_PATH", state_path):
+                self.assertIsNone(UpdateCheckStore().load())
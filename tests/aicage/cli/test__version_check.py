@@ -1,7 +1,10 @@
 import io
+from datetime import datetime, timezone
 from unittest import TestCase, mock
 
+from aicage._http_client import HttpResponse
 from aicage.cli import _version_check as version_check
+from aicage.cli._update_store import UpdateCheckRecord
 
 
 class VersionCheckTests(TestCase):
@@ -44,3 +47,103 @@ class VersionCheckTests(TestCase):
             version_check.maybe_prompt_update("1.0.0")
 
         upgrade_mock.assert_called_once()
+
+    def test_check_for_update_uses_fresh_cache(self) -> None:
+        record = UpdateCheckRecord(latest_version="1.2.3", checked_at=_now_iso())
+        with (
+            mock.patch("aicage.cli._version_check.UpdateCheckStore") as store_cls,
+            mock.patch("aicage.cli._version_check._start_background_refresh") as refresh_mock,
+        ):
+            store_cls.return_value.load.return_value = record
+            latest = version_check._check_for_update("1.0.0")
+
+        self.assertEqual("1.2.3", latest)
+        refresh_mock.assert_not_called()
+
+    def test_check_for_update_refreshes_stale_cache_in_background(self) -> None:
+        record = UpdateCheckRecord(latest_version="1.0.0", checked_at="2020-01-01T00:00:00+00:00")
+        with (
+            mock.patch("aicage.cli._version_check.UpdateCheckStore") as store_cls,
+            mock.patch("aicage.cli._version_check._start_background_refresh") as refresh_mock,
+            mock.patch("aicage.cli._version_check.http_request") as request_mock,
+        ):
+            store_cls.return_value.load.return_value = record
+            latest = version_check._check_for_update("1.0.0")
+
+        self.assertIsNone(latest)
+        refresh_mock.assert_called_once_with(store_cls.return_value, record)
+        request_mock.assert_not_called()
+
+    def test_check_for_update_disabled_by_ttl(self) -> None:
+        with (
+            mock.patch.dict("os.environ", {"AICAGE_UPDATE_CHECK_TTL": "0"}),
+            mock.patch("aicage.cli._version_check.UpdateCheckStore") as store_cls,
+        ):
+            latest = version_check._check_for_update("1.0.0")
+
+        self.assertIsNone(latest)
+        store_cls.assert_not_called()
+
+    def test_start_background_refresh_marks_attempt_and_spawns(self) -> None:
+        store = mock.Mock()
+        record = UpdateCheckRecord(latest_version="1.2.3", checked_at="2020-01-01T00:00:00+00:00")
+        with mock.patch("aicage.cli._version_check.subprocess.Popen") as popen_mock:
+            version_check._start_background_refresh(store, record)
+
+        saved = store.save.call_args.args[0]
+        self.assertEqual("1.2.3", saved.latest_version)
+        self.assertNotEqual(record.checked_at, saved.checked_at)
+        command = popen_mock.call_args.args[0]
+        self.assertEqual(["-m", "aicage.cli._version_check"], command[1:])
+        self.assertTrue(popen_mock.call_args.kwargs["start_new_session"])
+
+    def test_start_background_refresh_continues_when_state_is_unwritable(self) -> None:
+        store = mock.Mock()
+        store.save.side_effect = OSError("read-only file system")
+        with mock.patch("aicage.cli._version_check.subprocess.Popen") as popen_mock:
+            version_check._start_background_refresh(store, None)
+
+        popen_mock.assert_not_called()
+
+    def test_start_background_refresh_continues_when_spawn_fails(self) -> None:
+        store = mock.Mock()
+        with mock.patch("aicage.cli._version_check.subprocess.Popen", side_effect=OSError("no space left")):
+            version_check._start_background_refresh(store, None)
+
+        store.save.assert_called_once()
+
+    def test_refresh_latest_version_saves_result(self) -> None:
+        with (
+            mock.patch("aicage.cli._version_check._fetch_latest_version", return_value="2.0.0"),
+            mock.patch("aicage.cli._version_check.UpdateCheckStore") as store_cls,
+        ):
+            version_check._refresh_latest_version()
+
+        saved = store_cls.return_value.save.call_args.args[0]
+        self.assertEqual("2.0.0", saved.latest_version)
+
+    def test_refresh_latest_version_keeps_cache_on_failure(self) -> None:
+        with (
+            mock.patch("aicage.cli._version_check._fetch_latest_version", return_value=None),
+            mock.patch("aicage.cli._version_check.UpdateCheckStore") as store_cls,
+        ):
+            version_check._refresh_latest_version()
+
+        store_cls.return_value.save.assert_not_called()
+
+    def test_fetch_latest_version_reads_pypi_payload(self) -> None:
+        response = HttpResponse(status=200, headers={}, body=b'{"info": {"version": "3.1.4"}}')
+        with mock.patch("aicage.cli._version_check.http_request", return_value=response):
+            latest = version_check._fetch_latest_version()
+
+        self.assertEqual("3.1.4", latest)
+
+    def test_fetch_latest_version_returns_none_when_unreachable(self) -> None:
+        with mock.patch("aicage.cli._version_check.http_request", return_value=None):
+            latest = version_check._fetch_latest_version()
+
+        self.assertIsNone(latest)
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
@@ -131,6 +131,38 @@ class EntrypointTests(TestCase):
         remove_mock.assert_called_once()
         load_mock.assert_not_called()
 
+    def test_main_config_list(self) -> None:
+        with (
+            mock.patch(
+                "aicage.cli.entrypoint.parse_cli",
+                return_value=ParsedArgs(False, "", "", [], False, "list"),
+            ),
+            mock.patch("aicage.cli.entrypoint.list_project_configs") as list_mock,
+            mock.patch("aicage.cli.entrypoint.load_run_config") as load_mock,
+            mock.patch("aicage.cli.entrypoint.maybe_prompt_update"),
+        ):
+            exit_code = main([])
+
+        self.assertEqual(0, exit_code)
+        list_mock.assert_called_once()
+        load_mock.assert_not_called()
+
+    def test_main_config_gc(self) -> None:
+        with (
+            mock.patch(
+                "aicage.cli.entrypoint.parse_cli",
+                return_value=ParsedArgs(False, "", "", [], False, "gc"),
+            ),
+            mock.patch("aicage.cli.entrypoint.gc_project_configs") as gc_mock,
+            mock.patch("aicage.cli.entrypoint.load_run_config") as load_mock,
+            mock.patch("aicage.cli.entrypoint.maybe_prompt_update"),
+        ):
+            exit_code = main([])
+
+        self.assertEqual(0, exit_code)
+        gc_mock.assert_called_once()
+        load_mock.assert_not_called()
+
     def test_main_uses_project_base(self) -> None:
         with tempfile.TemporaryDirectory() as tmp_dir:
             project_path = Path(tmp_dir)
@@ -160,6 +192,89 @@ class EntrypointTests(TestCase):
             self.assertEqual(0, exit_code)
             run_mock.assert_called_once_with(run_args)
 
+    def test_main_uses_cached_run_plan(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            project_path = Path(tmp_dir)
+            run_args = _build_run_args(
+                project_path,
+                "ghcr.io/aicage/aicage:codex-debian",
+                "--project",
+                ["--flag"],
+            )
+            with (
+                mock.patch(
+                    "aicage.cli.entrypoint.parse_cli",
+                    return_value=ParsedArgs(False, "", "codex", ["--flag"], False, None),
+                ),
+                mock.patch("aicage.cli.entrypoint.maybe_prompt_update"),
+                mock.patch("aicage.cli.entrypoint.load_cached_run_args", return_value=run_args),
+                mock.patch("aicage.cli.entrypoint.load_run_config") as load_mock,
+                mock.patch("aicage.cli.entrypoint.ensure_image") as ensure_mock,
+                mock.patch("aicage.cli.entrypoint.run_container") as run_mock,
+            ):
+                exit_code = main([])
+
+            self.assertEqual(0, exit_code)
+            load_mock.assert_not_called()
+            ensure_mock.assert_not_called()
+            run_mock.assert_called_once_with(run_args)
+
+    def test_main_saves_run_plan_after_full_resolution(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            project_path = Path(tmp_dir)
+            run_config = _build_run_config(
+                project_path,
+                "ghcr.io/aicage/aicage:codex-debian",
+            )
+            run_args = _build_run_args(
+                project_path,
+                "ghcr.io/aicage/aicage:codex-debian",
+                "--project",
+                [],
+            )
+            parsed = ParsedArgs(False, "", "codex", [], False, None)
+            with (
+                mock.patch("aicage.cli.entrypoint.parse_cli", return_value=parsed),
+                mock.patch("aicage.cli.entrypoint.maybe_prompt_update"),
+                mock.patch("aicage.cli.entrypoint.load_cached_run_args", return_value=None),
+                mock.patch("aicage.cli.entrypoint.load_run_config", return_value=run_config),
+                mock.patch("aicage.cli.entrypoint.ensure_image"),
+                mock.patch("aicage.cli.entrypoint.build_run_args", return_value=run_args),
+                mock.patch("aicage.cli.entrypoint.save_run_plan") as save_mock,
+                mock.patch("aicage.cli.entrypoint.run_container"),
+            ):
+                exit_code = main([])
+
+            self.assertEqual(0, exit_code)
+            save_mock.assert_called_once_with(run_config, run_args, parsed)
+
+    def test_main_writes_trace_when_requested(self) -> None:
+        with (
+            mock.patch("aicage.cli.entrypoint.parse_cli", return_value=ParsedArgs(False, "", "", [], False, "info")),
+            mock.patch("aicage.cli.entrypoint.maybe_prompt_update"),
+            mock.patch("aicage.cli.entrypoint.info_project_config"),
+            mock.patch("aicage.cli.entrypoint.enable_tracing") as enable_mock,
+            mock.patch("aicage.cli.entrypoint.write_trace", return_value=None) as write_mock,
+        ):
+            exit_code = main(["--trace", "--config", "info"])
+
+        self.assertEqual(0, exit_code)
+        enable_mock.assert_called_once_with()
+        write_mock.assert_called_once_with()
+
+    def test_main_ignores_trace_flag_after_separator(self) -> None:
+        with (
+            mock.patch("aicage.cli.entrypoint.parse_cli", return_value=ParsedArgs(False, "", "", [], False, "info")),
+            mock.patch("aicage.cli.entrypoint.maybe_prompt_update"),
+            mock.patch("aicage.cli.entrypoint.info_project_config"),
+            mock.patch.dict("os.environ", {}, clear=True),
+            mock.patch("aicage.cli.entrypoint.enable_tracing") as enable_mock,
+            mock.patch("aicage.cli.entrypoint.write_trace", return_value=None),
+        ):
+            main(["--", "codex", "--trace"])
+
+        enable_mock.assert_not_called()
+
     def test_main_prompts_and_saves_base(self) -> None:
         with tempfile.TemporaryDirectory() as tmp_dir:
             project_path = Path(tmp_dir)
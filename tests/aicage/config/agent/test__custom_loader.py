@@ -24,7 +24,7 @@ class CustomAgentLoaderTests(TestCase):
                 "aicage.config.agent._custom_loader.CUSTOM_AGENTS_DIR",
                 missing,
             ):
-                custom_agents = load_custom_agents(bases)
+                custom_agents = dict(load_custom_agents(bases))
         self.assertEqual({}, custom_agents)
 
     def test_load_custom_agents_builds_bases(self) -> None:
@@ -54,7 +54,7 @@ class CustomAgentLoaderTests(TestCase):
                 "aicage.config.agent._custom_loader.CUSTOM_AGENTS_DIR",
                 custom_dir,
             ):
-                custom_agents = load_custom_agents(bases)
+                custom_agents = dict(load_custom_agents(bases))
 
         agent = custom_agents["custom"]
         self.assertEqual(custom_dir / "custom", agent.local_definition_dir)
@@ -82,7 +82,7 @@ class CustomAgentLoaderTests(TestCase):
                 custom_dir,
             ):
                 with self.assertRaises(ConfigError):
-                    load_custom_agents(bases)
+                    dict(load_custom_agents(bases))
 
     @staticmethod
     def _bases(bases: list[str]) -> dict[str, BaseMetadata]:
@@ -0,0 +1,20 @@
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from aicage.config.agent.definition_hash import agent_definition_hash
+
+
+class AgentDefinitionHashTests(TestCase):
+    def test_agent_definition_hash_changes_on_file_edit(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            agent_dir = Path(tmp_dir) / "codex"
+            agent_dir.mkdir()
+            (agent_dir / "install.sh").write_text("echo install\n", encoding="utf-8")
+            first_hash = agent_definition_hash(agent_dir)
+            unchanged_hash = agent_definition_hash(agent_dir)
+            (agent_dir / "install.sh").write_text("echo changed\n", encoding="utf-8")
+            second_hash = agent_definition_hash(agent_dir)
+
+        self.assertEqual(first_hash, unchanged_hash)
+        self.assertNotEqual(first_hash, second_hash)
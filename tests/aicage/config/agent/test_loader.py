@@ -5,6 +5,7 @@ from unittest import TestCase, mock
 from aicage.config.agent.loader import load_agents
 from aicage.config.agent.models import AgentMetadata
 from aicage.config.base.models import BaseMetadata
+from aicage.config.errors import ConfigError
 
 
 class AgentLoaderTests(TestCase):
@@ -51,8 +52,8 @@ class AgentLoaderTests(TestCase):
             )
             with (
                 mock.patch(
-                    "aicage.config.agent.loader.find_packaged_path",
-                    return_value=dockerfile,
+                    "aicage.config.agent.loader.list_packaged_dirs",
+                    return_value=(dockerfile.parent / "agents" / "codex",),
                 ),
                 mock.patch(
                     "aicage.config.agent.loader.load_custom_agents",
@@ -62,3 +63,25 @@ class AgentLoaderTests(TestCase):
                 agents = load_agents(bases)
 
         self.assertEqual(custom_agent, agents["codex"])
+
+    def test_load_agents_defers_invalid_definitions(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            dockerfile = root / "agent-build" / "Dockerfile"
+            (root / "agent-build" / "agents" / "broken").mkdir(parents=True)
+            dockerfile.write_text("FROM scratch\n", encoding="utf-8")
+            with (
+                mock.patch(
+                    "aicage.config.agent.loader.list_packaged_dirs",
+                    return_value=(dockerfile.parent / "agents" / "broken",),
+                ),
+                mock.patch(
+                    "aicage.config.agent.loader.load_custom_agents",
+                    return_value={},
+                ),
+            ):
+                agents = load_agents({})
+
+                self.assertEqual(["broken"], list(agents))
+                with self.assertRaises(ConfigError):
+                    _ = agents["broken"]
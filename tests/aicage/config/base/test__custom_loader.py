@@ -15,7 +15,7 @@ class CustomBaseLoaderTests(TestCase):
                 "aicage.config.base._custom_loader.CUSTOM_BASES_DIR",
                 missing,
             ):
-                custom_bases = load_custom_bases()
+                custom_bases = dict(load_custom_bases())
         self.assertEqual({}, custom_bases)
 
     def test_load_custom_base_raises_when_missing(self) -> None:
@@ -44,7 +44,7 @@ class CustomBaseLoaderTests(TestCase):
                 "aicage.config.base._custom_loader.CUSTOM_BASES_DIR",
                 custom_dir,
             ):
-                custom_bases = load_custom_bases()
+                custom_bases = dict(load_custom_bases())
 
         base = custom_bases["ubuntu"]
         self.assertEqual("debian:latest", base.from_image)
@@ -69,7 +69,7 @@ class CustomBaseLoaderTests(TestCase):
                 custom_dir,
             ):
                 with self.assertRaises(ConfigError):
-                    load_custom_bases()
+                    dict(load_custom_bases())
 
     @staticmethod
     def _write_base_definition(
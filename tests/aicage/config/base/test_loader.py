@@ -49,15 +49,15 @@ class BaseLoaderTests(TestCase):
             )
             with (
                 mock.patch(
-                    "aicage.config.base.loader.find_packaged_path",
-                    return_value=dockerfile,
+                    "aicage.config.base.loader.list_packaged_dirs",
+                    return_value=(debian_dir, ubuntu_dir),
                 ),
                 mock.patch(
                     "aicage.config.base.loader.load_custom_bases",
                     return_value={"ubuntu": custom_base},
                 ),
             ):
-                bases = load_bases()
+                bases = dict(load_bases())
 
         self.assertEqual(custom_base, bases["ubuntu"])
         self.assertFalse(bases["debian"].build_local)
@@ -0,0 +1,77 @@
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from unittest import TestCase, mock
+
+from aicage.config.extensions._file_hashes import FileHashCache
+
+
+class FileHashCacheTests(TestCase):
+    def test_file_hash(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = _write_old_file(Path(tmp_dir) / "install.sh", b"echo one\n")
+            cache = FileHashCache(Path(tmp_dir) / "hashes.json")
+
+            first = cache.file_hash(path)
+            with mock.patch("aicage.config.extensions._file_hashes._hash_file") as hash_mock:
+                second = cache.file_hash(path)
+            _write_old_file(path, b"echo two, longer\n")
+            third = cache.file_hash(path)
+
+        self.assertEqual(hashlib.sha256(b"echo one\n").hexdigest(), first)
+        self.assertEqual(first, second)
+        hash_mock.assert_not_called()
+        self.assertEqual(hashlib.sha256(b"echo two, longer\n").hexdigest(), third)
+
+    def test_file_hash_does_not_cache_recently_modified_files(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "install.sh"
+            path.write_bytes(b"echo one\n")
+            cache = FileHashCache(Path(tmp_dir) / "hashes.json")
+
+            cache.file_hash(path)
+            with mock.patch(
+                "aicage.config.extensions._file_hashes._hash_file",
+                return_value="rehashed",
+            ):
+                second = cache.file_hash(path)
+
+        self.assertEqual("rehashed", second)
+
+    def test_save(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = _write_old_file(Path(tmp_dir) / "install.sh", b"echo one\n")
+            cache_path = Path(tmp_dir) / "state" / "hashes.json"
+            cache = FileHashCache(cache_path)
+            cache.save()
+            self.assertFalse(cache_path.exists())
+
+            digest = cache.file_hash(path)
+            cache.save()
+            payload = json.loads(cache_path.read_text(encoding="utf-8"))
+            with mock.patch("aicage.config.extensions._file_hashes._hash_file") as hash_mock:
+                reloaded = FileHashCache(cache_path).file_hash(path)
+
+        self.assertEqual([str(path)], list(payload["files"]))
+        self.assertEqual(digest, reloaded)
+        hash_mock.assert_not_called()
+
+    def test_ignores_corrupt_cache(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = _write_old_file(Path(tmp_dir) / "install.sh", b"echo one\n")
+            cache_path = Path(tmp_dir) / "hashes.json"
+            cache_path.write_text("{not json", encoding="utf-8")
+
+            digest = FileHashCache(cache_path).file_hash(path)
+
+        self.assertEqual(hashlib.sha256(b"echo one\n").hexdigest(), digest)
+
+
+def _write_old_file(path: Path, content: bytes) -> Path:
+    path.write_bytes(content)
+    stat = path.stat()
+    old_ns = stat.st_mtime_ns - 60_000_000_000
+    os.utime(path, ns=(old_ns, old_ns))
+    return path
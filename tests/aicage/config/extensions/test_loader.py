@@ -19,7 +19,7 @@ class ExtensionDiscoveryTests(TestCase):
                 "aicage.config.extensions.loader.CUSTOM_EXTENSIONS_DIR",
                 Path(extension_root),
             ):
-                extensions = extensions_module.load_extensions()
+                extensions = dict(extensions_module.load_extensions())
 
         self.assertIn("sample", extensions)
         metadata = extensions["sample"]
@@ -31,11 +31,17 @@ class ExtensionDiscoveryTests(TestCase):
             extension_root = Path(tmp_dir) / "extension"
             extension_dir = extension_root / "sample"
             write_extension(extension_dir, name="Sample", description="Desc")
-            with mock.patch(
-                "aicage.config.extensions.loader.CUSTOM_EXTENSIONS_DIR",
-                Path(extension_root),
+            with (
+                mock.patch(
+                    "aicage.config.extensions.loader.CUSTOM_EXTENSIONS_DIR",
+                    Path(extension_root),
+                ),
+                mock.patch(
+                    "aicage.config.extensions.loader.EXTENSION_FILE_HASH_STATE_PATH",
+                    Path(tmp_dir) / "file-hashes.json",
+                ),
             ):
-                extensions = extensions_module.load_extensions()
+                extensions = dict(extensions_module.load_extensions())
                 metadata = extensions["sample"]
                 first_hash = extensions_module.extension_hash(metadata)
                 script_path = metadata.scripts_dir / "01-install.sh"
@@ -50,11 +56,17 @@ class ExtensionDiscoveryTests(TestCase):
             extension_dir = extension_root / "sample"
             write_extension(extension_dir, name="Sample", description="Desc")
             (extension_dir / "Dockerfile").write_text("FROM ubuntu:latest\n", encoding="utf-8")
-            with mock.patch(
-                "aicage.config.extensions.loader.CUSTOM_EXTENSIONS_DIR",
-                Path(extension_root),
+            with (
+                mock.patch(
+                    "aicage.config.extensions.loader.CUSTOM_EXTENSIONS_DIR",
+                    Path(extension_root),
+                ),
+                mock.patch(
+                    "aicage.config.extensions.loader.EXTENSION_FILE_HASH_STATE_PATH",
+                    Path(tmp_dir) / "file-hashes.json",
+                ),
             ):
-                extensions = extensions_module.load_extensions()
+                extensions = dict(extensions_module.load_extensions())
                 metadata = extensions["sample"]
                 first_hash = extensions_module.extension_hash(metadata)
                 (extension_dir / "Dockerfile").write_text("FROM ubuntu:22.04\n", encoding="utf-8")
@@ -71,7 +83,7 @@ class ExtensionDiscoveryTests(TestCase):
                 "aicage.config.extensions.loader.CUSTOM_EXTENSIONS_DIR",
                 Path(extension_root),
             ):
-                extensions = extensions_module.load_extensions()
+                extensions = dict(extensions_module.load_extensions())
 
         self.assertEqual({}, extensions)
 
@@ -89,7 +101,7 @@ class ExtensionDiscoveryTests(TestCase):
                 Path(extension_root),
             ):
                 with self.assertRaises(ConfigError):
-                    extensions_module.load_extensions()
+                    dict(extensions_module.load_extensions())
 
     def test_load_extensions_requires_definition(self) -> None:
         with tempfile.TemporaryDirectory() as tmp_dir:
@@ -102,7 +114,7 @@ class ExtensionDiscoveryTests(TestCase):
                 Path(extension_root),
             ):
                 with self.assertRaises(ConfigError):
-                    extensions_module.load_extensions()
+                    dict(extensions_module.load_extensions())
 
     def test_load_extensions_rejects_invalid_yaml(self) -> None:
         with tempfile.TemporaryDirectory() as tmp_dir:
@@ -119,7 +131,7 @@ class ExtensionDiscoveryTests(TestCase):
                 Path(extension_root),
             ):
                 with self.assertRaises(ConfigError):
-                    extensions_module.load_extensions()
+                    dict(extensions_module.load_extensions())
 
     def test_load_extensions_reports_read_failure(self) -> None:
         with tempfile.TemporaryDirectory() as tmp_dir:
@@ -142,7 +154,7 @@ class ExtensionDiscoveryTests(TestCase):
                 Path(extension_root),
             ):
                 with self.assertRaises(ConfigError):
-                    extensions_module.load_extensions()
+                    dict(extensions_module.load_extensions())
 
     def test_load_extensions_rejects_blank_values(self) -> None:
         with tempfile.TemporaryDirectory() as tmp_dir:
@@ -159,7 +171,7 @@ class ExtensionDiscoveryTests(TestCase):
                 Path(extension_root),
             ):
                 with self.assertRaises(ConfigError):
-                    extensions_module.load_extensions()
+                    dict(extensions_module.load_extensions())
 
     def test_load_extensions_requires_required_keys(self) -> None:
         with tempfile.TemporaryDirectory() as tmp_dir:
@@ -176,4 +188,4 @@ class ExtensionDiscoveryTests(TestCase):
                 Path(extension_root),
             ):
                 with self.assertRaises(ConfigError):
-                    extensions_module.load_extensions()
+                    dict(extensions_module.load_extensions())
@@ -0,0 +1,200 @@
+import json
+import os
+import tempfile
+from pathlib import Path
+from unittest import TestCase, mock
+
+from aicage.config import _definition_snapshot
+from aicage.config._lazy_definitions import LazyDefinitions
+from aicage.config.agent.models import AgentMetadata
+from aicage.config.base.models import BaseMetadata
+from aicage.config.extensions.loader import ExtensionMetadata
+
+
+class DefinitionSnapshotTests(TestCase):
+    def setUp(self) -> None:
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self._root = Path(tmp_dir.name)
+        dockerfile = self._root / "config" / "agent-build" / "Dockerfile"
+        dockerfile.parent.mkdir(parents=True)
+        dockerfile.write_text("FROM scratch\n", encoding="utf-8")
+        self._base_dir = self._root / "config" / "base-build" / "bases" / "ubuntu"
+        self._base_dir.mkdir(parents=True)
+        (self._base_dir / "base.yml").write_text("from_image: ubuntu:latest\n", encoding="utf-8")
+        self._snapshot_path = self._root / "state" / "definitions.json"
+
+        self._base_loader = mock.Mock(return_value=_bases(self._base_dir)["ubuntu"])
+        self._agent_loader = mock.Mock(return_value=_agents()["codex"])
+        self._extension_loader = mock.Mock(return_value=_extensions()["tools"])
+        self._load_bases = mock.Mock(side_effect=lambda: LazyDefinitions({"ubuntu": self._base_loader}))
+        self._load_agents = mock.Mock(side_effect=lambda bases: LazyDefinitions({"codex": self._agent_loader}))
+        self._load_extensions = mock.Mock(side_effect=lambda: LazyDefinitions({"tools": self._extension_loader}))
+        patchers = [
+            mock.patch.object(_definition_snapshot, "packaged_config_root", return_value=self._root / "config"),
+            mock.patch.object(_definition_snapshot, "load_bases", self._load_bases),
+            mock.patch.object(_definition_snapshot, "load_agents", self._load_agents),
+            mock.patch.object(_definition_snapshot, "load_extensions", self._load_extensions),
+            mock.patch("aicage.config._definition_snapshot.paths_module.CUSTOM_BASES_DIR", self._root / "bases"),
+            mock.patch("aicage.config._definition_snapshot.paths_module.CUSTOM_AGENTS_DIR", self._root / "agents"),
+            mock.patch(
+                "aicage.config._definition_snapshot.paths_module.CUSTOM_EXTENSIONS_DIR",
+                self._root / "extensions",
+            ),
+            mock.patch(
+                "aicage.config._definition_snapshot.paths_module.CONFIG_SNAPSHOT_STATE_PATH",
+                self._snapshot_path,
+            ),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_load_definitions_writes_snapshot(self) -> None:
+        bases, agents, extensions = _definition_snapshot.load_definitions()
+
+        self.assertEqual(_bases(self._base_dir), bases)
+        self.assertEqual(_agents(), agents)
+        self.assertEqual(_extensions(), extensions)
+        self._load_agents.assert_called_once_with(bases)
+        payload = json.loads(self._snapshot_path.read_text(encoding="utf-8"))
+        self.assertIn(str(self._base_dir / "base.yml"), payload["manifest"])
+        self.assertEqual("missing", payload["manifest"][str(self._root / "extensions")])
+        self.assertEqual(["codex"], list(payload["agents"]))
+
+    def test_load_definitions_loads_entries_on_access(self) -> None:
+        _, agents, _ = _definition_snapshot.load_definitions()
+
+        self._agent_loader.assert_not_called()
+        self.assertEqual(_agents()["codex"], agents["codex"])
+        self._agent_loader.assert_called_once_with()
+        self._base_loader.assert_not_called()
+        self._extension_loader.assert_not_called()
+        payload = json.loads(self._snapshot_path.read_text(encoding="utf-8"))
+        self.assertEqual({}, payload["bases"])
+
+    def test_load_definitions_reuses_snapshot(self) -> None:
+        self._load_all()
+        self._reset_loaders()
+
+        bases, agents, extensions = self._load_all()
+
+        self._base_loader.assert_not_called()
+        self._agent_loader.assert_not_called()
+        self._extension_loader.assert_not_called()
+        self.assertEqual(_bases(self._base_dir), bases)
+        self.assertEqual(_agents(), agents)
+        self.assertEqual(_extensions(), extensions)
+
+    def test_load_definitions_reloads_when_source_changes(self) -> None:
+        self._load_all()
+        self._reset_loaders()
+        definition = self._base_dir / "base.yml"
+        stat = definition.stat()
+        os.utime(definition, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        self._load_all()
+
+        self._base_loader.assert_called_once_with()
+        self._agent_loader.assert_called_once_with()
+
+    def test_load_definitions_reloads_when_schema_changes(self) -> None:
+        schema = self._root / "config" / "validation" / "base.schema.json"
+        schema.parent.mkdir(parents=True)
+        schema.write_text("{}", encoding="utf-8")
+        self._load_all()
+        self._reset_loaders()
+        schema.write_text('{"required": []}', encoding="utf-8")
+
+        self._load_all()
+
+        self._base_loader.assert_called_once_with()
+
+    def test_load_definitions_reloads_when_custom_dir_appears(self) -> None:
+        self._load_all()
+        self._reset_loaders()
+        (self._root / "extensions").mkdir()
+
+        self._load_all()
+
+        self._extension_loader.assert_called_once_with()
+
+    def test_load_definitions_reloads_for_other_version(self) -> None:
+        self._load_all()
+        self._reset_loaders()
+
+        with mock.patch.object(_definition_snapshot, "__version__", "0.0.0-other"):
+            self._load_all()
+
+        self._base_loader.assert_called_once_with()
+
+    def test_load_definitions_ignores_corrupt_snapshot(self) -> None:
+        self._snapshot_path.parent.mkdir(parents=True)
+        self._snapshot_path.write_text("{not json", encoding="utf-8")
+
+        bases, _, _ = self._load_all()
+
+        self.assertEqual(_bases(self._base_dir), bases)
+        self._base_loader.assert_called_once_with()
+
+    def test_wrap(self) -> None:
+        snapshot = _definition_snapshot._DefinitionSnapshot(self._snapshot_path)
+        source = {"ubuntu": _bases(self._base_dir)["ubuntu"]}
+        decode = mock.Mock(side_effect=KeyError("broken"))
+
+        wrapped = snapshot.wrap("bases", source, _definition_snapshot._base_to_mapping, decode)
+        self.assertEqual(source, wrapped)
+        reloaded = _definition_snapshot._DefinitionSnapshot(self._snapshot_path).wrap(
+            "bases", source, _definition_snapshot._base_to_mapping, decode
+        )
+
+        self.assertEqual(source, reloaded)
+        decode.assert_called_once()
+
+    def _load_all(self) -> tuple[dict[str, BaseMetadata], dict[str, AgentMetadata], dict[str, ExtensionMetadata]]:
+        bases, agents, extensions = _definition_snapshot.load_definitions()
+        return dict(bases), dict(agents), dict(extensions)
+
+    def _reset_loaders(self) -> None:
+        self._base_loader.reset_mock()
+        self._agent_loader.reset_mock()
+        self._extension_loader.reset_mock()
+
+
+def _bases(base_dir: Path) -> dict[str, BaseMetadata]:
+    return {
+        "ubuntu": BaseMetadata(
+            from_image="ubuntu:latest",
+            base_image_distro="Ubuntu",
+            base_image_description="Default",
+            build_local=False,
+            local_definition_dir=base_dir,
+        )
+    }
+
+
+def _agents() -> dict[str, AgentMetadata]:
+    return {
+        "codex": AgentMetadata(
+            agent_path=["~/.codex"],
+            agent_full_name="Codex CLI",
+            agent_homepage="https://example.com",
+            build_local=False,
+            valid_bases={"ubuntu": "ghcr.io/aicage/aicage:codex-ubuntu"},
+            local_definition_dir=Path("/tmp/agent"),
+            base_exclude=["alpine"],
+        )
+    }
+
+
+def _extensions() -> dict[str, ExtensionMetadata]:
+    return {
+        "tools": ExtensionMetadata(
+            extension_id="tools",
+            name="Tools",
+            description="Extra tools",
+            directory=Path("/tmp/ext/tools"),
+            scripts_dir=Path("/tmp/ext/tools/scripts"),
+            dockerfile_path=None,
+        )
+    }
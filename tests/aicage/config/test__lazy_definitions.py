@@ -0,0 +1,36 @@
+from unittest import TestCase, mock
+
+from aicage.config._lazy_definitions import LazyDefinitions, merge_definitions
+
+
+class LazyDefinitionsTests(TestCase):
+    def test_lazy_definitions_loads_on_first_access(self) -> None:
+        loader = mock.Mock(return_value="value")
+        definitions = LazyDefinitions({"name": loader})
+
+        self.assertEqual(["name"], list(definitions))
+        self.assertEqual(1, len(definitions))
+        self.assertIn("name", definitions)
+        loader.assert_not_called()
+        self.assertEqual("value", definitions["name"])
+        self.assertEqual("value", definitions["name"])
+        loader.assert_called_once_with()
+
+    def test_lazy_definitions_raises_for_unknown_name(self) -> None:
+        definitions: LazyDefinitions[str] = LazyDefinitions({})
+
+        with self.assertRaises(KeyError):
+            _ = definitions["missing"]
+        self.assertIsNone(definitions.get("missing"))
+
+    def test_merge_definitions(self) -> None:
+        builtin_loader = mock.Mock(return_value="builtin")
+        builtin = LazyDefinitions({"codex": builtin_loader, "claude": mock.Mock(return_value="claude")})
+        custom = {"codex": "custom", "extra": "extra"}
+
+        merged = merge_definitions(builtin, custom)
+
+        self.assertEqual(["codex", "claude", "extra"], list(merged))
+        self.assertEqual("custom", merged["codex"])
+        self.assertEqual({"codex": "custom", "claude": "claude", "extra": "extra"}, merged)
+        builtin_loader.assert_not_called()
@@ -0,0 +1,103 @@
+import json
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from aicage.config._project_index import ProjectIndex, ProjectIndexEntry, index_entry
+from aicage.config.project_config import AgentConfig, ProjectConfig
+
+
+class ProjectIndexTests(TestCase):
+    def test_entries_rebuilds_missing_index(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            projects_dir = Path(tmp_dir)
+            (projects_dir / "a.yml").write_text(
+                "path: /repo/a\nagents:\n  codex:\n    base: ubuntu\n    image_ref: aicage:codex-ubuntu\n",
+                encoding="utf-8",
+            )
+            (projects_dir / "broken.yml").write_text("not: [yaml", encoding="utf-8")
+            (projects_dir / "list.yml").write_text("path: /repo/list\nagents:\n  - codex\n", encoding="utf-8")
+
+            entries = ProjectIndex(projects_dir).entries()
+
+            self.assertEqual(1, len(entries))
+            entry = entries[0]
+            self.assertEqual(("a.yml", "/repo/a"), (entry.config_file, entry.project_path))
+            self.assertEqual(["codex"], entry.agents)
+            self.assertEqual(["ubuntu"], entry.bases)
+            self.assertEqual(["aicage:codex-ubuntu"], entry.image_refs)
+            payload = json.loads((projects_dir / "index.json").read_text(encoding="utf-8"))
+            self.assertEqual(["a.yml"], list(payload["projects"]))
+
+    def test_entries_rebuilds_corrupt_index(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            projects_dir = Path(tmp_dir)
+            (projects_dir / "index.json").write_text('{"version": 1, "projects": {"a.yml": {}}}', encoding="utf-8")
+            (projects_dir / "a.yml").write_text("path: /repo/a\n", encoding="utf-8")
+
+            entries = ProjectIndex(projects_dir).entries()
+
+            self.assertEqual(["/repo/a"], [entry.project_path for entry in entries])
+
+    def test_get(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            index = ProjectIndex(Path(tmp_dir))
+            self.assertIsNone(index.get("a.yml"))
+            index.put(_entry("a.yml", "/repo/a"))
+
+            self.assertEqual(_entry("a.yml", "/repo/a"), index.get("a.yml"))
+
+    def test_put(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            index = ProjectIndex(Path(tmp_dir))
+            index.put(_entry("b.yml", "/repo/b"))
+            index.put(_entry("a.yml", "/repo/a"))
+            index.put(_entry("b.yml", "/repo/b2"))
+
+            entries = ProjectIndex(Path(tmp_dir)).entries()
+
+            self.assertEqual(["/repo/a", "/repo/b2"], [entry.project_path for entry in entries])
+
+    def test_remove(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            index = ProjectIndex(Path(tmp_dir))
+            index.put(_entry("a.yml", "/repo/a"))
+            index.put(_entry("b.yml", "/repo/b"))
+
+            index.remove(["a.yml", "missing.yml"])
+
+            self.assertEqual(["b.yml"], [entry.config_file for entry in index.entries()])
+
+    def test_index_entry(self) -> None:
+        config = ProjectConfig(
+            path="/repo",
+            agents={
+                "codex": AgentConfig(base="ubuntu", image_ref="aicage:codex-ubuntu"),
+                "claude": AgentConfig(base="ubuntu"),
+            },
+        )
+
+        entry = index_entry(Path("/projects/abc.yml"), config, "2026-01-01T00:00:00+00:00")
+
+        self.assertEqual(
+            ProjectIndexEntry(
+                config_file="abc.yml",
+                project_path="/repo",
+                agents=["claude", "codex"],
+                bases=["ubuntu"],
+                image_refs=["aicage:codex-ubuntu"],
+                last_used="2026-01-01T00:00:00+00:00",
+            ),
+            entry,
+        )
+
+
+def _entry(config_file: str, project_path: str) -> ProjectIndexEntry:
+    return ProjectIndexEntry(
+        config_file=config_file,
+        project_path=project_path,
+        agents=["codex"],
+        bases=["ubuntu"],
+        image_refs=[],
+        last_used="2026-01-01T00:00:00+00:00",
+    )
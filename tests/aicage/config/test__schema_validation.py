@@ -1,7 +1,9 @@
-from unittest import TestCase
+from typing import Any
+from unittest import TestCase, mock
 
-from aicage.config._schema_validation import load_schema, validate_schema_mapping
+from aicage.config._schema_validation import CompiledSchema, load_schema
 from aicage.config.errors import ConfigError
+from aicage.config.resources import find_packaged_path
 
 
 class SchemaValidationTests(TestCase):
@@ -10,7 +12,21 @@ class SchemaValidationTests(TestCase):
 
         self.assertIsInstance(payload.get("properties"), dict)
 
-    def test_validate_schema_mapping_applies_normalizer_and_validator(self) -> None:
+    def test_load_schema_caches_each_path(self) -> None:
+        load_schema.cache_clear()
+        self.addCleanup(load_schema.cache_clear)
+        with mock.patch(
+            "aicage.config._schema_validation.find_packaged_path",
+            wraps=find_packaged_path,
+        ) as find_mock:
+            for _ in range(2):
+                load_schema("validation/agent.schema.json")
+                load_schema("validation/base.schema.json")
+                load_schema("validation/extension.schema.json")
+
+        self.assertEqual(3, find_mock.call_count)
+
+    def test_validate_applies_normalizer_and_validator(self) -> None:
         schema = {
             "properties": {"name": {"type": "string"}, "enabled": {"type": "boolean"}},
             "required": ["name"],
@@ -22,28 +38,40 @@ class SchemaValidationTests(TestCase):
             _payload.setdefault("enabled", True)
             return _payload
 
-        def validator(value: object, schema_entry: dict[str, object], context: str) -> None:
-            if schema_entry.get("type") == "string" and not isinstance(value, str):
-                raise ConfigError(f"{context} must be a string.")
-            if schema_entry.get("type") == "boolean" and not isinstance(value, bool):
-                raise ConfigError(f"{context} must be a boolean.")
-
-        payload = validate_schema_mapping(
-            {"name": "agent"},
-            schema,
-            "example",
-            normalizer=normalizer,
-            value_validator=validator,
+        validator = mock.Mock()
+
+        payload = CompiledSchema(schema, "example", normalizer=normalizer, value_validator=validator).validate(
+            {"name": "agent"}
         )
 
         self.assertEqual({"name": "agent", "enabled": True}, payload)
+        validator.assert_has_calls(
+            [
+                mock.call("agent", {"type": "string"}, "example.name"),
+                mock.call(True, {"type": "boolean"}, "example.enabled"),
+            ]
+        )
 
-    def test_validate_schema_mapping_rejects_missing_keys(self) -> None:
-        schema = {"properties": {"name": {"type": "string"}}, "required": ["name"]}
+    def test_validate_rejects_non_mapping(self) -> None:
+        mapping: Any = ["name"]
         with self.assertRaises(ConfigError):
-            validate_schema_mapping({}, schema, "example")
+            CompiledSchema({}, "example").validate(mapping)
 
-    def test_validate_schema_mapping_rejects_unknown_keys(self) -> None:
+    def test_validate_rejects_missing_keys(self) -> None:
+        schema = {"properties": {"name": {"type": "string"}}, "required": ["name"]}
+        with self.assertRaises(ConfigError) as ctx:
+            CompiledSchema(schema, "example").validate({})
+        self.assertEqual("example missing required keys: name.", str(ctx.exception))
+
+    def test_validate_rejects_unknown_keys(self) -> None:
         schema = {"properties": {"name": {"type": "string"}}, "required": [], "additionalProperties": False}
-        with self.assertRaises(ConfigError):
-            validate_schema_mapping({"name": "agent", "extra": "value"}, schema, "example")
+        with self.assertRaises(ConfigError) as ctx:
+            CompiledSchema(schema, "example").validate({"name": "agent", "extra": "value"})
+        self.assertEqual("example contains unsupported keys: extra.", str(ctx.exception))
+
+    def test_validate_allows_unknown_keys_without_additional_properties(self) -> None:
+        schema = {"properties": {"name": {"type": "string"}}}
+
+        payload = CompiledSchema(schema, "example").validate({"name": "agent", "extra": "value"})
+
+        self.assertEqual({"name": "agent", "extra": "value"}, payload)
@@ -66,4 +66,248 @@ class ConfigStoreTests(TestCase):
                 with config_path.open("r", encoding="utf-8") as handle:
                     raw = yaml.safe_load(handle)
 
-            self.assertEqual(project_cfg.to_mapping(), raw)
+            self.assertEqual({**project_cfg.to_mapping(), "revision": 1}, raw)
+
+    def test_save_project_skips_unchanged_config(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            projects_dir = Path(tmp_dir)
+
+            with mock.patch(
+                    "aicage.config.config_store.PROJECTS_DIR",
+                    projects_dir,
+                ):
+                store = SettingsStore()
+                project_path = projects_dir / "project"
+                project_cfg = store.load_project(project_path)
+                project_cfg.agents["codex"] = AgentConfig(base="ubuntu")
+                store.save_project(project_path, project_cfg)
+                loaded = store.load_project(project_path)
+
+                with mock.patch.object(SettingsStore, "_save_yaml") as save_yaml:
+                    store.save_project(project_path, project_cfg)
+                    store.save_project(project_path, loaded)
+                    loaded.agents["codex"].docker_args = "--net=host"
+                    store.save_project(project_path, loaded)
+
+            save_yaml.assert_called_once()
+
+    def test_save_project_replaces_file_atomically(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            projects_dir = Path(tmp_dir)
+
+            with mock.patch(
+                    "aicage.config.config_store.PROJECTS_DIR",
+                    projects_dir,
+                ):
+                store = SettingsStore()
+                project_path = projects_dir / "project"
+                project_cfg = ProjectConfig(path=str(project_path), agents={"codex": AgentConfig(base="ubuntu")})
+                store.save_project(project_path, project_cfg)
+                project_cfg.agents["codex"].base = "fedora"
+
+                with mock.patch("aicage.config.config_store.dump_yaml_to", side_effect=OSError("disk full")):
+                    with self.assertRaises(OSError):
+                        store.save_project(project_path, project_cfg)
+
+                config_path = store.project_config_path(project_path)
+                raw = yaml.safe_load(config_path.read_text(encoding="utf-8"))
+                leftovers = [path.name for path in projects_dir.iterdir() if path.suffix == ".tmp"]
+
+            self.assertEqual("ubuntu", raw["agents"]["codex"]["base"])
+            self.assertEqual([], leftovers)
+            self.assertTrue(project_cfg.is_dirty())
+
+    def test_save_project_merges_concurrent_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            projects_dir = Path(tmp_dir)
+
+            with mock.patch(
+                    "aicage.config.config_store.PROJECTS_DIR",
+                    projects_dir,
+                ):
+                store = SettingsStore()
+                project_path = projects_dir / "project"
+                initial = store.load_project(project_path)
+                initial.agents["codex"] = AgentConfig(base="ubuntu")
+                store.save_project(project_path, initial)
+
+                first = store.load_project(project_path)
+                second = store.load_project(project_path)
+                first.agents["codex"].docker_args = "--net=host"
+                first.agents["claude"] = AgentConfig(base="debian")
+                second.agents["codex"].extensions = ["python"]
+                store.save_project(project_path, first)
+                store.save_project(project_path, second)
+
+                stored = store.load_project(project_path)
+
+            self.assertEqual(3, stored.revision)
+            self.assertEqual("--net=host", stored.agents["codex"].docker_args)
+            self.assertEqual(["python"], stored.agents["codex"].extensions)
+            self.assertEqual("debian", stored.agents["claude"].base)
+            self.assertEqual(stored, second)
+
+    def test_save_project_updates_index(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            projects_dir = Path(tmp_dir)
+
+            with mock.patch(
+                    "aicage.config.config_store.PROJECTS_DIR",
+                    projects_dir,
+                ):
+                store = SettingsStore()
+                project_path = projects_dir / "project"
+                project_cfg = store.load_project(project_path)
+                project_cfg.agents["codex"] = AgentConfig(base="ubuntu", image_ref="aicage:codex-ubuntu")
+                store.save_project(project_path, project_cfg)
+
+                entries = store.list_projects()
+
+            self.assertEqual(1, len(entries))
+            self.assertEqual(str(project_path), entries[0].project_path)
+            self.assertEqual(store.project_config_path(project_path).name, entries[0].config_file)
+            self.assertEqual(["codex"], entries[0].agents)
+            self.assertEqual(["aicage:codex-ubuntu"], entries[0].image_refs)
+
+    def test_list_projects(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            projects_dir = Path(tmp_dir)
+            legacy = projects_dir / "legacy.yml"
+            legacy.write_text("path: /repo/legacy\nagents:\n  codex:\n    base: ubuntu\n", encoding="utf-8")
+
+            with mock.patch(
+                    "aicage.config.config_store.PROJECTS_DIR",
+                    projects_dir,
+                ):
+                entries = SettingsStore().list_projects()
+
+            self.assertEqual(["/repo/legacy"], [entry.project_path for entry in entries])
+            self.assertEqual(["ubuntu"], entries[0].bases)
+
+    def test_record_use(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            projects_dir = Path(tmp_dir)
+
+            with mock.patch(
+                    "aicage.config.config_store.PROJECTS_DIR",
+                    projects_dir,
+                ):
+                store = SettingsStore()
+                project_path = projects_dir / "project"
+                project_cfg = store.load_project(project_path)
+                store.record_use(project_path, project_cfg)
+                self.assertEqual([], store.list_projects())
+
+                store.save_project(project_path, project_cfg)
+                config_file = store.project_config_path(project_path).name
+                fresh = store.list_projects()[0].last_used
+                store.record_use(project_path, project_cfg)
+                self.assertEqual(fresh, store.list_projects()[0].last_used)
+
+                with mock.patch("aicage.config.config_store._is_stale", return_value=True):
+                    with mock.patch("aicage.config.config_store._now", return_value="2099-01-01T00:00:00+00:00"):
+                        store.record_use(project_path, project_cfg)
+                entries = store.list_projects()
+
+            self.assertEqual([(config_file, "2099-01-01T00:00:00+00:00")], [
+                (entry.config_file, entry.last_used) for entry in entries
+            ])
+
+    def test_record_use_loads_config_only_when_stale(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            projects_dir = Path(tmp_dir)
+            with mock.patch("aicage.config.config_store.PROJECTS_DIR", projects_dir):
+                store = SettingsStore()
+                project_path = projects_dir / "project"
+                project_cfg = store.load_project(project_path)
+                project_cfg.agents["codex"] = AgentConfig(base="ubuntu")
+                store.save_project(project_path, project_cfg)
+                with mock.patch.object(store, "load_project", wraps=store.load_project) as load_mock:
+                    store.record_use(project_path)
+                    load_mock.assert_not_called()
+                    with (
+                        mock.patch("aicage.config.config_store._is_stale", return_value=True),
+                        mock.patch("aicage.config.config_store._now", return_value="2099-01-01T00:00:00+00:00"),
+                    ):
+                        store.record_use(project_path)
+                    load_mock.assert_called_once_with(project_path)
+                entries = store.list_projects()
+
+        self.assertEqual([("2099-01-01T00:00:00+00:00", ["codex"])], [
+            (entry.last_used, entry.agents) for entry in entries
+        ])
+
+    def test_find_projects_using_image(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            projects_dir = Path(tmp_dir)
+
+            with mock.patch(
+                    "aicage.config.config_store.PROJECTS_DIR",
+                    projects_dir,
+                ):
+                store = SettingsStore()
+                for name, image_ref in (("one", "aicage:codex-ubuntu"), ("two", "aicage:codex-debian")):
+                    project_path = projects_dir / name
+                    project_cfg = store.load_project(project_path)
+                    project_cfg.agents["codex"] = AgentConfig(image_ref=image_ref)
+                    store.save_project(project_path, project_cfg)
+
+                matches = store.find_projects_using_image("aicage:codex-ubuntu")
+                empty = store.find_projects_using_image("")
+
+            self.assertEqual(
+                [(str(projects_dir / "one"), store.project_config_path(projects_dir / "one"))],
+                matches,
+            )
+            self.assertEqual([], empty)
+
+    def test_remove_project(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            projects_dir = Path(tmp_dir)
+
+            with mock.patch(
+                    "aicage.config.config_store.PROJECTS_DIR",
+                    projects_dir,
+                ):
+                store = SettingsStore()
+                project_path = projects_dir / "project"
+                project_cfg = store.load_project(project_path)
+                project_cfg.agents["codex"] = AgentConfig(base="ubuntu")
+                store.save_project(project_path, project_cfg)
+
+                removed = store.remove_project(project_path)
+                removed_again = store.remove_project(project_path)
+                entries = store.list_projects()
+                leftovers = sorted(path.name for path in projects_dir.iterdir())
+                config_lock = f"{store.project_config_path(project_path).name}.lock"
+
+            self.assertTrue(removed)
+            self.assertFalse(removed_again)
+            self.assertEqual([], entries)
+            # Lock sidecars stay behind so no waiter ever locks an unlinked file.
+            self.assertEqual(sorted([config_lock, "index.json", "index.json.lock"]), leftovers)
+
+    def test_prune_missing_projects(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            projects_dir = Path(tmp_dir) / "projects"
+            kept_path = Path(tmp_dir) / "kept"
+            kept_path.mkdir()
+            gone_path = Path(tmp_dir) / "gone"
+
+            with mock.patch(
+                    "aicage.config.config_store.PROJECTS_DIR",
+                    projects_dir,
+                ):
+                store = SettingsStore()
+                for project_path in (kept_path, gone_path):
+                    project_cfg = store.load_project(project_path)
+                    project_cfg.agents["codex"] = AgentConfig(base="ubuntu")
+                    store.save_project(project_path, project_cfg)
+
+                removed = store.prune_missing_projects()
+                entries = store.list_projects()
+                gone_exists = store.project_config_path(gone_path).exists()
+
+            self.assertEqual([str(gone_path)], [entry.project_path for entry in removed])
+            self.assertEqual([str(kept_path)], [entry.project_path for entry in entries])
+            self.assertFalse(gone_exists)
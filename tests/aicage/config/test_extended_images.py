@@ -40,7 +40,7 @@ class ExtendedImagesLoaderTests(TestCase):
                 "aicage.config.extended_images.IMAGE_EXTENDED_STATE_DIR",
                 Path(images_dir),
             ):
-                configs = extended_images_module.load_extended_images(set())
+                configs = extended_images_module.load_extended_images("codex", set())
 
         self.assertEqual({}, configs)
 
@@ -53,7 +53,7 @@ class ExtendedImagesLoaderTests(TestCase):
                 "aicage.config.extended_images.IMAGE_EXTENDED_STATE_DIR",
                 Path(images_dir),
             ):
-                configs = extended_images_module.load_extended_images(set())
+                configs = extended_images_module.load_extended_images("codex", set())
 
         self.assertEqual({}, configs)
 
@@ -76,7 +76,7 @@ class ExtendedImagesLoaderTests(TestCase):
                 "aicage.config.extended_images.IMAGE_EXTENDED_STATE_DIR",
                 Path(images_dir),
             ):
-                configs = extended_images_module.load_extended_images({"marker"})
+                configs = extended_images_module.load_extended_images("codex", {"marker"})
 
         self.assertIn("custom", configs)
         self.assertEqual("codex", configs["custom"].agent)
@@ -91,7 +91,7 @@ class ExtendedImagesLoaderTests(TestCase):
                 Path(images_dir),
             ):
                 with self.assertRaises(ConfigError):
-                    extended_images_module.load_extended_images(set())
+                    extended_images_module.load_extended_images("codex", set())
 
     def test_load_extended_images_rejects_invalid_yaml(self) -> None:
         with tempfile.TemporaryDirectory() as tmp_dir:
@@ -105,7 +105,7 @@ class ExtendedImagesLoaderTests(TestCase):
                 Path(images_dir),
             ):
                 with self.assertRaises(ConfigError):
-                    extended_images_module.load_extended_images({"marker"})
+                    extended_images_module.load_extended_images("codex", {"marker"})
 
     def test_load_extended_images_reports_read_failure(self) -> None:
         with tempfile.TemporaryDirectory() as tmp_dir:
@@ -134,7 +134,7 @@ class ExtendedImagesLoaderTests(TestCase):
                 Path(images_dir),
             ):
                 with self.assertRaises(ConfigError):
-                    extended_images_module.load_extended_images(set())
+                    extended_images_module.load_extended_images("codex", set())
 
     def test_load_extended_images_rejects_blank_values(self) -> None:
         with tempfile.TemporaryDirectory() as tmp_dir:
@@ -156,7 +156,7 @@ class ExtendedImagesLoaderTests(TestCase):
                 Path(images_dir),
             ):
                 with self.assertRaises(ConfigError):
-                    extended_images_module.load_extended_images(set())
+                    extended_images_module.load_extended_images("codex", set())
 
     def test_load_extended_images_rejects_invalid_extensions_list(self) -> None:
         with tempfile.TemporaryDirectory() as tmp_dir:
@@ -180,7 +180,7 @@ class ExtendedImagesLoaderTests(TestCase):
                 Path(images_dir),
             ):
                 with self.assertRaises(ConfigError):
-                    extended_images_module.load_extended_images(set())
+                    extended_images_module.load_extended_images("codex", set())
 
     def test_load_extended_images_rejects_blank_extension_items(self) -> None:
         with tempfile.TemporaryDirectory() as tmp_dir:
@@ -205,7 +205,7 @@ class ExtendedImagesLoaderTests(TestCase):
                 Path(images_dir),
             ):
                 with self.assertRaises(ConfigError):
-                    extended_images_module.load_extended_images(set())
+                    extended_images_module.load_extended_images("codex", set())
 
     def test_load_extended_images_requires_required_keys(self) -> None:
         with tempfile.TemporaryDirectory() as tmp_dir:
@@ -228,7 +228,7 @@ class ExtendedImagesLoaderTests(TestCase):
                 Path(images_dir),
             ):
                 with self.assertRaises(ConfigError):
-                    extended_images_module.load_extended_images(set())
+                    extended_images_module.load_extended_images("codex", set())
 
     def test_write_extended_image_config_writes_file(self) -> None:
         with tempfile.TemporaryDirectory() as tmp_dir:
@@ -246,3 +246,91 @@ class ExtendedImagesLoaderTests(TestCase):
             payload = load_yaml(config_path)
             self.assertEqual("codex", payload.get("agent"))
             self.assertEqual(["extra"], payload.get("extensions"))
+
+    def test_load_extended_images_filters_by_agent_and_reuses_catalog(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            images_dir = Path(tmp_dir) / "image-extended"
+            for name, agent in (("codex-marker", "codex"), ("claude-marker", "claude")):
+                config_dir = images_dir / name
+                config_dir.mkdir(parents=True)
+                (config_dir / "image-extended.yml").write_text(
+                    extended_image_definition(
+                        agent=agent,
+                        base="ubuntu",
+                        extensions=["marker"],
+                        image_ref=f"{DEFAULT_EXTENDED_IMAGE_NAME}:{name}",
+                    ),
+                    encoding="utf-8",
+                )
+            with mock.patch(
+                "aicage.config.extended_images.IMAGE_EXTENDED_STATE_DIR",
+                Path(images_dir),
+            ):
+                configs = extended_images_module.load_extended_images("codex", {"marker"})
+                with mock.patch("aicage.config.extended_images.load_yaml") as load_mock:
+                    cached = extended_images_module.load_extended_images("claude", {"marker"})
+                    skipped = extended_images_module.load_extended_images("claude", set())
+                catalog_exists = (Path(tmp_dir) / "catalog.json").is_file()
+
+        self.assertEqual(["codex-marker"], list(configs))
+        self.assertEqual(images_dir / "codex-marker" / "image-extended.yml", configs["codex-marker"].path)
+        self.assertEqual(["claude-marker"], list(cached))
+        self.assertEqual({}, skipped)
+        load_mock.assert_not_called()
+        self.assertTrue(catalog_exists)
+
+    def test_load_extended_images_rescans_edited_definition(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            images_dir = Path(tmp_dir) / "image-extended"
+            config_path = images_dir / "custom" / "image-extended.yml"
+            config_path.parent.mkdir(parents=True)
+            config_path.write_text(
+                extended_image_definition(
+                    agent="codex",
+                    base="ubuntu",
+                    extensions=[],
+                    image_ref=f"{DEFAULT_EXTENDED_IMAGE_NAME}:custom",
+                ),
+                encoding="utf-8",
+            )
+            with mock.patch(
+                "aicage.config.extended_images.IMAGE_EXTENDED_STATE_DIR",
+                Path(images_dir),
+            ):
+                extended_images_module.load_extended_images("codex", set())
+                config_path.write_text(
+                    extended_image_definition(
+                        agent="codex",
+                        base="debian",
+                        extensions=[],
+                        image_ref=f"{DEFAULT_EXTENDED_IMAGE_NAME}:custom-debian",
+                    ),
+                    encoding="utf-8",
+                )
+                configs = extended_images_module.load_extended_images("codex", set())
+
+        self.assertEqual("debian", configs["custom"].base)
+
+    def test_write_extended_image_config_updates_catalog(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            images_dir = Path(tmp_dir) / "image-extended"
+            images_dir.mkdir()
+            with mock.patch(
+                "aicage.config.extended_images.IMAGE_EXTENDED_STATE_DIR",
+                Path(images_dir),
+            ):
+                self.assertEqual({}, extended_images_module.load_extended_images("codex", {"extra"}))
+                config = ExtendedImageConfig(
+                    name="custom",
+                    agent="codex",
+                    base="ubuntu",
+                    extensions=["extra"],
+                    image_ref=f"{DEFAULT_EXTENDED_IMAGE_NAME}:codex-ubuntu-extra",
+                    path=extended_images_module.extended_image_config_path("custom"),
+                )
+                extended_images_module.write_extended_image_config(config)
+                with mock.patch("aicage.config.extended_images.load_yaml") as load_mock:
+                    configs = extended_images_module.load_extended_images("codex", {"extra"})
+
+        self.assertEqual({"custom": config}, configs)
+        load_mock.assert_not_called()
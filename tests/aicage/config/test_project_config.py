@@ -6,6 +6,7 @@ from aicage.config.project_config import (
     _DOCKER_ARGS_KEY,
     _PROJECT_AGENTS_KEY,
     _PROJECT_PATH_KEY,
+    PROJECT_REVISION_KEY,
     AgentConfig,
     ProjectConfig,
 )
@@ -23,3 +24,65 @@ class ProjectConfigTests(TestCase):
             {_PROJECT_PATH_KEY: "/repo", _PROJECT_AGENTS_KEY: {"codex": {_AGENT_BASE_KEY: "ubuntu"}}},
             cfg.to_mapping(),
         )
+
+    def test_is_dirty(self) -> None:
+        self.assertTrue(ProjectConfig(path="/repo").is_dirty())
+
+        data = {_PROJECT_PATH_KEY: "/repo", _PROJECT_AGENTS_KEY: {"codex": {_AGENT_BASE_KEY: "ubuntu"}}}
+        cfg = ProjectConfig.from_mapping(Path("/repo"), data)
+        self.assertFalse(cfg.is_dirty())
+
+        cfg.agents["codex"].extensions.append("python")
+        self.assertTrue(cfg.is_dirty())
+
+    def test_is_dirty_for_legacy_mapping(self) -> None:
+        data = {_PROJECT_AGENTS_KEY: {"codex": {}}, _DOCKER_ARGS_KEY: "--net=host"}
+        cfg = ProjectConfig.from_mapping(Path("/repo"), data)
+
+        self.assertTrue(cfg.is_dirty())
+
+    def test_mark_saved(self) -> None:
+        cfg = ProjectConfig(path="/repo", agents={"codex": AgentConfig(base="ubuntu")})
+
+        cfg.mark_saved(4)
+        self.assertFalse(cfg.is_dirty())
+        self.assertEqual(4, cfg.revision)
+
+        cfg.agents["codex"].base = "fedora"
+        self.assertTrue(cfg.is_dirty())
+
+    def test_from_mapping_reads_revision(self) -> None:
+        data = {_PROJECT_PATH_KEY: "/repo", _PROJECT_AGENTS_KEY: {}, PROJECT_REVISION_KEY: 7}
+        cfg = ProjectConfig.from_mapping(Path("/repo"), data)
+
+        self.assertEqual(7, cfg.revision)
+        self.assertFalse(cfg.is_dirty())
+
+    def test_merge_from(self) -> None:
+        base = {
+            _PROJECT_PATH_KEY: "/repo",
+            _PROJECT_AGENTS_KEY: {
+                "codex": {_AGENT_BASE_KEY: "ubuntu", _DOCKER_ARGS_KEY: "--old"},
+                "claude": {_AGENT_BASE_KEY: "ubuntu"},
+            },
+        }
+        cfg = ProjectConfig.from_mapping(Path("/repo"), base)
+        codex_cfg = cfg.agents["codex"]
+        codex_cfg.docker_args = "--mine"
+        cfg.agents["goose"] = AgentConfig(base="alpine")
+        theirs = {
+            _PROJECT_PATH_KEY: "/repo",
+            _PROJECT_AGENTS_KEY: {
+                "codex": {_AGENT_BASE_KEY: "fedora", _DOCKER_ARGS_KEY: "--theirs"},
+                "qwen": {_AGENT_BASE_KEY: "debian"},
+            },
+            PROJECT_REVISION_KEY: 2,
+        }
+
+        cfg.merge_from(theirs)
+
+        self.assertIs(codex_cfg, cfg.agents["codex"])
+        self.assertEqual("fedora", codex_cfg.base)
+        self.assertEqual("--mine", codex_cfg.docker_args)
+        self.assertEqual(["codex", "goose", "qwen"], list(cfg.agents))
+        self.assertEqual("alpine", cfg.agents["goose"].base)
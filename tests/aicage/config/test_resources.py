@@ -1,11 +1,60 @@
-from unittest import TestCase
+import tempfile
+from pathlib import Path
+from unittest import TestCase, mock
 
+from aicage.config import resources
+from aicage.config.errors import ConfigError
 from aicage.config.resources import find_packaged_path
 
 
 class ResourcesTests(TestCase):
+    def setUp(self) -> None:
+        self._clear_caches()
+        self.addCleanup(self._clear_caches)
+
+    def test_packaged_config_root_finds_repo_config(self) -> None:
+        root = resources.packaged_config_root()
+
+        self.assertTrue((root / "agent-build" / "Dockerfile").is_file())
+        self.assertEqual("config", root.name)
+
+    def test_packaged_config_root_is_memoized(self) -> None:
+        with mock.patch.object(Path, "is_file", autospec=True, side_effect=Path.is_file) as is_file_mock:
+            first = resources.packaged_config_root()
+            calls = is_file_mock.call_count
+            second = resources.packaged_config_root()
+
+        self.assertEqual(first, second)
+        self.assertEqual(calls, is_file_mock.call_count)
+
     def test_find_packaged_path_finds_repo_config(self) -> None:
         path = find_packaged_path("validation/agent.schema.json")
 
         self.assertTrue(path.is_file())
         self.assertEqual("agent.schema.json", path.name)
+
+    def test_find_packaged_path_raises_for_missing_file(self) -> None:
+        with self.assertRaises(ConfigError):
+            find_packaged_path("validation/missing.schema.json")
+
+    def test_list_packaged_dirs(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            (root / "agent-build" / "agents" / "codex").mkdir(parents=True)
+            (root / "agent-build" / "agents" / "claude").mkdir()
+            (root / "agent-build" / "agents" / "README.md").write_text("", encoding="utf-8")
+            with mock.patch.object(resources, "packaged_config_root", return_value=root):
+                entries = resources.list_packaged_dirs("agent-build/agents")
+                (root / "agent-build" / "agents" / "goose").mkdir()
+                cached = resources.list_packaged_dirs("agent-build/agents")
+                with self.assertRaises(ConfigError):
+                    resources.list_packaged_dirs("base-build/bases")
+
+        self.assertEqual(("claude", "codex"), tuple(entry.name for entry in entries))
+        self.assertEqual(entries, cached)
+
+    @staticmethod
+    def _clear_caches() -> None:
+        resources.packaged_config_root.cache_clear()
+        find_packaged_path.cache_clear()
+        resources.list_packaged_dirs.cache_clear()
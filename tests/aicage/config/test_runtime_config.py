@@ -38,14 +38,9 @@ class RuntimeConfigTests(TestCase):
                 mock.patch("aicage.config.runtime_config.SettingsStore", new=store_factory),
                 mock.patch("aicage.config.runtime_config.Path.cwd", return_value=project_path),
                 mock.patch("aicage.config.runtime_config.resolve_docker_args", return_value=(mounts, env)),
-                mock.patch("aicage.config.runtime_config.load_extensions", return_value={}),
                 mock.patch(
-                    "aicage.config.runtime_config.load_bases",
-                    return_value=self._get_bases(),
-                ),
-                mock.patch(
-                    "aicage.config.runtime_config.load_agents",
-                    return_value=self._get_agents(),
+                    "aicage.config.runtime_config.load_definitions",
+                    return_value=(self._get_bases(), self._get_agents(), {}),
                 ),
                 mock.patch(
                     "aicage.config.runtime_config.select_agent_image",
@@ -92,14 +87,9 @@ class RuntimeConfigTests(TestCase):
                 mock.patch("aicage.config.runtime_config.SettingsStore", new=store_factory),
                 mock.patch("aicage.config.runtime_config.Path.cwd", return_value=project_path),
                 mock.patch("aicage.config.runtime_config.resolve_docker_args", return_value=([], [])),
-                mock.patch("aicage.config.runtime_config.load_extensions", return_value={}),
-                mock.patch(
-                    "aicage.config.runtime_config.load_bases",
-                    return_value=self._get_bases(),
-                ),
                 mock.patch(
-                    "aicage.config.runtime_config.load_agents",
-                    return_value=self._get_agents(),
+                    "aicage.config.runtime_config.load_definitions",
+                    return_value=(self._get_bases(), self._get_agents(), {}),
                 ),
                 mock.patch(
                     "aicage.config.runtime_config.select_agent_image",
@@ -133,14 +123,9 @@ class RuntimeConfigTests(TestCase):
                 mock.patch("aicage.config.runtime_config.SettingsStore", new=store_factory),
                 mock.patch("aicage.config.runtime_config.Path.cwd", return_value=project_path),
                 mock.patch("aicage.config.runtime_config.resolve_docker_args", return_value=([], [])),
-                mock.patch("aicage.config.runtime_config.load_extensions", return_value={}),
-                mock.patch(
-                    "aicage.config.runtime_config.load_bases",
-                    return_value=self._get_bases(),
-                ),
                 mock.patch(
-                    "aicage.config.runtime_config.load_agents",
-                    return_value=self._get_agents(),
+                    "aicage.config.runtime_config.load_definitions",
+                    return_value=(self._get_bases(), self._get_agents(), {}),
                 ),
                 mock.patch(
                     "aicage.config.runtime_config.select_agent_image",
@@ -20,20 +20,22 @@ class LocalBuildRunnerTests(TestCase):
         run_config = build_run_config()
         with tempfile.TemporaryDirectory() as tmp_dir:
             log_path = Path(tmp_dir) / "logs" / "build.log"
+            dockerfile_path = _write_agent_dockerfile(Path(tmp_dir))
+            dockerfiles: list[str] = []
             with (
-                mock.patch(
-                    "aicage.docker.build.find_packaged_path",
-                    return_value=Path("/tmp/build/Dockerfile"),
-                ),
+                mock.patch("aicage.docker.build.find_packaged_path", return_value=dockerfile_path),
                 mock.patch(
                     "aicage.docker.build.subprocess.run",
-                    return_value=mock.Mock(returncode=0),
+                    side_effect=lambda command, **_: _read_dockerfile(command, dockerfiles),
                 ) as run_mock,
+                mock.patch("aicage.docker.build.agent_definition_hash", return_value="def123"),
+                mock.patch.dict("os.environ", {}, clear=True),
             ):
                 build.run_build(
                     run_config=run_config,
                     base_image_ref="ghcr.io/aicage/aicage-image-base:ubuntu",
                     image_ref="aicage:claude-ubuntu",
+                    agent_version="1.2.3",
                     log_path=log_path,
                 )
 
@@ -43,19 +45,34 @@ class LocalBuildRunnerTests(TestCase):
             [
                 "docker",
                 "build",
-                "--no-cache",
                 "--file",
-                str(Path("/tmp/build/Dockerfile")),
+                command[3],
                 "--build-arg",
                 "BASE_IMAGE=ghcr.io/aicage/aicage-image-base:ubuntu",
                 "--build-arg",
                 "AGENT=claude",
+                "--build-arg",
+                "AGENT_VERSION=1.2.3",
+                "--build-arg",
+                "AGENT_DEFINITION_HASH=def123",
                 "--tag",
                 "aicage:claude-ubuntu",
                 str(Path("/tmp/build")),
             ],
             command,
         )
+        self.assertNotEqual(str(dockerfile_path), command[3])
+        self.assertEqual(
+            [
+                "ARG BASE_IMAGE",
+                "FROM ${BASE_IMAGE} AS runtime",
+                "ARG AGENT_VERSION",
+                "ARG AGENT_DEFINITION_HASH",
+                "ARG AGENT",
+                "RUN /tmp/agents/${AGENT}/install.sh",
+            ],
+            dockerfiles[0].splitlines(),
+        )
 
     def test_run_build_raises_on_failure(self) -> None:
         run_config = build_run_config()
@@ -64,30 +81,82 @@ class LocalBuildRunnerTests(TestCase):
             with (
                 mock.patch(
                     "aicage.docker.build.find_packaged_path",
-                    return_value=Path("/tmp/build/Dockerfile"),
+                    return_value=_write_agent_dockerfile(Path(tmp_dir)),
                 ),
                 mock.patch(
                     "aicage.docker.build.subprocess.run",
                     return_value=mock.Mock(returncode=1),
                 ),
+                mock.patch("aicage.docker.build.agent_definition_hash", return_value="def123"),
                 self.assertRaises(DockerError),
             ):
                 build.run_build(
                     run_config=run_config,
                     base_image_ref="ghcr.io/aicage/aicage-image-base:ubuntu",
                     image_ref="aicage:claude-ubuntu",
+                    agent_version="1.2.3",
+                    log_path=log_path,
+                )
+
+    def test_run_build_forces_no_cache_when_requested(self) -> None:
+        run_config = build_run_config()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            log_path = Path(tmp_dir) / "logs" / "build.log"
+            with (
+                mock.patch(
+                    "aicage.docker.build.find_packaged_path",
+                    return_value=_write_agent_dockerfile(Path(tmp_dir)),
+                ),
+                mock.patch(
+                    "aicage.docker.build.subprocess.run",
+                    return_value=mock.Mock(returncode=0),
+                ) as run_mock,
+                mock.patch("aicage.docker.build.agent_definition_hash", return_value="def123"),
+                mock.patch.dict("os.environ", {"AICAGE_BUILD_NO_CACHE": "1"}),
+            ):
+                build.run_build(
+                    run_config=run_config,
+                    base_image_ref="ghcr.io/aicage/aicage-image-base:ubuntu",
+                    image_ref="aicage:claude-ubuntu",
+                    agent_version="1.2.3",
                     log_path=log_path,
                 )
 
+        self.assertEqual(["docker", "build", "--no-cache"], run_mock.call_args.args[0][:3])
+
+    def test_run_build_rejects_dockerfile_without_stage(self) -> None:
+        run_config = build_run_config()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            dockerfile_path = Path(tmp_dir) / "build" / "Dockerfile"
+            dockerfile_path.parent.mkdir()
+            dockerfile_path.write_text("ARG AGENT\n", encoding="utf-8")
+            with (
+                mock.patch("aicage.docker.build.find_packaged_path", return_value=dockerfile_path),
+                mock.patch("aicage.docker.build.subprocess.run") as run_mock,
+                mock.patch("aicage.docker.build.agent_definition_hash", return_value="def123"),
+                self.assertRaises(DockerError),
+            ):
+                build.run_build(
+                    run_config=run_config,
+                    base_image_ref="ghcr.io/aicage/aicage-image-base:ubuntu",
+                    image_ref="aicage:claude-ubuntu",
+                    agent_version="1.2.3",
+                    log_path=Path(tmp_dir) / "logs" / "build.log",
+                )
+        run_mock.assert_not_called()
+
     def test_run_custom_base_build_invokes_docker(self) -> None:
         with tempfile.TemporaryDirectory() as tmp_dir:
             log_path = Path(tmp_dir) / "logs" / "build.log"
             dockerfile_path = Path(tmp_dir) / "Dockerfile"
             dockerfile_path.write_text("FROM ubuntu:latest\n", encoding="utf-8")
-            with mock.patch(
-                "aicage.docker.build.subprocess.run",
-                return_value=CompletedProcess([], 0),
-            ) as run_mock:
+            with (
+                mock.patch(
+                    "aicage.docker.build.subprocess.run",
+                    return_value=CompletedProcess([], 0),
+                ) as run_mock,
+                mock.patch.dict("os.environ", {}, clear=True),
+            ):
                 build.run_custom_base_build(
                     dockerfile_path=dockerfile_path,
                     build_root=Path(tmp_dir),
@@ -101,7 +170,6 @@ class LocalBuildRunnerTests(TestCase):
             [
                 "docker",
                 "build",
-                "--no-cache",
                 "--file",
                 str(dockerfile_path),
                 "--build-arg",
@@ -133,9 +201,71 @@ class LocalBuildRunnerTests(TestCase):
                     log_path=log_path,
                 )
 
-    def test_run_extended_build_builds_all_extensions(self) -> None:
+    def test_run_extended_build_builds_all_extensions_in_one_build(self) -> None:
         run_config = _run_config()
         extensions = [_extension("extra"), _extension("more")]
+        dockerfiles: list[str] = []
+
+        def _run(command: list[str], **_: object) -> CompletedProcess[str]:
+            dockerfile_path = Path(command[command.index("--file") + 1])
+            dockerfiles.append(dockerfile_path.read_text(encoding="utf-8"))
+            return CompletedProcess(command, 0)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            log_path = Path(tmp_dir) / "build.log"
+            with (
+                mock.patch("aicage.docker.build.subprocess.run", side_effect=_run) as run_mock,
+                mock.patch("aicage.docker.build._cleanup_intermediate_images") as cleanup_mock,
+            ):
+                build.run_extended_build(
+                    run_config=run_config,
+                    base_image_ref="ghcr.io/aicage/aicage:codex-ubuntu",
+                    extensions=extensions,
+                    log_path=log_path,
+                )
+
+        run_mock.assert_called_once()
+        cleanup_mock.assert_not_called()
+        command = run_mock.call_args.args[0]
+        self.assertIn(f"extension-1-context={Path('/tmp/ext')}", command)
+        self.assertIn(f"extension-2-context={Path('/tmp/ext')}", command)
+        self.assertEqual(run_config.selection.image_ref, command[command.index("--tag") + 1])
+        self.assertIn("FROM ghcr.io/aicage/aicage:codex-ubuntu AS extension-1", dockerfiles[0])
+        self.assertIn("FROM extension-1 AS extension-2", dockerfiles[0])
+        self.assertIn("--mount=type=bind,from=extension-2-context,source=scripts,", dockerfiles[0])
+
+    def test_run_extended_build_tags_prefix_stages(self) -> None:
+        run_config = _run_config()
+        extensions = [_extension("extra"), _extension("more"), _extension("last")]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            log_path = Path(tmp_dir) / "build.log"
+            with mock.patch(
+                "aicage.docker.build.subprocess.run",
+                return_value=CompletedProcess([], 0),
+            ) as run_mock:
+                build.run_extended_build(
+                    run_config=run_config,
+                    base_image_ref="ghcr.io/aicage/aicage:codex-ubuntu",
+                    extensions=extensions,
+                    log_path=log_path,
+                    prefix_refs=["aicage-extended:prefix-1", "aicage-extended:prefix-2"],
+                )
+
+        commands = [call.args[0] for call in run_mock.call_args_list]
+        self.assertEqual(3, len(commands))
+        self.assertNotIn("--target", commands[0])
+        for command, stage, prefix_ref in zip(
+            commands[1:],
+            ["extension-1", "extension-2"],
+            ["aicage-extended:prefix-1", "aicage-extended:prefix-2"],
+            strict=True,
+        ):
+            self.assertEqual(stage, command[command.index("--target") + 1])
+            self.assertEqual(prefix_ref, command[command.index("--tag") + 1])
+
+    def test_run_extended_build_keeps_chained_prefix_images(self) -> None:
+        run_config = _run_config()
+        extensions = [_extension("extra", dockerfile_path=Path("/tmp/ext/Dockerfile")), _extension("more")]
         with tempfile.TemporaryDirectory() as tmp_dir:
             log_path = Path(tmp_dir) / "build.log"
             with (
@@ -154,13 +284,16 @@ class LocalBuildRunnerTests(TestCase):
                     base_image_ref="ghcr.io/aicage/aicage:codex-ubuntu",
                     extensions=extensions,
                     log_path=log_path,
+                    prefix_refs=["aicage-extended:prefix-1"],
                 )
-        self.assertEqual(2, run_mock.call_count)
-        cleanup_mock.assert_called_once()
 
-    def test_run_extended_build_raises_on_failure(self) -> None:
+        first_command = run_mock.call_args_list[0].args[0]
+        self.assertEqual("aicage-extended:prefix-1", first_command[first_command.index("--tag") + 1])
+        cleanup_mock.assert_called_once_with([])
+
+    def test_run_extended_build_chains_builds_for_custom_dockerfiles(self) -> None:
         run_config = _run_config()
-        extension = _extension("extra")
+        extensions = [_extension("extra"), _extension("more", dockerfile_path=Path("/tmp/ext/Dockerfile"))]
         with tempfile.TemporaryDirectory() as tmp_dir:
             log_path = Path(tmp_dir) / "build.log"
             with (
@@ -168,6 +301,27 @@ class LocalBuildRunnerTests(TestCase):
                     "aicage.docker.build.find_packaged_path",
                     return_value=Path("/tmp/Dockerfile"),
                 ),
+                mock.patch(
+                    "aicage.docker.build.subprocess.run",
+                    return_value=CompletedProcess([], 0),
+                ) as run_mock,
+                mock.patch("aicage.docker.build._cleanup_intermediate_images") as cleanup_mock,
+            ):
+                build.run_extended_build(
+                    run_config=run_config,
+                    base_image_ref="ghcr.io/aicage/aicage:codex-ubuntu",
+                    extensions=extensions,
+                    log_path=log_path,
+                )
+        self.assertEqual(2, run_mock.call_count)
+        cleanup_mock.assert_called_once()
+
+    def test_run_extended_build_raises_on_failure(self) -> None:
+        run_config = _run_config()
+        extension = _extension("extra")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            log_path = Path(tmp_dir) / "build.log"
+            with (
                 mock.patch(
                     "aicage.docker.build.subprocess.run",
                     return_value=CompletedProcess([], 1),
@@ -195,14 +349,29 @@ class LocalBuildRunnerTests(TestCase):
         logger.warning.assert_called_once()
 
 
-def _extension(extension_id: str) -> ExtensionMetadata:
+def _write_agent_dockerfile(root: Path) -> Path:
+    dockerfile_path = root / "build" / "Dockerfile"
+    dockerfile_path.parent.mkdir(parents=True, exist_ok=True)
+    dockerfile_path.write_text(
+        "ARG BASE_IMAGE\nFROM ${BASE_IMAGE} AS runtime\nARG AGENT\nRUN /tmp/agents/${AGENT}/install.sh\n",
+        encoding="utf-8",
+    )
+    return dockerfile_path
+
+
+def _read_dockerfile(command: list[str], dockerfiles: list[str]) -> mock.Mock:
+    dockerfiles.append(Path(command[command.index("--file") + 1]).read_text(encoding="utf-8"))
+    return mock.Mock(returncode=0)
+
+
+def _extension(extension_id: str, dockerfile_path: Path | None = None) -> ExtensionMetadata:
     return ExtensionMetadata(
         extension_id=extension_id,
         name=extension_id,
         description="desc",
         directory=Path("/tmp/ext"),
         scripts_dir=Path("/tmp/ext/scripts"),
-        dockerfile_path=None,
+        dockerfile_path=dockerfile_path,
     )
 
 
@@ -2,7 +2,10 @@ import tempfile
 from pathlib import Path
 from unittest import TestCase, mock
 
-from aicage.docker.pull import run_pull
+from docker.errors import APIError
+
+from aicage.docker.errors import DockerError
+from aicage.docker.pull import run_pull, tag_image
 
 
 class DockerPullTests(TestCase):
@@ -17,3 +20,60 @@ class DockerPullTests(TestCase):
             payload = log_path.read_text(encoding="utf-8")
         self.assertIn('"status": "downloaded"', payload)
         self.assertIn("done", payload)
+
+    def test_tag_image(self) -> None:
+        client = mock.Mock()
+        with mock.patch("aicage.docker.pull.get_docker_client", return_value=client):
+            tag_image("ghcr.io/aicage/aicage@sha256:abc", "ghcr.io/aicage/aicage:codex-ubuntu")
+
+        client.api.tag.assert_called_once_with(
+            "ghcr.io/aicage/aicage@sha256:abc",
+            "ghcr.io/aicage/aicage",
+            "codex-ubuntu",
+            force=True,
+        )
+
+    def test_tag_image_defaults_to_latest(self) -> None:
+        client = mock.Mock()
+        with mock.patch("aicage.docker.pull.get_docker_client", return_value=client):
+            tag_image("localhost:5000/repo@sha256:abc", "localhost:5000/repo")
+
+        client.api.tag.assert_called_once_with(
+            "localhost:5000/repo@sha256:abc",
+            "localhost:5000/repo",
+            "latest",
+            force=True,
+        )
+
+    def test_tag_image_raises_docker_error(self) -> None:
+        client = mock.Mock()
+        client.api.tag.side_effect = APIError("boom")
+        with mock.patch("aicage.docker.pull.get_docker_client", return_value=client):
+            with self.assertRaises(DockerError):
+                tag_image("repo@sha256:abc", "repo:tag")
+
+    def test_run_pull_invalidates_image_inspection(self) -> None:
+        client = mock.Mock()
+        client.api.pull.return_value = []
+        inspector = mock.Mock()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with (
+                mock.patch("aicage.docker.pull.get_docker_client", return_value=client),
+                mock.patch("aicage.docker.pull.get_image_inspector", return_value=inspector),
+            ):
+                run_pull("ghcr.io/aicage/aicage:latest", Path(tmp_dir) / "pull.log")
+
+        inspector.invalidate.assert_called_once_with()
+
+    def test_tag_image_invalidates_image_inspection(self) -> None:
+        client = mock.Mock()
+        client.api.tag.side_effect = APIError("boom")
+        inspector = mock.Mock()
+        with (
+            mock.patch("aicage.docker.pull.get_docker_client", return_value=client),
+            mock.patch("aicage.docker.pull.get_image_inspector", return_value=inspector),
+        ):
+            with self.assertRaises(DockerError):
+                tag_image("repo@sha256:abc", "repo:tag")
+
+        inspector.invalidate.assert_called_once_with()
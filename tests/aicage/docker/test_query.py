@@ -1,14 +1,19 @@
 from unittest import TestCase, mock
 
-from docker.errors import ImageNotFound
+from docker.errors import APIError, ImageNotFound
 
+from aicage.docker import query
 from aicage.docker.query import (
     _remove_old_image_digest,
     cleanup_old_digest,
+    get_image_inspector,
+    get_local_image_id,
+    get_local_image_size,
     get_local_repo_digest,
     get_local_repo_digest_for_repo,
     get_local_rootfs_layers,
     local_image_exists,
+    remove_image,
 )
 from aicage.docker.types import ImageRefRepository
 
@@ -35,7 +40,59 @@ class FakeClient:
         self.images = FakeImages(image)
 
 
+class ImageInspectorTests(TestCase):
+    def test_attrs(self) -> None:
+        client = mock.Mock()
+        client.images.get.return_value = FakeImage(repo_digests=["repo@sha256:abc"])
+        inspector = query._ImageInspector()
+        with mock.patch("aicage.docker.query.get_docker_client", return_value=client):
+            first = inspector.attrs("repo:tag")
+            second = inspector.attrs("repo:tag")
+
+        self.assertEqual({"RepoDigests": ["repo@sha256:abc"]}, first)
+        self.assertIs(first, second)
+        client.images.get.assert_called_once_with("repo:tag")
+
+    def test_attrs_caches_missing_image(self) -> None:
+        client = mock.Mock()
+        client.images.get.side_effect = ImageNotFound("missing")
+        inspector = query._ImageInspector()
+        with mock.patch("aicage.docker.query.get_docker_client", return_value=client):
+            self.assertIsNone(inspector.attrs("repo:tag"))
+            self.assertIsNone(inspector.attrs("repo:tag"))
+
+        client.images.get.assert_called_once_with("repo:tag")
+
+    def test_invalidate(self) -> None:
+        client = mock.Mock()
+        client.images.get.side_effect = [ImageNotFound("missing"), FakeImage(repo_digests=[])]
+        inspector = query._ImageInspector()
+        with mock.patch("aicage.docker.query.get_docker_client", return_value=client):
+            self.assertIsNone(inspector.attrs("repo:tag"))
+            inspector.invalidate()
+            self.assertEqual({"RepoDigests": []}, inspector.attrs("repo:tag"))
+
+    def test_get_image_inspector(self) -> None:
+        self.assertIs(get_image_inspector(), get_image_inspector())
+
+    def test_remove_image_invalidates_cache(self) -> None:
+        client = mock.Mock()
+        with (
+            mock.patch("aicage.docker.query.get_docker_client", return_value=client),
+            mock.patch("aicage.docker.query.get_image_inspector") as inspector_mock,
+        ):
+            remove_image("repo@sha256:abc")
+
+        inspector_mock.return_value.invalidate.assert_called_once_with()
+
+
 class LocalQueryTests(TestCase):
+    def setUp(self) -> None:
+        # These tests swap the fake docker state between calls; skip memoization for them.
+        patcher = mock.patch("aicage.docker.query.get_image_inspector", side_effect=query._ImageInspector)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     def test_get_local_repo_digest(self) -> None:
         image = ImageRefRepository(image_ref="repo:tag", repository="ghcr.io/aicage/aicage")
         with mock.patch(
@@ -93,6 +150,39 @@ class LocalQueryTests(TestCase):
             layers = get_local_rootfs_layers("repo:tag")
         self.assertEqual(["a", "b"], layers)
 
+    def test_get_local_image_id(self) -> None:
+        with mock.patch(
+            "aicage.docker.query.get_docker_client",
+            return_value=FakeClient(None),
+        ):
+            self.assertIsNone(get_local_image_id("repo:tag"))
+
+        image = FakeImage(repo_digests=[])
+        image.attrs["Id"] = "sha256:image"
+        with mock.patch(
+            "aicage.docker.query.get_docker_client",
+            return_value=FakeClient(image),
+        ):
+            image_id = get_local_image_id("repo:tag")
+        self.assertEqual("sha256:image", image_id)
+
+    def test_get_local_image_size(self) -> None:
+        with mock.patch(
+            "aicage.docker.query.get_docker_client",
+            return_value=FakeClient(None),
+        ):
+            self.assertIsNone(get_local_image_size("repo:tag"))
+
+        image = FakeImage(repo_digests=[])
+        image.attrs["Size"] = 1024
+        get_image_inspector().invalidate()
+        with mock.patch(
+            "aicage.docker.query.get_docker_client",
+            return_value=FakeClient(image),
+        ):
+            size = get_local_image_size("repo:tag")
+        self.assertEqual(1024, size)
+
     def test_local_image_exists_true_on_success(self) -> None:
         with mock.patch(
             "aicage.docker.query.get_docker_client",
@@ -189,3 +279,19 @@ class LocalQueryTests(TestCase):
                 image_ref="repo:tag",
             )
         remove_mock.assert_called_once_with("ghcr.io/aicage/aicage", "sha256:old")
+
+    def test_remove_image(self) -> None:
+        client = mock.Mock()
+        with mock.patch("aicage.docker.query.get_docker_client", return_value=client):
+            removed = remove_image("ghcr.io/aicage/aicage@sha256:abc")
+
+        self.assertTrue(removed)
+        client.api.remove_image.assert_called_once_with("ghcr.io/aicage/aicage@sha256:abc")
+
+    def test_remove_image_reports_failure(self) -> None:
+        client = mock.Mock()
+        client.api.remove_image.side_effect = APIError("in use")
+        with mock.patch("aicage.docker.query.get_docker_client", return_value=client):
+            removed = remove_image("ghcr.io/aicage/aicage@sha256:abc")
+
+        self.assertFalse(removed)
@@ -26,6 +26,7 @@ class RunCommandTests(TestCase):
             agent_args=["--flag"],
         )
         with (
+            mock.patch.dict("os.environ", {"AICAGE_RUN_MODE": "subprocess"}),
             mock.patch("aicage.docker.run._assemble_docker_run", return_value=["docker", "run"]),
             mock.patch("aicage.docker.run.subprocess.run") as run_mock,
         ):
@@ -33,6 +34,48 @@ class RunCommandTests(TestCase):
 
         run_mock.assert_called_once_with(["docker", "run"], check=True)
 
+    def test_run_container_execs_docker_by_default(self) -> None:
+        args = DockerRunArgs(
+            image_ref="ghcr.io/aicage/aicage:codex-ubuntu",
+            project_path=Path("/work/project"),
+            agent_config_mounts=[],
+            merged_docker_args="",
+            agent_args=[],
+        )
+        with (
+            mock.patch.dict("os.environ", {}, clear=True),
+            mock.patch("aicage.docker.run.os.name", "posix"),
+            mock.patch("aicage.docker.run._assemble_docker_run", return_value=["docker", "run"]),
+            mock.patch("aicage.docker.run.write_trace", return_value=None) as trace_mock,
+            mock.patch("aicage.docker.run.os.execvp") as exec_mock,
+            mock.patch("aicage.docker.run.subprocess.run") as run_mock,
+        ):
+            run.run_container(args)
+
+        trace_mock.assert_called_once_with()
+        exec_mock.assert_called_once_with("docker", ["docker", "run"])
+        run_mock.assert_not_called()
+
+    def test_run_container_uses_subprocess_on_windows(self) -> None:
+        args = DockerRunArgs(
+            image_ref="ghcr.io/aicage/aicage:codex-ubuntu",
+            project_path=Path("/work/project"),
+            agent_config_mounts=[],
+            merged_docker_args="",
+            agent_args=[],
+        )
+        with (
+            mock.patch.dict("os.environ", {}, clear=True),
+            mock.patch("aicage.docker.run.os.name", "nt"),
+            mock.patch("aicage.docker.run._assemble_docker_run", return_value=["docker", "run"]),
+            mock.patch("aicage.docker.run.os.execvp") as exec_mock,
+            mock.patch("aicage.docker.run.subprocess.run") as run_mock,
+        ):
+            run.run_container(args)
+
+        exec_mock.assert_not_called()
+        run_mock.assert_called_once_with(["docker", "run"], check=True)
+
     @staticmethod
     def test_print_run_command_outputs_command() -> None:
         args = DockerRunArgs(
@@ -99,6 +142,35 @@ class RunCommandTests(TestCase):
         self.assertEqual("", result.stdout)
         self.assertEqual("boom", result.stderr)
 
+    def test_run_builder_version_checks_mounts_each_definition_dir(self) -> None:
+        client = mock.Mock()
+        client.containers.run.return_value = b"@@aicage-version-check 0 0\n1.2.3\n"
+        with mock.patch("aicage.docker.run.get_docker_client", return_value=client):
+            result = run.run_builder_version_checks(
+                "ghcr.io/aicage/aicage-image-util:agent-version",
+                [Path("/tmp/first"), Path("/tmp/second")],
+            )
+        self.assertEqual(0, result.returncode)
+        self.assertEqual("@@aicage-version-check 0 0\n1.2.3\n", result.stdout)
+        volumes = client.containers.run.call_args.kwargs["volumes"]
+        self.assertEqual(
+            {
+                str(Path("/tmp/first").resolve()): {"bind": "/agents/0", "mode": "ro"},
+                str(Path("/tmp/second").resolve()): {"bind": "/agents/1", "mode": "ro"},
+            },
+            volumes,
+        )
+        client.containers.run.assert_called_once()
+
+    def test_run_builder_version_checks_runs_each_script_in_its_definition_dir(self) -> None:
+        client = mock.Mock()
+        client.containers.run.return_value = b""
+        with mock.patch("aicage.docker.run.get_docker_client", return_value=client):
+            run.run_builder_version_checks("ghcr.io/aicage/aicage-image-util:agent-version", [Path("/tmp/first")])
+        script = client.containers.run.call_args.kwargs["command"][2]
+        self.assertIn('( cd "$dir" && sed', script)
+        self.assertIn("version.sh > \"/tmp/$index.sh\"", script)
+
     def test_resolve_user_ids_handles_missing(self) -> None:
         with (
             mock.patch("aicage.docker.run.os.getuid", None, create=True),
@@ -1,9 +1,12 @@
 import io
+import re
+import subprocess
 import tempfile
 from pathlib import Path
 from subprocess import CompletedProcess
 from unittest import TestCase, mock
 
+from aicage.docker import run
 from aicage.registry.agent_version import _command
 
 
@@ -57,3 +60,87 @@ class AgentVersionCommandTests(TestCase):
                 )
             self.assertFalse(result.success)
             self.assertEqual("failed", result.error)
+
+    def test_run_version_check_images_splits_results(self) -> None:
+        stdout = "\n".join(
+            [
+                "@@aicage-version-check 0 0",
+                "1.2.3",
+                "@@aicage-version-check 1 2",
+                "network down",
+                "",
+            ]
+        )
+        with mock.patch(
+            "aicage.registry.agent_version._command.run_builder_version_checks",
+            return_value=CompletedProcess([], 0, stdout=stdout, stderr=""),
+        ):
+            results = _command.run_version_check_images(
+                "ghcr.io/aicage/aicage-image-util:agent-version",
+                [Path("/tmp/first"), Path("/tmp/second"), Path("/tmp/third")],
+            )
+        self.assertEqual(_command.CommandResult(success=True, output="1.2.3", error=""), results[0])
+        self.assertEqual(_command.CommandResult(success=False, output="", error="network down"), results[1])
+        self.assertFalse(results[2].success)
+
+    def test_run_version_check_images_runs_batch_script(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            definition_dirs = [root / "agents" / name for name in ("claude", "codex", "gemini")]
+            for definition_dir in definition_dirs:
+                definition_dir.mkdir(parents=True)
+            (definition_dirs[0] / "VERSION").write_text("1.2.3\n", encoding="utf-8")
+            (definition_dirs[0] / "version.sh").write_bytes(b"cat VERSION\r\n")
+            (definition_dirs[1] / "version.sh").write_text("echo 'offline' >&2\nexit 3\n", encoding="utf-8")
+            (definition_dirs[2] / "version.sh").write_text("echo 'warming up' >&2\necho 4.5.6\n", encoding="utf-8")
+            (root / "out").mkdir()
+
+            with mock.patch(
+                "aicage.registry.agent_version._command.run_builder_version_checks",
+                side_effect=lambda image_ref, dirs: _run_batch_script_locally(root, image_ref, dirs),
+            ):
+                results = _command.run_version_check_images(
+                    "ghcr.io/aicage/aicage-image-util:agent-version",
+                    definition_dirs,
+                )
+
+        self.assertEqual(
+            [
+                _command.CommandResult(success=True, output="1.2.3", error=""),
+                _command.CommandResult(success=False, output="", error="offline"),
+                _command.CommandResult(success=True, output="4.5.6", error=""),
+            ],
+            results,
+        )
+
+    def test_run_version_check_images_reports_container_failure(self) -> None:
+        with mock.patch(
+            "aicage.registry.agent_version._command.run_builder_version_checks",
+            return_value=CompletedProcess([], 1, stdout="", stderr="boom"),
+        ):
+            results = _command.run_version_check_images(
+                "ghcr.io/aicage/aicage-image-util:agent-version",
+                [Path("/tmp/first"), Path("/tmp/second")],
+            )
+        self.assertEqual([_command.CommandResult(success=False, output="", error="boom")] * 2, results)
+
+
+def _run_batch_script_locally(root: Path, image_ref: str, definition_dirs: list[Path]) -> CompletedProcess[str]:
+    """
+    Runs the container script of run_builder_version_checks with bash on the host, with the container mount points
+    mapped into root.
+    """
+    client = mock.Mock()
+    client.containers.run.return_value = b""
+    with mock.patch("aicage.docker.run.get_docker_client", return_value=client):
+        run.run_builder_version_checks(image_ref, definition_dirs)
+    kwargs = client.containers.run.call_args.kwargs
+    mounts = {volume["bind"]: source for source, volume in kwargs["volumes"].items()}
+    container_root = root / "container"
+    for bind, source in mounts.items():
+        target = container_root / bind.lstrip("/")
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.symlink_to(source, target_is_directory=True)
+    replacements = {"/agents": str(container_root / "agents"), "/tmp/": f"{root / 'out'}/"}
+    script = re.sub("/agents|/tmp/", lambda match: replacements[match.group(0)], kwargs["command"][2])
+    return subprocess.run(["bash", "-c", script], check=False, capture_output=True, text=True)
@@ -18,11 +18,7 @@ class AgentVersionImagesTests(TestCase):
                     return_value=None,
                 ) as local_mock,
                 mock.patch("aicage.registry.agent_version._images.get_remote_digest") as remote_mock,
-                mock.patch(
-                    "aicage.registry.agent_version._images.resolve_verified_digest",
-                    return_value="ghcr.io/aicage/aicage-image-util@sha256:verified",
-                ) as verify_mock,
-                mock.patch("aicage.registry.agent_version._images.run_pull") as pull_mock,
+                mock.patch("aicage.registry.agent_version._images.pull_verified_image") as pull_mock,
                 mock.patch(
                     "aicage.registry.agent_version._images.cleanup_old_digest"
                 ) as cleanup_mock,
@@ -34,7 +30,6 @@ class AgentVersionImagesTests(TestCase):
                 _images.ensure_version_check_image(image_ref=image_ref)
         local_mock.assert_called_once()
         remote_mock.assert_not_called()
-        verify_mock.assert_called_once_with(image_ref)
         pull_mock.assert_called_once_with(image_ref, log_path)
         cleanup_mock.assert_called_once_with(
             "ghcr.io/aicage/aicage-image-util",
@@ -56,11 +51,7 @@ class AgentVersionImagesTests(TestCase):
                     "aicage.registry.agent_version._images.get_remote_digest",
                     return_value="sha256:new",
                 ),
-                mock.patch(
-                    "aicage.registry.agent_version._images.resolve_verified_digest",
-                    return_value="ghcr.io/aicage/aicage-image-util@sha256:new",
-                ),
-                mock.patch("aicage.registry.agent_version._images.run_pull") as pull_mock,
+                mock.patch("aicage.registry.agent_version._images.pull_verified_image") as pull_mock,
                 mock.patch(
                     "aicage.registry.agent_version._images.cleanup_old_digest"
                 ) as cleanup_mock,
@@ -91,10 +82,7 @@ class AgentVersionImagesTests(TestCase):
                     "aicage.registry.agent_version._images.get_remote_digest",
                     return_value=None,
                 ) as remote_mock,
-                mock.patch(
-                    "aicage.registry.agent_version._images.resolve_verified_digest"
-                ) as verify_mock,
-                mock.patch("aicage.registry.agent_version._images.run_pull") as pull_mock,
+                mock.patch("aicage.registry.agent_version._images.pull_verified_image") as pull_mock,
                 mock.patch(
                     "aicage.registry.agent_version._images.cleanup_old_digest"
                 ) as cleanup_mock,
@@ -105,6 +93,5 @@ class AgentVersionImagesTests(TestCase):
             ):
                 _images.ensure_version_check_image(image_ref=image_ref)
         remote_mock.assert_called_once()
-        verify_mock.assert_not_called()
         pull_mock.assert_not_called()
         cleanup_mock.assert_not_called()
@@ -7,6 +7,7 @@ import yaml
 from aicage.registry.agent_version._store import (
     _AGENT_KEY,
     _CHECKED_AT_KEY,
+    _DEFINITION_HASH_KEY,
     _VERSION_KEY,
     VersionCheckStore,
 )
@@ -22,10 +23,47 @@ class VersionCheckStoreTests(TestCase):
             ):
                 store = VersionCheckStore()
 
-                path = store.save("custom/agent", "1.2.3")
+                path = store.save("custom/agent", "1.2.3", "def123")
 
                 self.assertEqual(base_dir / "custom_agent.yml", path)
                 payload = yaml.safe_load(path.read_text(encoding="utf-8"))
                 self.assertEqual("custom/agent", payload[_AGENT_KEY])
                 self.assertEqual("1.2.3", payload[_VERSION_KEY])
                 self.assertIn(_CHECKED_AT_KEY, payload)
+                self.assertEqual("def123", payload[_DEFINITION_HASH_KEY])
+
+    def test_load_returns_saved_record(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with mock.patch(
+                "aicage.registry.agent_version._store.paths_module.AGENT_VERSION_CHECK_STATE_DIR",
+                Path(tmp_dir),
+            ):
+                store = VersionCheckStore()
+                self.assertIsNone(store.load("custom/agent"))
+                store.save("custom/agent", "1.2.3", "def123")
+
+                record = store.load("custom/agent")
+
+        self.assertIsNotNone(record)
+        assert record is not None
+        self.assertEqual("custom/agent", record.agent)
+        self.assertEqual("1.2.3", record.version)
+        self.assertTrue(record.checked_at)
+        self.assertEqual("def123", record.definition_hash)
+
+    def test_load_ignores_invalid_records(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            base_dir = Path(tmp_dir)
+            with mock.patch(
+                "aicage.registry.agent_version._store.paths_module.AGENT_VERSION_CHECK_STATE_DIR",
+                base_dir,
+            ):
+                store = VersionCheckStore()
+                (base_dir / "broken.yml").write_text("agent: [broken", encoding="utf-8")
+                (base_dir / "list.yml").write_text("- agent\n", encoding="utf-8")
+                (base_dir / "empty.yml").write_text("agent: empty\nversion: ''\n", encoding="utf-8")
+                (base_dir / "other.yml").write_text("agent: else\nversion: 1.0.0\n", encoding="utf-8")
+
+                records = [store.load(agent) for agent in ("broken", "list", "empty", "other")]
+
+        self.assertEqual([None, None, None, None], records)
@@ -4,10 +4,12 @@ from unittest import TestCase, mock
 
 import yaml
 
+from aicage.config.agent.definition_hash import agent_definition_hash
 from aicage.config.agent.models import AgentMetadata
 from aicage.registry._errors import RegistryError
+from aicage.registry._time import now_iso
 from aicage.registry.agent_version import _command as command
-from aicage.registry.agent_version._store import _VERSION_KEY
+from aicage.registry.agent_version._store import _VERSION_KEY, VersionCheckRecord
 from aicage.registry.agent_version.checker import AgentVersionChecker
 
 
@@ -26,7 +28,7 @@ class AgentVersionCheckTests(TestCase):
                 ),
                 mock.patch(
                     "aicage.registry.agent_version.checker.run_host",
-                    return_value=command._CommandResult(success=True, output="1.2.3", error=""),
+                    return_value=command.CommandResult(success=True, output="1.2.3", error=""),
                 ),
             ):
                 checker = AgentVersionChecker()
@@ -56,12 +58,12 @@ class AgentVersionCheckTests(TestCase):
                 ),
                 mock.patch(
                     "aicage.registry.agent_version.checker.run_host",
-                    return_value=command._CommandResult(success=False, output="", error="host failed"),
+                    return_value=command.CommandResult(success=False, output="", error="host failed"),
                 ),
                 mock.patch("aicage.registry.agent_version.checker.ensure_version_check_image"),
                 mock.patch(
                     "aicage.registry.agent_version.checker.run_version_check_image",
-                    return_value=command._CommandResult(success=True, output="1.2.3", error=""),
+                    return_value=command.CommandResult(success=True, output="1.2.3", error=""),
                 ),
             ):
                 checker = AgentVersionChecker()
@@ -91,12 +93,12 @@ class AgentVersionCheckTests(TestCase):
                 ),
                 mock.patch(
                     "aicage.registry.agent_version.checker.run_host",
-                    return_value=command._CommandResult(success=False, output="", error="host failed"),
+                    return_value=command.CommandResult(success=False, output="", error="host failed"),
                 ),
                 mock.patch("aicage.registry.agent_version.checker.ensure_version_check_image"),
                 mock.patch(
                     "aicage.registry.agent_version.checker.run_version_check_image",
-                    return_value=command._CommandResult(
+                    return_value=command.CommandResult(
                         success=False,
                         output="",
                         error="version check failed",
@@ -130,6 +132,226 @@ class AgentVersionCheckTests(TestCase):
                     )
             self.assertFalse((store_dir / "custom.yml").exists())
 
+    def test_get_version_reuses_fresh_cached_version(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            agent_dir = Path(tmp_dir) / "custom"
+            agent_dir.mkdir()
+            (agent_dir / "version.sh").write_text("echo 1.2.3\n", encoding="utf-8")
+            store = mock.Mock()
+            store.load.return_value = VersionCheckRecord(
+                agent="custom",
+                version="1.2.3",
+                checked_at=now_iso(),
+                definition_hash=agent_definition_hash(agent_dir),
+            )
+
+            with mock.patch("aicage.registry.agent_version.checker.run_host") as host_mock:
+                result = AgentVersionChecker(store).get_version(
+                    "custom",
+                    self._agent_metadata(),
+                    definition_dir=agent_dir,
+                )
+
+            self.assertEqual("1.2.3", result)
+            host_mock.assert_not_called()
+            store.save.assert_not_called()
+
+    def test_get_version_refreshes_stale_cached_version(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            agent_dir = Path(tmp_dir) / "custom"
+            agent_dir.mkdir()
+            (agent_dir / "version.sh").write_text("echo 1.2.4\n", encoding="utf-8")
+            store = mock.Mock()
+            store.load.return_value = VersionCheckRecord(
+                agent="custom",
+                version="1.2.3",
+                checked_at="2024-01-01T00:00:00+00:00",
+                definition_hash=agent_definition_hash(agent_dir),
+            )
+
+            with mock.patch(
+                "aicage.registry.agent_version.checker.run_host",
+                return_value=command.CommandResult(success=True, output="1.2.4", error=""),
+            ):
+                result = AgentVersionChecker(store).get_version(
+                    "custom",
+                    self._agent_metadata(),
+                    definition_dir=agent_dir,
+                )
+
+            self.assertEqual("1.2.4", result)
+            store.save.assert_called_once_with("custom", "1.2.4", agent_definition_hash(agent_dir))
+
+    def test_get_version_ignores_cache_when_max_age_is_zero(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            agent_dir = Path(tmp_dir) / "custom"
+            agent_dir.mkdir()
+            (agent_dir / "version.sh").write_text("echo 1.2.4\n", encoding="utf-8")
+            store = mock.Mock()
+            store.load.return_value = VersionCheckRecord(agent="custom", version="1.2.3", checked_at=now_iso())
+
+            with (
+                mock.patch.dict("os.environ", {"AICAGE_AGENT_VERSION_MAX_AGE": "0"}),
+                mock.patch(
+                    "aicage.registry.agent_version.checker.run_host",
+                    return_value=command.CommandResult(success=True, output="1.2.4", error=""),
+                ),
+            ):
+                result = AgentVersionChecker(store).get_version(
+                    "custom",
+                    self._agent_metadata(),
+                    definition_dir=agent_dir,
+                )
+
+            self.assertEqual("1.2.4", result)
+
+    def test_get_version_falls_back_to_stale_cached_version(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            agent_dir = Path(tmp_dir) / "custom"
+            agent_dir.mkdir()
+            (agent_dir / "version.sh").write_text("echo 1.2.3\n", encoding="utf-8")
+            store = mock.Mock()
+            store.load.return_value = VersionCheckRecord(
+                agent="custom",
+                version="1.2.3",
+                checked_at="2024-01-01T00:00:00+00:00",
+                definition_hash=agent_definition_hash(agent_dir),
+            )
+            failed = command.CommandResult(success=False, output="", error="offline")
+
+            with (
+                mock.patch("aicage.registry.agent_version.checker.run_host", return_value=failed),
+                mock.patch("aicage.registry.agent_version.checker.ensure_version_check_image"),
+                mock.patch("aicage.registry.agent_version.checker.run_version_check_image", return_value=failed),
+            ):
+                result = AgentVersionChecker(store).get_version(
+                    "custom",
+                    self._agent_metadata(),
+                    definition_dir=agent_dir,
+                )
+
+            self.assertEqual("1.2.3", result)
+            store.save.assert_not_called()
+
+    def test_get_version_skips_cached_fallback_when_max_age_is_zero(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            agent_dir = Path(tmp_dir) / "custom"
+            agent_dir.mkdir()
+            (agent_dir / "version.sh").write_text("echo 1.2.3\n", encoding="utf-8")
+            store = mock.Mock()
+            store.load.return_value = VersionCheckRecord(
+                agent="custom",
+                version="1.2.3",
+                checked_at=now_iso(),
+                definition_hash=agent_definition_hash(agent_dir),
+            )
+            failed = command.CommandResult(success=False, output="", error="offline")
+
+            with (
+                mock.patch.dict("os.environ", {"AICAGE_AGENT_VERSION_MAX_AGE": "0"}),
+                mock.patch("aicage.registry.agent_version.checker.run_host", return_value=failed),
+                mock.patch("aicage.registry.agent_version.checker.ensure_version_check_image"),
+                mock.patch("aicage.registry.agent_version.checker.run_version_check_image", return_value=failed),
+            ):
+                with self.assertRaises(RegistryError):
+                    AgentVersionChecker(store).get_version(
+                        "custom",
+                        self._agent_metadata(),
+                        definition_dir=agent_dir,
+                    )
+
+    def test_get_version_ignores_cached_version_of_changed_definition(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            agent_dir = Path(tmp_dir) / "custom"
+            agent_dir.mkdir()
+            (agent_dir / "version.sh").write_text("echo 1.2.4\n", encoding="utf-8")
+            store = mock.Mock()
+            store.load.return_value = VersionCheckRecord(
+                agent="custom",
+                version="1.2.3",
+                checked_at=now_iso(),
+                definition_hash="other-definition",
+            )
+            failed = command.CommandResult(success=False, output="", error="offline")
+
+            with (
+                mock.patch("aicage.registry.agent_version.checker.run_host", return_value=failed),
+                mock.patch("aicage.registry.agent_version.checker.ensure_version_check_image"),
+                mock.patch("aicage.registry.agent_version.checker.run_version_check_image", return_value=failed),
+            ):
+                with self.assertRaises(RegistryError):
+                    AgentVersionChecker(store).get_version(
+                        "custom",
+                        self._agent_metadata(),
+                        definition_dir=agent_dir,
+                    )
+
+    def test_get_versions_runs_host_checks_and_batches_image_fallback(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            definition_dirs = self._write_agents(Path(tmp_dir), ["claude", "codex", "gemini"])
+            store = mock.Mock()
+            store.load.return_value = None
+            host_results = {
+                definition_dirs["claude"] / "version.sh": command.CommandResult(success=True, output="1.0.0", error=""),
+                definition_dirs["codex"] / "version.sh": command.CommandResult(success=False, output="", error="no"),
+                definition_dirs["gemini"] / "version.sh": command.CommandResult(success=False, output="", error="no"),
+            }
+
+            with (
+                mock.patch(
+                    "aicage.registry.agent_version.checker.run_host",
+                    side_effect=lambda script_path: host_results[script_path],
+                ),
+                mock.patch("aicage.registry.agent_version.checker.ensure_version_check_image") as ensure_mock,
+                mock.patch(
+                    "aicage.registry.agent_version.checker.run_version_check_images",
+                    return_value=[
+                        command.CommandResult(success=True, output="2.0.0", error=""),
+                        command.CommandResult(success=True, output="3.0.0", error=""),
+                    ],
+                ) as images_mock,
+            ):
+                result = AgentVersionChecker(store).get_versions(definition_dirs)
+
+            self.assertEqual({"claude": "1.0.0", "codex": "2.0.0", "gemini": "3.0.0"}, result)
+            ensure_mock.assert_called_once()
+            images_mock.assert_called_once_with(
+                mock.ANY,
+                [definition_dirs["codex"], definition_dirs["gemini"]],
+            )
+            self.assertEqual(3, store.save.call_count)
+
+    def test_get_versions_reports_every_failed_agent(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            definition_dirs = self._write_agents(Path(tmp_dir), ["claude", "codex"])
+            store = mock.Mock()
+            store.load.return_value = None
+            failed = command.CommandResult(success=False, output="", error="offline")
+
+            with (
+                mock.patch("aicage.registry.agent_version.checker.run_host", return_value=failed),
+                mock.patch("aicage.registry.agent_version.checker.ensure_version_check_image"),
+                mock.patch(
+                    "aicage.registry.agent_version.checker.run_version_check_images",
+                    return_value=[failed, failed],
+                ),
+            ):
+                with self.assertRaises(RegistryError) as raised:
+                    AgentVersionChecker(store).get_versions(definition_dirs)
+
+            self.assertIn("claude: offline; offline", str(raised.exception))
+            self.assertIn("codex: offline; offline", str(raised.exception))
+
+    @staticmethod
+    def _write_agents(root: Path, names: list[str]) -> dict[str, Path]:
+        definition_dirs: dict[str, Path] = {}
+        for name in names:
+            agent_dir = root / name
+            agent_dir.mkdir()
+            (agent_dir / "version.sh").write_text("echo 1.0.0\n", encoding="utf-8")
+            definition_dirs[name] = agent_dir
+        return definition_dirs
+
     @staticmethod
     def _agent_metadata() -> AgentMetadata:
         return AgentMetadata(
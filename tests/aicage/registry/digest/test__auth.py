@@ -1,6 +1,7 @@
 import json
 from unittest import TestCase, mock
 
+from aicage._http_client import HttpResponse
 from aicage.registry.digest import _auth
 
 
@@ -11,37 +12,62 @@ class DigestAuthTests(TestCase):
         self.assertEqual({}, params)
 
     def test_fetch_bearer_token_returns_none_on_invalid_json(self) -> None:
-        response = mock.Mock()
-        response.read.return_value = b"not-json"
-        response.__enter__ = mock.Mock(return_value=response)
-        response.__exit__ = mock.Mock(return_value=None)
+        response = HttpResponse(status=200, headers={}, body=b"not-json")
         with mock.patch(
-            "aicage.registry.digest._auth.urllib.request.urlopen",
+            "aicage.registry.digest._auth.http_request",
             return_value=response,
         ):
             token = _auth.fetch_bearer_token("https://example.test", "", "repo:pull")
         self.assertIsNone(token)
 
     def test_fetch_bearer_token_returns_none_on_missing_token(self) -> None:
-        response = mock.Mock()
-        response.read.return_value = json.dumps({"access_token": ""}).encode("utf-8")
-        response.__enter__ = mock.Mock(return_value=response)
-        response.__exit__ = mock.Mock(return_value=None)
+        response = HttpResponse(status=200, headers={}, body=json.dumps({"access_token": ""}).encode("utf-8"))
         with mock.patch(
-            "aicage.registry.digest._auth.urllib.request.urlopen",
+            "aicage.registry.digest._auth.http_request",
             return_value=response,
         ):
             token = _auth.fetch_bearer_token("https://example.test", "", "repo:pull")
         self.assertIsNone(token)
 
     def test_fetch_bearer_token_accepts_access_token(self) -> None:
-        response = mock.Mock()
-        response.read.return_value = json.dumps({"access_token": "token"}).encode("utf-8")
-        response.__enter__ = mock.Mock(return_value=response)
-        response.__exit__ = mock.Mock(return_value=None)
+        response = HttpResponse(status=200, headers={}, body=json.dumps({"access_token": "token"}).encode("utf-8"))
         with mock.patch(
-            "aicage.registry.digest._auth.urllib.request.urlopen",
+            "aicage.registry.digest._auth.http_request",
             return_value=response,
         ):
             token = _auth.fetch_bearer_token("https://example.test", "", "repo:pull")
-        self.assertEqual("token", token)
+        self.assertIsNotNone(token)
+        assert token is not None
+        self.assertEqual("token", token.value)
+
+    def test_fetch_bearer_token_honors_expires_in_and_issued_at(self) -> None:
+        response = HttpResponse(status=200, headers={}, body=json.dumps(
+            {"token": "token", "expires_in": 300, "issued_at": "2026-01-01T00:00:00Z"}
+        ).encode("utf-8"))
+        with (
+            mock.patch(
+                "aicage.registry.digest._auth.http_request",
+                return_value=response,
+            ),
+            mock.patch("aicage.registry.digest._auth.time.time", return_value=1_800_000_000.0),
+        ):
+            token = _auth.fetch_bearer_token("https://example.test", "", "repo:pull")
+        self.assertEqual(_auth.BearerToken(value="token", expires_at=1_767_225_600.0 + 300), token)
+
+    def test_fetch_bearer_token_defaults_expiry(self) -> None:
+        response = HttpResponse(status=200, headers={}, body=json.dumps({"token": "token"}).encode("utf-8"))
+        with (
+            mock.patch(
+                "aicage.registry.digest._auth.http_request",
+                return_value=response,
+            ),
+            mock.patch("aicage.registry.digest._auth.time.time", return_value=1000.0),
+        ):
+            token = _auth.fetch_bearer_token("https://example.test", "", "repo:pull")
+        self.assertEqual(_auth.BearerToken(value="token", expires_at=1060.0), token)
+
+    def test_fetch_bearer_token_returns_none_on_error_status(self) -> None:
+        response = HttpResponse(status=403, headers={}, body=b'{"token": "token"}')
+        with mock.patch("aicage.registry.digest._auth.http_request", return_value=response):
+            token = _auth.fetch_bearer_token("https://example.test", "", "repo:pull")
+        self.assertIsNone(token)
@@ -0,0 +1,56 @@
+import tempfile
+from pathlib import Path
+from unittest import TestCase, mock
+
+from aicage.registry.digest._digest_store import RemoteDigestRecord, RemoteDigestStore, image_key
+from aicage.registry.digest._parser import parse_image_ref
+
+
+class RemoteDigestStoreTests(TestCase):
+    def test_save_and_load_round_trip(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with mock.patch(
+                "aicage.registry.digest._digest_store.paths_module.REMOTE_DIGEST_STATE_DIR",
+                Path(tmp_dir),
+            ):
+                parsed = parse_image_ref("ubuntu:24.04")
+                record = RemoteDigestRecord(
+                    image=image_key(parsed),
+                    digest="sha256:abc",
+                    checked_at="2026-01-01T00:00:00+00:00",
+                )
+                store = RemoteDigestStore()
+
+                path = store.save(record)
+                loaded = store.load(parse_image_ref("docker.io/library/ubuntu:24.04"))
+
+            self.assertEqual(Path(tmp_dir), path.parent)
+            self.assertEqual(record, loaded)
+
+    def test_load_returns_none_when_missing(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with mock.patch(
+                "aicage.registry.digest._digest_store.paths_module.REMOTE_DIGEST_STATE_DIR",
+                Path(tmp_dir),
+            ):
+                self.assertIsNone(RemoteDigestStore().load(parse_image_ref("ghcr.io/org/repo:tag")))
+
+    def test_load_returns_none_for_invalid_payload(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with mock.patch(
+                "aicage.registry.digest._digest_store.paths_module.REMOTE_DIGEST_STATE_DIR",
+                Path(tmp_dir),
+            ):
+                parsed = parse_image_ref("ghcr.io/org/repo:tag")
+                store = RemoteDigestStore()
+                path = store.save(RemoteDigestRecord(image=image_key(parsed), digest="sha256:abc", checked_at=""))
+                path.write_text("- not a mapping\n", encoding="utf-8")
+
+                self.assertIsNone(store.load(parsed))
+
+    def test_image_key(self) -> None:
+        self.assertEqual(
+            "registry-1.docker.io/library/ubuntu:latest",
+            image_key(parse_image_ref("ubuntu")),
+        )
+        self.assertEqual("ghcr.io/org/repo:tag", image_key(parse_image_ref("ghcr.io/org/repo:tag")))
@@ -1,6 +1,6 @@
-import urllib.error
 from unittest import TestCase, mock
 
+from aicage._http_client import HttpResponse
 from aicage.registry.digest import _http
 
 
@@ -10,10 +10,18 @@ class DigestHttpTests(TestCase):
 
         self.assertEqual("text/plain", value)
 
+    def test_head_request_returns_status_and_headers(self) -> None:
+        response = HttpResponse(status=200, headers={"docker-content-digest": "sha256:abc"}, body=b"")
+        with mock.patch("aicage.registry.digest._http.http_request", return_value=response) as request_mock:
+            status, headers = _http.head_request("https://example.test", {"Accept": "x"})
+        self.assertEqual(200, status)
+        self.assertEqual({"docker-content-digest": "sha256:abc"}, headers)
+        self.assertEqual("HEAD", request_mock.call_args.args[0])
+
     def test_head_request_returns_none_on_url_error(self) -> None:
         with mock.patch(
-            "aicage.registry.digest._http.urllib.request.urlopen",
-            side_effect=urllib.error.URLError("boom"),
+            "aicage.registry.digest._http.http_request",
+            return_value=None,
         ):
             status, headers = _http.head_request("https://example.test", {"Accept": "x"})
         self.assertIsNone(status)
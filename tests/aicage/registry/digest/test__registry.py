@@ -1,9 +1,25 @@
+import tempfile
+import time
+from pathlib import Path
 from unittest import TestCase, mock
 
 from aicage.registry.digest import _registry as registry
+from aicage.registry.digest._auth import BearerToken
+from aicage.registry.digest._token_cache import AuthChallenge, BearerTokenCache
 
 
 class RegistryDigestTests(TestCase):
+    def setUp(self) -> None:
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        with mock.patch(
+            "aicage.registry.digest._token_cache.paths_module.REGISTRY_TOKEN_STATE_PATH",
+            Path(tmp_dir.name) / "tokens.yml",
+        ):
+            self.cache = BearerTokenCache()
+        patcher = mock.patch("aicage.registry.digest._registry._token_cache", return_value=self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
 
     def test_get_manifest_digest_reads_direct_digest(self) -> None:
         with (
@@ -25,6 +41,13 @@ class RegistryDigestTests(TestCase):
             digest = registry.get_manifest_digest("ghcr.io", "org/repo", "latest")
         self.assertIsNone(digest)
 
+    def test_get_manifest_digest_raises_when_registry_is_unreachable(self) -> None:
+        with (
+            mock.patch("aicage.registry.digest._registry.head_request", return_value=(None, {})),
+            self.assertRaises(registry.RegistryUnreachableError),
+        ):
+            registry.get_manifest_digest("ghcr.io", "org/repo", "latest")
+
     def test_get_manifest_digest_returns_none_when_missing_auth_header(self) -> None:
         with mock.patch(
             "aicage.registry.digest._registry.head_request",
@@ -69,12 +92,60 @@ class RegistryDigestTests(TestCase):
             ),
             mock.patch(
                 "aicage.registry.digest._registry.fetch_bearer_token",
-                return_value="token",
+                return_value=BearerToken(value="token", expires_at=time.time() + 300),
             ) as token_mock,
         ):
             digest = registry.get_manifest_digest("ghcr.io", "org/repo", "latest")
         self.assertEqual("sha256:def", digest)
         token_mock.assert_called_once()
+        challenge = AuthChallenge(realm="https://example.com/token", service="ghcr.io")
+        self.assertEqual(challenge, self.cache.get_challenge("ghcr.io"))
+        self.assertEqual("token", self.cache.get_token(challenge, "repo:pull"))
+
+    def test_get_manifest_digest_sends_cached_token_first(self) -> None:
+        challenge = AuthChallenge(realm="https://example.com/token", service="ghcr.io")
+        self.cache.put_token(
+            "ghcr.io",
+            challenge,
+            "repository:org/repo:pull",
+            BearerToken(value="cached", expires_at=time.time() + 300),
+        )
+        with (
+            mock.patch(
+                "aicage.registry.digest._registry.head_request",
+                return_value=(200, {"docker-content-digest": "sha256:abc"}),
+            ) as head_mock,
+            mock.patch("aicage.registry.digest._registry.fetch_bearer_token") as token_mock,
+        ):
+            digest = registry.get_manifest_digest("ghcr.io", "org/repo", "latest")
+        self.assertEqual("sha256:abc", digest)
+        head_mock.assert_called_once()
+        self.assertEqual("Bearer cached", head_mock.call_args.args[1]["Authorization"])
+        token_mock.assert_not_called()
+
+    def test_get_manifest_digest_refreshes_rejected_cached_token(self) -> None:
+        challenge = AuthChallenge(realm="https://example.com/token", service="ghcr.io")
+        scope = "repository:org/repo:pull"
+        self.cache.put_token("ghcr.io", challenge, scope, BearerToken(value="old", expires_at=time.time() + 300))
+        auth_header = 'Bearer realm="https://example.com/token",service="ghcr.io",scope="repository:org/repo:pull"'
+        head_responses = [
+            (401, {"WWW-Authenticate": auth_header}),
+            (200, {"docker-content-digest": "sha256:def"}),
+        ]
+        with (
+            mock.patch(
+                "aicage.registry.digest._registry.head_request",
+                side_effect=head_responses,
+            ) as head_mock,
+            mock.patch(
+                "aicage.registry.digest._registry.fetch_bearer_token",
+                return_value=BearerToken(value="new", expires_at=time.time() + 300),
+            ),
+        ):
+            digest = registry.get_manifest_digest("ghcr.io", "org/repo", "latest")
+        self.assertEqual("sha256:def", digest)
+        self.assertEqual("Bearer new", head_mock.call_args.args[1]["Authorization"])
+        self.assertEqual("new", self.cache.get_token(challenge, scope))
 
     def test_read_digest_accepts_lowercase_header(self) -> None:
         digest = registry._read_digest({"docker-content-digest": "sha256:abc"})
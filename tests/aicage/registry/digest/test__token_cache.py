@@ -0,0 +1,78 @@
+import os
+import tempfile
+import time
+from pathlib import Path
+from unittest import TestCase, mock
+
+from aicage.registry.digest._auth import BearerToken
+from aicage.registry.digest._token_cache import AuthChallenge, BearerTokenCache
+
+_CHALLENGE = AuthChallenge(realm="https://ghcr.io/token", service="ghcr.io")
+_SCOPE = "repository:aicage/aicage:pull"
+
+
+class BearerTokenCacheTests(TestCase):
+    def test_get_challenge(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            state_path = Path(tmp_dir) / "tokens.yml"
+            with mock.patch("aicage.registry.digest._token_cache.paths_module.REGISTRY_TOKEN_STATE_PATH", state_path):
+                cache = BearerTokenCache()
+                self.assertIsNone(cache.get_challenge("ghcr.io"))
+                cache.put_token("ghcr.io", _CHALLENGE, _SCOPE, _token("abc"))
+
+                self.assertEqual(_CHALLENGE, cache.get_challenge("ghcr.io"))
+
+    def test_get_token(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            state_path = Path(tmp_dir) / "tokens.yml"
+            with mock.patch("aicage.registry.digest._token_cache.paths_module.REGISTRY_TOKEN_STATE_PATH", state_path):
+                cache = BearerTokenCache()
+                cache.put_token("ghcr.io", _CHALLENGE, _SCOPE, _token("abc"))
+
+                self.assertEqual("abc", cache.get_token(_CHALLENGE, _SCOPE))
+                self.assertIsNone(cache.get_token(_CHALLENGE, "repository:other:pull"))
+
+    def test_get_token_ignores_expiring_token(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            state_path = Path(tmp_dir) / "tokens.yml"
+            with mock.patch("aicage.registry.digest._token_cache.paths_module.REGISTRY_TOKEN_STATE_PATH", state_path):
+                cache = BearerTokenCache()
+                cache.put_token("ghcr.io", _CHALLENGE, _SCOPE, BearerToken(value="abc", expires_at=time.time() + 1))
+
+                self.assertIsNone(cache.get_token(_CHALLENGE, _SCOPE))
+
+    def test_put_token(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            state_path = Path(tmp_dir) / "registry" / "tokens.yml"
+            with mock.patch("aicage.registry.digest._token_cache.paths_module.REGISTRY_TOKEN_STATE_PATH", state_path):
+                BearerTokenCache().put_token("ghcr.io", _CHALLENGE, _SCOPE, _token("abc"))
+                reloaded = BearerTokenCache()
+
+                self.assertEqual(_CHALLENGE, reloaded.get_challenge("ghcr.io"))
+                self.assertEqual("abc", reloaded.get_token(_CHALLENGE, _SCOPE))
+            if os.name != "nt":
+                self.assertEqual(0o600, state_path.stat().st_mode & 0o777)
+
+    def test_invalidate_token(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            state_path = Path(tmp_dir) / "tokens.yml"
+            with mock.patch("aicage.registry.digest._token_cache.paths_module.REGISTRY_TOKEN_STATE_PATH", state_path):
+                cache = BearerTokenCache()
+                cache.put_token("ghcr.io", _CHALLENGE, _SCOPE, _token("abc"))
+                cache.invalidate_token(_CHALLENGE, _SCOPE)
+
+                self.assertIsNone(cache.get_token(_CHALLENGE, _SCOPE))
+                self.assertIsNone(BearerTokenCache().get_token(_CHALLENGE, _SCOPE))
+
+    def test_load_ignores_invalid_file(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            state_path = Path(tmp_dir) / "tokens.yml"
+            state_path.write_text("tokens: [", encoding="utf-8")
+            with mock.patch("aicage.registry.digest._token_cache.paths_module.REGISTRY_TOKEN_STATE_PATH", state_path):
+                cache = BearerTokenCache()
+
+                self.assertIsNone(cache.get_challenge("ghcr.io"))
+
+
+def _token(value: str) -> BearerToken:
+    return BearerToken(value=value, expires_at=time.time() + 300)
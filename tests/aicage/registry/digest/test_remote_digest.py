@@ -1,9 +1,24 @@
+import tempfile
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
 from unittest import TestCase, mock
 
+from aicage.registry.digest._digest_store import RemoteDigestRecord, RemoteDigestStore
+from aicage.registry.digest._registry import RegistryUnreachableError
 from aicage.registry.digest.remote_digest import get_remote_digest
 
 
 class RemoteDigestTests(TestCase):
+    def setUp(self) -> None:
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        patcher = mock.patch(
+            "aicage.registry.digest._digest_store.paths_module.REMOTE_DIGEST_STATE_DIR",
+            Path(tmp_dir.name),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     def test_get_remote_digest_returns_digest_reference(self) -> None:
         with (
             mock.patch("aicage.registry.digest.remote_digest.get_docker_io_digest") as docker_mock,
@@ -33,3 +48,79 @@ class RemoteDigestTests(TestCase):
         ):
             result = get_remote_digest("ubuntu:latest")
         self.assertEqual("sha256:docker", result)
+
+    def test_get_remote_digest_uses_fresh_cache(self) -> None:
+        _save_cached("ghcr.io/aicage/aicage:codex-ubuntu", "sha256:cached", datetime.now(timezone.utc))
+        with mock.patch("aicage.registry.digest.remote_digest.get_ghcr_digest") as ghcr_mock:
+            result = get_remote_digest("ghcr.io/aicage/aicage:codex-ubuntu")
+        self.assertEqual("sha256:cached", result)
+        ghcr_mock.assert_not_called()
+
+    def test_get_remote_digest_refreshes_expired_cache(self) -> None:
+        _save_cached(
+            "ghcr.io/aicage/aicage:codex-ubuntu",
+            "sha256:old",
+            datetime.now(timezone.utc) - timedelta(hours=1),
+        )
+        with mock.patch("aicage.registry.digest.remote_digest.get_ghcr_digest", return_value="sha256:new"):
+            result = get_remote_digest("ghcr.io/aicage/aicage:codex-ubuntu")
+            cached = get_remote_digest("ghcr.io/aicage/aicage:codex-ubuntu")
+        self.assertEqual("sha256:new", result)
+        self.assertEqual("sha256:new", cached)
+
+    def test_get_remote_digest_uses_stale_cache_when_registry_is_unreachable(self) -> None:
+        _save_cached(
+            "ghcr.io/aicage/aicage:codex-ubuntu",
+            "sha256:old",
+            datetime.now(timezone.utc) - timedelta(days=1),
+        )
+        with mock.patch(
+            "aicage.registry.digest.remote_digest.get_ghcr_digest",
+            side_effect=RegistryUnreachableError("Registry ghcr.io is unreachable."),
+        ):
+            result = get_remote_digest("ghcr.io/aicage/aicage:codex-ubuntu")
+        self.assertEqual("sha256:old", result)
+
+    def test_get_remote_digest_ignores_stale_cache_when_registry_answers_without_digest(self) -> None:
+        _save_cached(
+            "ghcr.io/aicage/aicage:codex-ubuntu",
+            "sha256:old",
+            datetime.now(timezone.utc) - timedelta(days=1),
+        )
+        with (
+            mock.patch("aicage.registry.digest.remote_digest.get_ghcr_digest", return_value=None),
+            mock.patch("aicage.registry.digest.remote_digest.get_docker_io_digest", return_value=None),
+        ):
+            result = get_remote_digest("ghcr.io/aicage/aicage:codex-ubuntu")
+        self.assertIsNone(result)
+
+    def test_get_remote_digest_returns_digest_when_cache_is_unwritable(self) -> None:
+        with (
+            mock.patch("aicage.registry.digest.remote_digest.get_ghcr_digest", return_value="sha256:new"),
+            mock.patch(
+                "aicage.registry.digest.remote_digest.RemoteDigestStore.save",
+                side_effect=OSError("read-only file system"),
+            ),
+        ):
+            result = get_remote_digest("ghcr.io/aicage/aicage:codex-ubuntu")
+        self.assertEqual("sha256:new", result)
+
+    def test_get_remote_digest_max_age_zero_always_checks_registry(self) -> None:
+        _save_cached("ghcr.io/aicage/aicage:codex-ubuntu", "sha256:cached", datetime.now(timezone.utc))
+        with (
+            mock.patch.dict("os.environ", {"AICAGE_DIGEST_MAX_AGE": "0"}),
+            mock.patch(
+                "aicage.registry.digest.remote_digest.get_ghcr_digest",
+                return_value="sha256:new",
+            ) as ghcr_mock,
+        ):
+            result = get_remote_digest("ghcr.io/aicage/aicage:codex-ubuntu")
+        self.assertEqual("sha256:new", result)
+        ghcr_mock.assert_called_once()
+
+
+def _save_cached(image_ref: str, digest: str, checked_at: datetime) -> None:
+    name, reference = image_ref.rsplit(":", 1)
+    RemoteDigestStore().save(
+        RemoteDigestRecord(image=f"{name}:{reference}", digest=digest, checked_at=checked_at.isoformat())
+    )
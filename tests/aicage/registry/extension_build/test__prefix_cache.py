@@ -0,0 +1,143 @@
+import json
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from unittest import TestCase, mock
+
+from aicage.config.extensions.loader import ExtensionMetadata
+from aicage.config.file_locking import lock_config_file
+from aicage.registry.extension_build._prefix_cache import ExtensionPrefixCache, PrefixBuildPlan
+
+_MB: int = 1024 * 1024
+
+
+class ExtensionPrefixCacheTests(TestCase):
+    def test_plan_builds_all_prefixes_when_nothing_is_cached(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir, self._patched(Path(tmp_dir)):
+            plan = ExtensionPrefixCache().plan("base:latest", _extensions("java", "maven", "docker"), ["a", "b", "c"])
+
+        self.assertEqual("base:latest", plan.start_image_ref)
+        self.assertEqual(0, plan.cached_length)
+        self.assertEqual(2, len(plan.new_refs))
+        self.assertTrue(all(ref.startswith("aicage-extended:prefix-") for ref in plan.new_refs))
+
+    def test_plan_starts_from_longest_cached_prefix(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir, self._patched(Path(tmp_dir)):
+            cache = ExtensionPrefixCache()
+            first = cache.plan("base:latest", _extensions("java", "maven"), ["a", "b"])
+            cache.commit(first)
+            plan = cache.plan("base:latest", _extensions("java", "maven", "docker"), ["a", "b", "c"])
+
+        self.assertEqual(first.new_refs[0], plan.start_image_ref)
+        self.assertEqual(1, plan.cached_length)
+        self.assertEqual(1, len(plan.new_refs))
+
+    def test_plan_ignores_changed_extension_content(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir, self._patched(Path(tmp_dir)):
+            cache = ExtensionPrefixCache()
+            cache.commit(cache.plan("base:latest", _extensions("java", "maven"), ["a", "b"]))
+            plan = cache.plan("base:latest", _extensions("java", "maven"), ["changed", "b"])
+
+        self.assertEqual(0, plan.cached_length)
+
+    def test_plan_is_disabled_with_zero_budget(self) -> None:
+        with (
+            tempfile.TemporaryDirectory() as tmp_dir,
+            self._patched(Path(tmp_dir)),
+            mock.patch.dict("os.environ", {"AICAGE_PREFIX_CACHE_MB": "0"}),
+        ):
+            plan = ExtensionPrefixCache().plan("base:latest", _extensions("java", "maven"), ["a", "b"])
+
+        self.assertEqual(
+            PrefixBuildPlan(base_image_ref="base:latest", start_image_ref="base:latest", cached_length=0),
+            plan,
+        )
+
+    def test_commit_evicts_least_recently_used_over_budget(self) -> None:
+        with (
+            tempfile.TemporaryDirectory() as tmp_dir,
+            self._patched(Path(tmp_dir), image_size=100 * _MB) as remove_mock,
+            mock.patch.dict("os.environ", {"AICAGE_PREFIX_CACHE_MB": "150"}),
+            mock.patch(
+                "aicage.registry.extension_build._prefix_cache.time.time",
+                side_effect=[1.0, 2.0],
+            ),
+        ):
+            cache = ExtensionPrefixCache()
+            first = cache.plan("base:latest", _extensions("java", "maven"), ["a", "b"])
+            cache.commit(first)
+            second = cache.plan("base:latest", _extensions("node", "npm"), ["c", "d"])
+            cache.commit(second)
+            payload = json.loads((Path(tmp_dir) / "prefix-cache.json").read_text(encoding="utf-8"))
+
+        remove_mock.assert_called_once_with(first.new_refs[0])
+        self.assertEqual([second.new_refs[0]], [entry["image_ref"] for entry in payload["entries"].values()])
+
+    def test_commit_keeps_entries_saved_by_concurrent_builds(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir, self._patched(Path(tmp_dir)):
+            first_cache = ExtensionPrefixCache()
+            second_cache = ExtensionPrefixCache()
+            first = first_cache.plan("base:latest", _extensions("java", "maven"), ["a", "b"])
+            second = second_cache.plan("base:latest", _extensions("node", "npm"), ["c", "d"])
+            concurrent_commits = iter([lambda: second_cache.commit(second)])
+
+            def _size_during_concurrent_commit(image_ref: str) -> int:
+                # The other build finishes while this one still inspects its images.
+                next(concurrent_commits, lambda: None)()
+                return _MB if image_ref == "base:latest" else 11 * _MB
+
+            with (
+                mock.patch(
+                    "aicage.registry.extension_build._prefix_cache.get_local_image_size",
+                    side_effect=_size_during_concurrent_commit,
+                ),
+                mock.patch(
+                    "aicage.registry.extension_build._prefix_cache.lock_config_file",
+                    wraps=lock_config_file,
+                ) as lock_mock,
+            ):
+                first_cache.commit(first)
+            payload = json.loads((Path(tmp_dir) / "prefix-cache.json").read_text(encoding="utf-8"))
+
+        self.assertEqual(2, lock_mock.call_count)
+        self.assertEqual(
+            sorted([first.new_refs[0], second.new_refs[0]]),
+            sorted(entry["image_ref"] for entry in payload["entries"].values()),
+        )
+
+    @staticmethod
+    @contextmanager
+    def _patched(tmp_dir: Path, image_size: int = 10 * _MB) -> Iterator[mock.Mock]:
+        remove_mock = mock.Mock(return_value=True)
+        with (
+            mock.patch(
+                "aicage.registry.extension_build._prefix_cache.paths_module.EXTENSION_PREFIX_CACHE_STATE_PATH",
+                tmp_dir / "prefix-cache.json",
+            ),
+            mock.patch(
+                "aicage.registry.extension_build._prefix_cache.get_local_image_id",
+                return_value="sha256:base",
+            ),
+            mock.patch(
+                "aicage.registry.extension_build._prefix_cache.get_local_image_size",
+                side_effect=lambda image_ref: _MB if image_ref == "base:latest" else image_size + _MB,
+            ),
+            mock.patch("aicage.registry.extension_build._prefix_cache.local_image_exists", return_value=True),
+            mock.patch("aicage.registry.extension_build._prefix_cache.remove_image", remove_mock),
+        ):
+            yield remove_mock
+
+
+def _extensions(*extension_ids: str) -> list[ExtensionMetadata]:
+    return [
+        ExtensionMetadata(
+            extension_id=extension_id,
+            name=extension_id,
+            description="desc",
+            directory=Path(f"/tmp/{extension_id}"),
+            scripts_dir=Path(f"/tmp/{extension_id}/scripts"),
+            dockerfile_path=None,
+        )
+        for extension_id in extension_ids
+    ]
@@ -10,6 +10,7 @@ from aicage.config.runtime_config import RunConfig
 from aicage.constants import DEFAULT_EXTENDED_IMAGE_NAME
 from aicage.registry._errors import RegistryError
 from aicage.registry.extension_build._extended_store import ExtendedBuildRecord
+from aicage.registry.extension_build._prefix_cache import PrefixBuildPlan
 from aicage.registry.extension_build.ensure_extended_image import ensure_extended_image
 from aicage.registry.image_selection.models import ImageSelection
 
@@ -96,6 +97,48 @@ class EnsureExtendedImageTests(TestCase):
         record = store.save.call_args.args[0]
         self.assertIsInstance(record, ExtendedBuildRecord)
 
+    def test_ensure_extended_image_starts_from_cached_prefix(self) -> None:
+        extensions = {"java": self._extension("java"), "maven": self._extension("maven")}
+        run_config = self._run_config(extensions=["java", "maven"], available_extensions=extensions)
+        store = mock.Mock()
+        store.load.return_value = None
+        prefix_cache = mock.Mock()
+        prefix_cache.plan.return_value = PrefixBuildPlan(
+            base_image_ref=run_config.selection.base_image_ref,
+            start_image_ref="aicage-extended:prefix-java",
+            cached_length=1,
+        )
+        with (
+            mock.patch(
+                "aicage.registry.extension_build.ensure_extended_image.ExtendedBuildStore",
+                return_value=store,
+            ),
+            mock.patch(
+                "aicage.registry.extension_build.ensure_extended_image.ExtensionPrefixCache",
+                return_value=prefix_cache,
+            ),
+            mock.patch(
+                "aicage.registry.extension_build.ensure_extended_image.extension_hash",
+                return_value="hash",
+            ),
+            mock.patch(
+                "aicage.registry.extension_build.ensure_extended_image.should_build_extended",
+                return_value=True,
+            ),
+            mock.patch(
+                "aicage.registry.extension_build.ensure_extended_image.run_extended_build"
+            ) as run_mock,
+            mock.patch(
+                "aicage.registry.extension_build.ensure_extended_image.build_log_path_for_image",
+                return_value=Path("/tmp/logs/build.log"),
+            ),
+        ):
+            ensure_extended_image(run_config)
+
+        self.assertEqual("aicage-extended:prefix-java", run_mock.call_args.kwargs["base_image_ref"])
+        self.assertEqual([extensions["maven"]], run_mock.call_args.kwargs["extensions"])
+        prefix_cache.commit.assert_called_once_with(prefix_cache.plan.return_value)
+
     @staticmethod
     def _extension(extension_id: str) -> ExtensionMetadata:
         return ExtensionMetadata(
@@ -35,23 +35,17 @@ class ExtendedImageSelectionTests(TestCase):
             image_ref=f"{DEFAULT_EXTENDED_IMAGE_NAME}:wrong-base",
             path=Path("/tmp/wrong/image-extended.yml"),
         )
-        other = ExtendedImageConfig(
-            name="other",
-            agent="claude",
-            base="ubuntu",
-            extensions=["ext"],
-            image_ref=f"{DEFAULT_EXTENDED_IMAGE_NAME}:other",
-            path=Path("/tmp/other/image-extended.yml"),
-        )
         with mock.patch(
             "aicage.registry.image_selection.extensions.extended_images.load_extended_images",
-            return_value={"custom": config, "wrong": wrong_base, "other": other},
-        ):
+            return_value={"custom": config, "wrong": wrong_base},
+        ) as load_mock:
+            context = self._context()
             options = load_extended_image_options(
                 agent="codex",
-                context=self._context(),
+                context=context,
             )
         self.assertEqual(["custom", "wrong-base"], [option.name for option in options])
+        load_mock.assert_called_once_with("codex", set(context.extensions))
 
     def test_resolve_extended_image(self) -> None:
         option = ExtendedImageOption(
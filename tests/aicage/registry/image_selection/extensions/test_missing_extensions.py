@@ -6,11 +6,7 @@ from aicage.config.context import ConfigContext
 from aicage.config.extensions.loader import ExtensionMetadata
 from aicage.config.project_config import AgentConfig, ProjectConfig
 from aicage.registry._errors import RegistryError
-from aicage.registry.image_selection.extensions.missing_extensions import (
-    _find_projects_using_image,
-    _load_yaml,
-    ensure_extensions_exist,
-)
+from aicage.registry.image_selection.extensions.missing_extensions import ensure_extensions_exist
 
 
 class MissingExtensionsTests(TestCase):
@@ -54,11 +50,39 @@ class MissingExtensionsTests(TestCase):
 
             self.assertTrue(result)
             self.assertNotIn("codex", context.project_cfg.agents)
+            context.store.find_projects_using_image.assert_called_once_with("aicage:codex-ubuntu")
             context.store.save_project.assert_called_once_with(
                 Path(context.project_cfg.path),
                 context.project_cfg,
             )
 
+    def test_ensure_extensions_exist_lists_indexed_projects_still_using_image(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            agent_cfg = AgentConfig(extensions=["extra"], image_ref="aicage:codex-ubuntu")
+            context = self._context(tmp_dir, agent_cfg)
+            using = Path(tmp_dir) / "using.yml"
+            using.write_text("agents:\n  codex:\n    image_ref: aicage:codex-ubuntu\n", encoding="utf-8")
+            edited = Path(tmp_dir) / "edited.yml"
+            edited.write_text("agents:\n  codex:\n    image_ref: aicage:codex-debian\n", encoding="utf-8")
+            broken = Path(tmp_dir) / "broken.yml"
+            broken.write_text("agents: [broken", encoding="utf-8")
+            store = mock.Mock()
+            store.find_projects_using_image.return_value = [
+                ("/work/using", using),
+                ("/work/edited", edited),
+                ("/work/broken", broken),
+                ("/work/deleted", Path(tmp_dir) / "deleted.yml"),
+            ]
+            context.store = store
+
+            with mock.patch(
+                "aicage.registry.image_selection.extensions.missing_extensions.prompt_for_missing_extensions",
+                return_value="fresh",
+            ) as prompt_mock:
+                ensure_extensions_exist(agent="codex", context=context)
+
+            self.assertEqual([("/work/using", using)], prompt_mock.call_args.kwargs["other_projects"])
+
     def test_ensure_extensions_exist_raises_on_exit(self) -> None:
         with tempfile.TemporaryDirectory() as tmp_dir:
             agent_cfg = AgentConfig(extensions=["extra"], image_ref="aicage:codex-ubuntu")
@@ -89,82 +113,6 @@ class MissingExtensionsTests(TestCase):
                         context=context,
                     )
 
-    def test_find_projects_using_image_matches(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            store = mock.Mock()
-            store.projects_dir = Path(tmp_dir)
-            matching = Path(tmp_dir) / "one.yml"
-            matching.write_text(
-                "\n".join(
-                    [
-                        "path: /tmp/project",
-                        "agents:",
-                        "  codex:",
-                        "    image_ref: aicage:codex-ubuntu",
-                    ]
-                ),
-                encoding="utf-8",
-            )
-            (Path(tmp_dir) / "invalid.yml").write_text("not: [yaml", encoding="utf-8")
-            context = self._context(tmp_dir, AgentConfig())
-            context.store = store
-
-            matches = _find_projects_using_image(context, "aicage:codex-ubuntu")
-
-            self.assertEqual([("/tmp/project", matching)], matches)
-
-    def test_find_projects_using_image_empty_ref_returns_empty(self) -> None:
-        context = self._context("/tmp", AgentConfig())
-
-        matches = _find_projects_using_image(context, "")
-
-        self.assertEqual([], matches)
-
-    def test_find_projects_using_image_skips_non_mapping(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            store = mock.Mock()
-            store.projects_dir = Path(tmp_dir)
-            (Path(tmp_dir) / "one.yml").write_text("path: /tmp/project\n", encoding="utf-8")
-            context = self._context(tmp_dir, AgentConfig())
-            context.store = store
-            with mock.patch(
-                "aicage.registry.image_selection.extensions.missing_extensions._load_yaml",
-                return_value=[],
-            ):
-                matches = _find_projects_using_image(context, "aicage:codex-ubuntu")
-
-            self.assertEqual([], matches)
-
-    def test_find_projects_using_image_skips_invalid_agents(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            store = mock.Mock()
-            store.projects_dir = Path(tmp_dir)
-            Path(tmp_dir, "one.yml").write_text(
-                "\n".join(
-                    [
-                        "path: /tmp/project",
-                        "agents:",
-                        "  - not-a-mapping",
-                    ]
-                ),
-                encoding="utf-8",
-            )
-            context = self._context(tmp_dir, AgentConfig())
-            context.store = store
-
-            matches = _find_projects_using_image(context, "aicage:codex-ubuntu")
-
-            self.assertEqual([], matches)
-
-    def test_load_yaml_returns_empty_on_non_mapping(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            path = Path(tmp_dir) / "project.yml"
-            path.write_text("- not-a-mapping\n", encoding="utf-8")
-
-            data = _load_yaml(path)
-
-            self.assertEqual({}, data)
-
     @staticmethod
     def _context(
         tmp_dir: str,
@@ -173,6 +121,7 @@ class MissingExtensionsTests(TestCase):
     ) -> ConfigContext:
         store = mock.Mock()
         store.projects_dir = Path(tmp_dir)
+        store.find_projects_using_image.return_value = []
         project_cfg = ProjectConfig(path=str(Path(tmp_dir) / "project"), agents={"codex": agent_cfg})
         return ConfigContext(
             store=store,
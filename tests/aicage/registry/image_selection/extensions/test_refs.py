@@ -51,13 +51,16 @@ class ExtensionRefsTests(TestCase):
             valid_bases={"custom": "ghcr.io/aicage/aicage:codex-custom"},
             local_definition_dir=Path("/tmp/def"),
         )
-        context.bases["custom"] = BaseMetadata(
-            from_image="ubuntu:latest",
-            base_image_distro="Ubuntu",
-            base_image_description="Custom",
-            build_local=True,
-            local_definition_dir=CUSTOM_BASES_DIR / "custom",
-        )
+        context.bases = {
+            **context.bases,
+            "custom": BaseMetadata(
+                from_image="ubuntu:latest",
+                base_image_distro="Ubuntu",
+                base_image_description="Custom",
+                build_local=True,
+                local_definition_dir=CUSTOM_BASES_DIR / "custom",
+            ),
+        }
         result = base_image_ref(agent_metadata, "codex", "custom", context)
 
         self.assertEqual(f"{LOCAL_IMAGE_REPOSITORY}:codex-custom", result)
@@ -2,7 +2,7 @@ import tempfile
 from pathlib import Path
 from unittest import TestCase, mock
 
-from aicage.registry._errors import RegistryError
+from aicage.registry._errors import ImageSignatureError, RegistryError
 from aicage.registry.local_build import _digest
 
 
@@ -14,10 +14,11 @@ class LocalBuildDigestTests(TestCase):
                 return_value="sha256:local",
             ),
             mock.patch(
-                "aicage.registry.local_build._digest.resolve_verified_digest",
+                "aicage.registry.local_build._digest.resolve_digest_ref",
                 return_value="ghcr.io/aicage/aicage-image-base@sha256:local",
             ),
-            mock.patch("aicage.registry.local_build._digest.run_pull") as run_mock,
+            mock.patch("aicage.registry.local_build._digest.verify_image_signature") as verify_mock,
+            mock.patch("aicage.registry.local_build._digest.pull_verified_image") as run_mock,
             mock.patch(
                 "aicage.registry.local_build._digest.cleanup_old_digest"
             ) as cleanup_mock,
@@ -28,6 +29,7 @@ class LocalBuildDigestTests(TestCase):
             )
         self.assertEqual("ghcr.io/aicage/aicage-image-base@sha256:local", digest)
         run_mock.assert_not_called()
+        verify_mock.assert_called_once_with("ghcr.io/aicage/aicage-image-base@sha256:local")
         cleanup_mock.assert_not_called()
 
     def test_refresh_base_digest_pull_failure_uses_local_digest(self) -> None:
@@ -38,11 +40,11 @@ class LocalBuildDigestTests(TestCase):
                     return_value="sha256:local",
                 ),
                 mock.patch(
-                    "aicage.registry.local_build._digest.resolve_verified_digest",
+                    "aicage.registry.local_build._digest.resolve_digest_ref",
                     return_value="ghcr.io/aicage/aicage-image-base@sha256:remote",
                 ),
                 mock.patch(
-                    "aicage.registry.local_build._digest.run_pull",
+                    "aicage.registry.local_build._digest.pull_verified_image",
                     side_effect=RegistryError("docker pull failed"),
                 ),
                 mock.patch(
@@ -65,11 +67,11 @@ class LocalBuildDigestTests(TestCase):
                     return_value=None,
                 ),
                 mock.patch(
-                    "aicage.registry.local_build._digest.resolve_verified_digest",
+                    "aicage.registry.local_build._digest.resolve_digest_ref",
                     return_value="ghcr.io/aicage/aicage-image-base@sha256:remote",
                 ),
                 mock.patch(
-                    "aicage.registry.local_build._digest.run_pull",
+                    "aicage.registry.local_build._digest.pull_verified_image",
                     side_effect=RegistryError("docker pull failed"),
                 ),
                 mock.patch(
@@ -93,11 +95,11 @@ class LocalBuildDigestTests(TestCase):
                     side_effect=["sha256:old", "sha256:remote"],
                 ),
                 mock.patch(
-                    "aicage.registry.local_build._digest.resolve_verified_digest",
+                    "aicage.registry.local_build._digest.resolve_digest_ref",
                     return_value="ghcr.io/aicage/aicage-image-base@sha256:remote",
                 ),
                 mock.patch(
-                    "aicage.registry.local_build._digest.run_pull",
+                    "aicage.registry.local_build._digest.pull_verified_image",
                     return_value=None,
                 ),
                 mock.patch(
@@ -115,3 +117,26 @@ class LocalBuildDigestTests(TestCase):
                 "sha256:old",
                 "ghcr.io/aicage/aicage-image-base:ubuntu",
             )
+
+    def test_refresh_base_digest_raises_on_signature_failure(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with (
+                mock.patch(
+                    "aicage.registry.local_build._digest.get_local_repo_digest_for_repo",
+                    return_value="sha256:local",
+                ),
+                mock.patch(
+                    "aicage.registry.local_build._digest.resolve_digest_ref",
+                    return_value="ghcr.io/aicage/aicage-image-base@sha256:remote",
+                ),
+                mock.patch(
+                    "aicage.registry.local_build._digest.pull_verified_image",
+                    side_effect=ImageSignatureError("bad signature"),
+                ),
+                mock.patch("aicage.registry.local_build._digest.pull_log_path", return_value=Path(tmp_dir)),
+            ):
+                with self.assertRaises(ImageSignatureError):
+                    _digest.refresh_base_digest(
+                        base_image_ref="ghcr.io/aicage/aicage-image-base:ubuntu",
+                        base_repository="ghcr.io/aicage/aicage-image-base",
+                    )
@@ -90,7 +90,7 @@ class EnsureLocalImageTests(TestCase):
             build_local=True,
             local_definition_dir=CUSTOM_BASES_DIR / "custom",
         )
-        run_config.context.bases["custom"] = custom_base
+        run_config.context.bases = {**run_config.context.bases, "custom": custom_base}
         with (
             mock.patch(
                 "aicage.registry.local_build.ensure_local_image.ensure_custom_base_image"
@@ -145,6 +145,7 @@ class EnsureLocalImageTests(TestCase):
                 ensure_local_image_module.ensure_local_image(run_config)
 
             build_mock.assert_called_once()
+            self.assertEqual("1.2.3", build_mock.call_args.kwargs["agent_version"])
             record_path = state_dir / "claude-ubuntu.yml"
             payload = yaml.safe_load(record_path.read_text(encoding="utf-8"))
             self.assertEqual("1.2.3", payload[_AGENT_VERSION_KEY])
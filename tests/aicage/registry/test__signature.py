@@ -1,13 +1,67 @@
 import subprocess
+import tempfile
+from pathlib import Path
 from unittest import TestCase, mock
 
 from aicage import constants
 from aicage.registry import _signature
-from aicage.registry._errors import RegistryError
+from aicage.registry._errors import ImageSignatureError, RegistryError
+from aicage.registry._verification_store import VerificationRecord, VerificationStore
 
 
 class SignatureVerificationTests(TestCase):
-    def test_resolve_verified_digest_returns_digest_ref_on_valid_signature(self) -> None:
+    def setUp(self) -> None:
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        patcher = mock.patch(
+            "aicage.registry._verification_store.paths_module.IMAGE_VERIFICATION_STATE_DIR",
+            Path(tmp_dir.name),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_resolve_digest_ref(self) -> None:
+        with mock.patch("aicage.registry._signature.get_remote_digest", return_value="sha256:abc"):
+            digest_ref = _signature.resolve_digest_ref("ghcr.io/aicage/aicage:agent")
+        self.assertEqual("ghcr.io/aicage/aicage@sha256:abc", digest_ref)
+
+    def test_verify_image_signature_reuses_cached_verification(self) -> None:
+        image_ref = "ghcr.io/aicage/aicage:agent"
+        success = subprocess.CompletedProcess(args=["cosign"], returncode=0, stdout="", stderr="")
+        with (
+            mock.patch("aicage.registry._signature.get_remote_digest", return_value="sha256:abc"),
+            mock.patch("aicage.registry._signature._ensure_cosign_image") as ensure_mock,
+            mock.patch("aicage.registry._signature._run_cosign_verify", return_value=success) as cosign_mock,
+        ):
+            digest_ref = _signature.resolve_digest_ref(image_ref)
+            _signature.verify_image_signature(digest_ref)
+            _signature.verify_image_signature(digest_ref)
+        ensure_mock.assert_called_once_with()
+        cosign_mock.assert_called_once_with("ghcr.io/aicage/aicage@sha256:abc")
+
+    def test_verify_image_signature_ignores_result_from_other_policy(self) -> None:
+        VerificationStore().save(
+            VerificationRecord(
+                digest_ref="ghcr.io/aicage/aicage@sha256:abc",
+                cosign_image=constants.COSIGN_IMAGE_REF,
+                oidc_issuer="https://other.example",
+                identity_regexp=constants.COSIGN_IDENTITY_REGEXP,
+                verified_at="2026-01-01T00:00:00+00:00",
+            )
+        )
+        success = subprocess.CompletedProcess(args=["cosign"], returncode=0, stdout="", stderr="")
+        with (
+            mock.patch("aicage.registry._signature.get_remote_digest", return_value="sha256:abc"),
+            mock.patch("aicage.registry._signature._ensure_cosign_image"),
+            mock.patch("aicage.registry._signature._run_cosign_verify", return_value=success) as cosign_mock,
+        ):
+            _signature.verify_image_signature("ghcr.io/aicage/aicage@sha256:abc")
+        cosign_mock.assert_called_once()
+        record = VerificationStore().load("ghcr.io/aicage/aicage@sha256:abc")
+        assert record is not None
+        self.assertEqual(constants.COSIGN_OIDC_ISSUER, record.oidc_issuer)
+
+    def test_verify_image_signature_returns_digest_ref_on_valid_signature(self) -> None:
         image_ref = "ghcr.io/aicage/aicage:agent"
         with (
             mock.patch(
@@ -32,11 +86,12 @@ class SignatureVerificationTests(TestCase):
                 ),
             ) as cosign_mock,
         ):
-            digest_ref = _signature.resolve_verified_digest(image_ref)
+            digest_ref = _signature.resolve_digest_ref(image_ref)
+            _signature.verify_image_signature(digest_ref)
         self.assertEqual("ghcr.io/aicage/aicage@sha256:abc", digest_ref)
         cosign_mock.assert_called_once_with("ghcr.io/aicage/aicage@sha256:abc")
 
-    def test_resolve_verified_digest_raises_on_invalid_signature(self) -> None:
+    def test_verify_image_signature_raises_on_invalid_signature(self) -> None:
         image_ref = "ghcr.io/aicage/aicage:agent"
         with (
             mock.patch(
@@ -61,10 +116,10 @@ class SignatureVerificationTests(TestCase):
                 ),
             ),
         ):
-            with self.assertRaises(RegistryError):
-                _signature.resolve_verified_digest(image_ref)
+            with self.assertRaises(ImageSignatureError):
+                _signature.verify_image_signature(_signature.resolve_digest_ref(image_ref))
 
-    def test_resolve_verified_digest_raises_on_unknown_error(self) -> None:
+    def test_verify_image_signature_raises_on_unknown_error(self) -> None:
         image_ref = "ghcr.io/aicage/aicage:agent"
         with (
             mock.patch(
@@ -89,10 +144,10 @@ class SignatureVerificationTests(TestCase):
                 ),
             ),
         ):
-            with self.assertRaises(RegistryError):
-                _signature.resolve_verified_digest(image_ref)
+            with self.assertRaises(ImageSignatureError):
+                _signature.verify_image_signature(_signature.resolve_digest_ref(image_ref))
 
-    def test_resolve_verified_digest_raises_when_digest_missing(self) -> None:
+    def test_resolve_digest_ref_raises_when_digest_missing(self) -> None:
         image_ref = "ghcr.io/aicage/aicage:agent"
         with (
             mock.patch(
@@ -108,17 +163,12 @@ class SignatureVerificationTests(TestCase):
             ) as cosign_mock,
         ):
             with self.assertRaises(RegistryError):
-                _signature.resolve_verified_digest(image_ref)
+                _signature.resolve_digest_ref(image_ref)
         digest_mock.assert_called_once_with(image_ref)
         cosign_mock.assert_not_called()
 
-    def test_resolve_verified_digest_pulls_cosign_image_when_missing(self) -> None:
-        image_ref = "ghcr.io/aicage/aicage:agent"
+    def test_verify_image_signature_pulls_cosign_image_when_missing(self) -> None:
         with (
-            mock.patch(
-                "aicage.registry._signature.get_remote_digest",
-                return_value="sha256:abc",
-            ),
             mock.patch(
                 "aicage.registry._signature.get_local_repo_digest_for_repo",
                 return_value=None,
@@ -147,7 +197,7 @@ class SignatureVerificationTests(TestCase):
                 ),
             ),
         ):
-            _signature.resolve_verified_digest(image_ref)
+            _signature.verify_image_signature("ghcr.io/aicage/aicage@sha256:abc")
         log_mock.assert_called_once_with(constants.COSIGN_IMAGE_REF)
         pull_mock.assert_called_once_with(constants.COSIGN_IMAGE_REF, log_mock.return_value)
         cleanup_mock.assert_called_once_with(
@@ -0,0 +1,52 @@
+import tempfile
+from pathlib import Path
+from unittest import TestCase, mock
+
+from aicage.registry._verification_store import VerificationRecord, VerificationStore
+
+
+class VerificationStoreTests(TestCase):
+    def test_save_and_load_round_trip(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with mock.patch(
+                "aicage.registry._verification_store.paths_module.IMAGE_VERIFICATION_STATE_DIR",
+                Path(tmp_dir),
+            ):
+                store = VerificationStore()
+                record = _record()
+
+                path = store.save(record)
+                loaded = store.load(record.digest_ref)
+
+            self.assertEqual(Path(tmp_dir), path.parent)
+            self.assertEqual(record, loaded)
+
+    def test_load_returns_none_when_missing(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with mock.patch(
+                "aicage.registry._verification_store.paths_module.IMAGE_VERIFICATION_STATE_DIR",
+                Path(tmp_dir),
+            ):
+                self.assertIsNone(VerificationStore().load("ghcr.io/aicage/aicage@sha256:abc"))
+
+    def test_load_returns_none_for_invalid_yaml(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with mock.patch(
+                "aicage.registry._verification_store.paths_module.IMAGE_VERIFICATION_STATE_DIR",
+                Path(tmp_dir),
+            ):
+                store = VerificationStore()
+                path = store.save(_record())
+                path.write_text("digest_ref: [", encoding="utf-8")
+
+                self.assertIsNone(store.load(_record().digest_ref))
+
+
+def _record() -> VerificationRecord:
+    return VerificationRecord(
+        digest_ref="ghcr.io/aicage/aicage@sha256:abc",
+        cosign_image="ghcr.io/sigstore/cosign/cosign@sha256:def",
+        oidc_issuer="https://token.actions.githubusercontent.com",
+        identity_regexp="^https://github.com/aicage/.*$",
+        verified_at="2026-01-01T00:00:00+00:00",
+    )
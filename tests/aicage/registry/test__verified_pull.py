@@ -0,0 +1,99 @@
+import threading
+from pathlib import Path
+from unittest import TestCase, mock
+
+from docker.errors import DockerException
+
+from aicage.registry._errors import ImageSignatureError
+from aicage.registry._verified_pull import pull_verified_image
+
+_IMAGE_REF = "ghcr.io/aicage/aicage:codex-ubuntu"
+_DIGEST_REF = "ghcr.io/aicage/aicage@sha256:abc"
+_LOG_PATH = Path("/tmp/pull.log")
+
+
+class VerifiedPullTests(TestCase):
+    def test_pull_verified_image(self) -> None:
+        with (
+            mock.patch("aicage.registry._verified_pull.resolve_digest_ref", return_value=_DIGEST_REF),
+            mock.patch("aicage.registry._verified_pull.local_image_exists", return_value=False),
+            mock.patch("aicage.registry._verified_pull.verify_image_signature") as verify_mock,
+            mock.patch("aicage.registry._verified_pull.run_pull") as pull_mock,
+            mock.patch("aicage.registry._verified_pull.tag_image") as tag_mock,
+            mock.patch("aicage.registry._verified_pull.remove_image") as remove_mock,
+        ):
+            digest_ref = pull_verified_image(_IMAGE_REF, _LOG_PATH)
+
+        self.assertEqual(_DIGEST_REF, digest_ref)
+        verify_mock.assert_called_once_with(_DIGEST_REF)
+        pull_mock.assert_called_once_with(_DIGEST_REF, _LOG_PATH)
+        tag_mock.assert_called_once_with(_DIGEST_REF, _IMAGE_REF)
+        remove_mock.assert_not_called()
+
+    def test_pull_verified_image_runs_verification_during_pull(self) -> None:
+        verification_started = threading.Event()
+
+        def pull(_digest_ref: str, _log_path: Path) -> None:
+            # Blocks until cosign runs; a sequential implementation would time out here.
+            self.assertTrue(verification_started.wait(timeout=5))
+
+        with (
+            mock.patch("aicage.registry._verified_pull.local_image_exists", return_value=False),
+            mock.patch(
+                "aicage.registry._verified_pull.verify_image_signature",
+                side_effect=lambda _ref: verification_started.set(),
+            ),
+            mock.patch("aicage.registry._verified_pull.run_pull", side_effect=pull),
+            mock.patch("aicage.registry._verified_pull.tag_image"),
+        ):
+            pull_verified_image(_IMAGE_REF, _LOG_PATH, _DIGEST_REF)
+
+    def test_pull_verified_image_removes_content_on_failed_verification(self) -> None:
+        with (
+            mock.patch("aicage.registry._verified_pull.local_image_exists", return_value=False),
+            mock.patch(
+                "aicage.registry._verified_pull.verify_image_signature",
+                side_effect=ImageSignatureError("bad signature"),
+            ),
+            mock.patch("aicage.registry._verified_pull.run_pull"),
+            mock.patch("aicage.registry._verified_pull.tag_image") as tag_mock,
+            mock.patch("aicage.registry._verified_pull.remove_image") as remove_mock,
+        ):
+            with self.assertRaises(ImageSignatureError):
+                pull_verified_image(_IMAGE_REF, _LOG_PATH, _DIGEST_REF)
+
+        tag_mock.assert_not_called()
+        remove_mock.assert_called_once_with(_DIGEST_REF)
+
+    def test_pull_verified_image_keeps_preexisting_content_on_failed_verification(self) -> None:
+        with (
+            mock.patch("aicage.registry._verified_pull.local_image_exists", return_value=True),
+            mock.patch(
+                "aicage.registry._verified_pull.verify_image_signature",
+                side_effect=ImageSignatureError("bad signature"),
+            ),
+            mock.patch("aicage.registry._verified_pull.run_pull"),
+            mock.patch("aicage.registry._verified_pull.tag_image") as tag_mock,
+            mock.patch("aicage.registry._verified_pull.remove_image") as remove_mock,
+        ):
+            with self.assertRaises(ImageSignatureError):
+                pull_verified_image(_IMAGE_REF, _LOG_PATH, _DIGEST_REF)
+
+        tag_mock.assert_not_called()
+        remove_mock.assert_not_called()
+
+    def test_pull_verified_image_raises_pull_error_after_verification(self) -> None:
+        with (
+            mock.patch("aicage.registry._verified_pull.local_image_exists", return_value=False),
+            mock.patch("aicage.registry._verified_pull.verify_image_signature") as verify_mock,
+            mock.patch(
+                "aicage.registry._verified_pull.run_pull",
+                side_effect=DockerException("network down"),
+            ),
+            mock.patch("aicage.registry._verified_pull.tag_image") as tag_mock,
+        ):
+            with self.assertRaises(DockerException):
+                pull_verified_image(_IMAGE_REF, _LOG_PATH, _DIGEST_REF)
+
+        verify_mock.assert_called_once_with(_DIGEST_REF)
+        tag_mock.assert_not_called()
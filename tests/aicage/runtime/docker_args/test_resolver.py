@@ -105,3 +105,13 @@ class ResolverTests(TestCase):
                 local_definition_dir=Path("/tmp/agent"),
             )
         }
+
+    def test_resolve_project_git_root(self) -> None:
+        with mock.patch(
+            "aicage.runtime.docker_args.resolver.resolve_git_root",
+            return_value=Path("/repo"),
+        ) as root_mock:
+            git_root = resolver.resolve_project_git_root(Path("/repo/sub"))
+
+        self.assertEqual(Path("/repo"), git_root)
+        root_mock.assert_called_once_with(Path("/repo/sub"))
@@ -0,0 +1,81 @@
+import tempfile
+from pathlib import Path, PurePosixPath
+from unittest import TestCase, mock
+
+from aicage.runtime._run_plan_store import RunPlanRecord, RunPlanStore
+from aicage.runtime.run_args import EnvVar, MountSpec
+
+
+class RunPlanStoreTests(TestCase):
+    def test_save_and_load_round_trip(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            base_dir = Path(tmp_dir)
+            with mock.patch(
+                "aicage.runtime._run_plan_store.paths_module.RUN_PLAN_STATE_DIR",
+                base_dir,
+            ):
+                store = RunPlanStore()
+                record = _record()
+
+                path = store.save(record)
+                loaded = store.load(Path("/repo"), "codex")
+
+            self.assertEqual(base_dir, path.parent)
+            self.assertEqual(record, loaded)
+
+    def test_load_returns_none_when_missing(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with mock.patch(
+                "aicage.runtime._run_plan_store.paths_module.RUN_PLAN_STATE_DIR",
+                Path(tmp_dir),
+            ):
+                store = RunPlanStore()
+
+                self.assertIsNone(store.load(Path("/repo"), "codex"))
+
+    def test_load_returns_none_for_invalid_payload(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            base_dir = Path(tmp_dir)
+            with mock.patch(
+                "aicage.runtime._run_plan_store.paths_module.RUN_PLAN_STATE_DIR",
+                base_dir,
+            ):
+                store = RunPlanStore()
+                path = store.save(_record())
+                path.write_text("mounts:\n  - host_path: /tmp\n", encoding="utf-8")
+
+                self.assertIsNone(store.load(Path("/repo"), "codex"))
+
+    def test_save_keys_plans_by_project_and_agent(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with mock.patch(
+                "aicage.runtime._run_plan_store.paths_module.RUN_PLAN_STATE_DIR",
+                Path(tmp_dir),
+            ):
+                store = RunPlanStore()
+                first = store.save(_record())
+                second = store.save(_record(agent="claude"))
+
+            self.assertNotEqual(first, second)
+
+
+def _record(agent: str = "codex") -> RunPlanRecord:
+    return RunPlanRecord(
+        project_path="/repo",
+        agent=agent,
+        fingerprint="abc",
+        image_ref="ghcr.io/aicage/aicage:codex-ubuntu",
+        project_docker_args="--network=host",
+        agent_config_mounts=[
+            MountSpec(host_path=Path("/home/user/.codex"), container_path=PurePosixPath("/aicage/agent-config/.codex"))
+        ],
+        mounts=[
+            MountSpec(
+                host_path=Path("/home/user/.gitconfig"),
+                container_path=PurePosixPath("/aicage/host/gitconfig"),
+                read_only=True,
+            )
+        ],
+        env=[EnvVar(name="DOCKER_HOST", value="tcp://host.docker.internal:2375")],
+        resolved_at="2026-01-01T00:00:00+00:00",
+    )
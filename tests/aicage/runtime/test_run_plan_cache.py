@@ -0,0 +1,216 @@
+import tempfile
+from datetime import datetime, timedelta, timezone
+from pathlib import Path, PurePosixPath
+from unittest import TestCase, mock
+
+from aicage.cli_types import ParsedArgs
+from aicage.runtime import run_plan_cache
+from aicage.runtime._run_plan_store import RunPlanRecord
+from aicage.runtime.run_args import DockerRunArgs, MountSpec
+from aicage.runtime.run_plan_cache import load_cached_run_args, save_run_plan
+
+
+class RunPlanCacheTests(TestCase):
+    def test_load_cached_run_args_returns_args_when_fresh(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            project_path = Path(tmp_dir)
+            record = _record(project_path, fingerprint="fp")
+            parsed = ParsedArgs(False, "", "codex", ["--flag"], False, None)
+            with (
+                mock.patch("aicage.runtime.run_plan_cache.Path.cwd", return_value=project_path),
+                mock.patch("aicage.runtime.run_plan_cache.RunPlanStore") as store_cls,
+                mock.patch("aicage.runtime.run_plan_cache._fingerprint", return_value="fp"),
+                mock.patch("aicage.runtime.run_plan_cache.SettingsStore") as settings_cls,
+            ):
+                store_cls.return_value.load.return_value = record
+                run_args = load_cached_run_args("codex", parsed)
+
+        settings_cls.return_value.record_use.assert_called_once_with(project_path)
+        self.assertEqual(
+            DockerRunArgs(
+                image_ref=record.image_ref,
+                project_path=project_path,
+                agent_config_mounts=record.agent_config_mounts,
+                merged_docker_args="--project",
+                agent_args=["--flag"],
+                env=[],
+                mounts=[],
+            ),
+            run_args,
+        )
+
+    def test_load_cached_run_args_rejects_changed_fingerprint(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            project_path = Path(tmp_dir)
+            parsed = ParsedArgs(False, "", "codex", [], False, None)
+            with (
+                mock.patch("aicage.runtime.run_plan_cache.Path.cwd", return_value=project_path),
+                mock.patch("aicage.runtime.run_plan_cache.RunPlanStore") as store_cls,
+                mock.patch("aicage.runtime.run_plan_cache._fingerprint", return_value="other"),
+            ):
+                store_cls.return_value.load.return_value = _record(project_path, fingerprint="fp")
+                run_args = load_cached_run_args("codex", parsed)
+
+        self.assertIsNone(run_args)
+
+    def test_load_cached_run_args_rejects_expired_plan(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            project_path = Path(tmp_dir)
+            resolved_at = (datetime.now(timezone.utc) - timedelta(hours=2)).isoformat()
+            parsed = ParsedArgs(False, "", "codex", [], False, None)
+            with (
+                mock.patch("aicage.runtime.run_plan_cache.Path.cwd", return_value=project_path),
+                mock.patch("aicage.runtime.run_plan_cache.RunPlanStore") as store_cls,
+                mock.patch("aicage.runtime.run_plan_cache._fingerprint") as fingerprint_mock,
+            ):
+                store_cls.return_value.load.return_value = _record(
+                    project_path,
+                    fingerprint="fp",
+                    resolved_at=resolved_at,
+                )
+                run_args = load_cached_run_args("codex", parsed)
+
+        self.assertIsNone(run_args)
+        fingerprint_mock.assert_not_called()
+
+    def test_load_cached_run_args_rejects_missing_mount_source(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            project_path = Path(tmp_dir)
+            record = _record(project_path, fingerprint="fp", agent_config_dir=project_path / "missing")
+            parsed = ParsedArgs(False, "", "codex", [], False, None)
+            with (
+                mock.patch("aicage.runtime.run_plan_cache.Path.cwd", return_value=project_path),
+                mock.patch("aicage.runtime.run_plan_cache.RunPlanStore") as store_cls,
+                mock.patch("aicage.runtime.run_plan_cache._fingerprint", return_value="fp"),
+            ):
+                store_cls.return_value.load.return_value = record
+                run_args = load_cached_run_args("codex", parsed)
+
+        self.assertIsNone(run_args)
+
+    def test_load_cached_run_args_skips_cli_docker_args(self) -> None:
+        parsed = ParsedArgs(False, "--network=host", "codex", [], False, None)
+        with mock.patch("aicage.runtime.run_plan_cache.RunPlanStore") as store_cls:
+            run_args = load_cached_run_args("codex", parsed)
+
+        self.assertIsNone(run_args)
+        store_cls.assert_not_called()
+
+    def test_load_cached_run_args_disabled_by_env(self) -> None:
+        parsed = ParsedArgs(False, "", "codex", [], False, None)
+        with (
+            mock.patch.dict("os.environ", {"AICAGE_RUN_PLAN_MAX_AGE": "0"}),
+            mock.patch("aicage.runtime.run_plan_cache.RunPlanStore") as store_cls,
+        ):
+            run_args = load_cached_run_args("codex", parsed)
+
+        self.assertIsNone(run_args)
+        store_cls.assert_not_called()
+
+    def test_save_run_plan_writes_record(self) -> None:
+        project_path = Path("/repo")
+        run_config = mock.Mock(project_path=project_path, agent="codex", project_docker_args="--project")
+        run_args = DockerRunArgs(
+            image_ref="ghcr.io/aicage/aicage:codex-ubuntu",
+            project_path=project_path,
+            agent_config_mounts=[],
+            merged_docker_args="--project",
+            agent_args=[],
+        )
+        parsed = ParsedArgs(False, "", "codex", [], False, None)
+        with (
+            mock.patch("aicage.runtime.run_plan_cache.RunPlanStore") as store_cls,
+            mock.patch("aicage.runtime.run_plan_cache._fingerprint", return_value="fp") as fingerprint_mock,
+            mock.patch("aicage.runtime.run_plan_cache.resolve_project_git_root", return_value=Path("/")),
+        ):
+            save_run_plan(run_config, run_args, parsed)
+
+        record = store_cls.return_value.save.call_args.args[0]
+        fingerprint_mock.assert_called_once_with(project_path, "codex", run_args.image_ref, Path("/"))
+        self.assertEqual(str(Path("/")), record.git_root)
+        self.assertEqual("fp", record.fingerprint)
+        self.assertEqual("/repo", record.project_path)
+        self.assertEqual("--project", record.project_docker_args)
+
+    def test_save_run_plan_skips_without_local_image(self) -> None:
+        run_config = mock.Mock(project_path=Path("/repo"), agent="codex", project_docker_args="")
+        run_args = mock.Mock(image_ref="aicage:codex-ubuntu")
+        parsed = ParsedArgs(False, "", "codex", [], False, None)
+        with (
+            mock.patch("aicage.runtime.run_plan_cache.RunPlanStore") as store_cls,
+            mock.patch("aicage.runtime.run_plan_cache._fingerprint", return_value=None),
+            mock.patch("aicage.runtime.run_plan_cache.resolve_project_git_root", return_value=None),
+        ):
+            save_run_plan(run_config, run_args, parsed)
+
+        store_cls.return_value.save.assert_not_called()
+
+    def test_fingerprint_changes_with_custom_config(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            agents_dir = root / "agents"
+            agents_dir.mkdir()
+            with (
+                mock.patch("aicage.runtime.run_plan_cache.get_local_image_id", return_value="sha256:id"),
+                mock.patch("aicage.runtime.run_plan_cache.CUSTOM_AGENTS_DIR", agents_dir),
+                mock.patch("aicage.runtime.run_plan_cache.CUSTOM_BASES_DIR", root / "bases"),
+                mock.patch("aicage.runtime.run_plan_cache.CUSTOM_EXTENSIONS_DIR", root / "extensions"),
+                mock.patch("aicage.runtime.run_plan_cache.SettingsStore") as store_cls,
+            ):
+                store_cls.return_value.project_config_path.return_value = root / "project.yml"
+                before = run_plan_cache._fingerprint(root, "codex", "aicage:codex-ubuntu", None)
+                (agents_dir / "forge").mkdir()
+                after = run_plan_cache._fingerprint(root, "codex", "aicage:codex-ubuntu", None)
+
+        self.assertIsNotNone(before)
+        self.assertNotEqual(before, after)
+
+    def test_fingerprint_changes_with_git_root_config(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            git_root = Path(tmp_dir)
+            git_dir = git_root / ".git"
+            git_dir.mkdir()
+            (git_dir / "config").write_text("[core]\n", encoding="utf-8")
+            project_path = git_root / "sub"
+            project_path.mkdir()
+            with (
+                mock.patch("aicage.runtime.run_plan_cache.get_local_image_id", return_value="sha256:id"),
+                mock.patch("aicage.runtime.run_plan_cache.CUSTOM_AGENTS_DIR", git_root / "agents"),
+                mock.patch("aicage.runtime.run_plan_cache.CUSTOM_BASES_DIR", git_root / "bases"),
+                mock.patch("aicage.runtime.run_plan_cache.CUSTOM_EXTENSIONS_DIR", git_root / "extensions"),
+                mock.patch("aicage.runtime.run_plan_cache.SettingsStore") as store_cls,
+            ):
+                store_cls.return_value.project_config_path.return_value = git_root / "project.yml"
+                before = run_plan_cache._fingerprint(project_path, "codex", "aicage:codex-ubuntu", git_root)
+                (git_dir / "config").write_text("[core]\n\tbare = false\n", encoding="utf-8")
+                after = run_plan_cache._fingerprint(project_path, "codex", "aicage:codex-ubuntu", git_root)
+
+        self.assertNotEqual(before, after)
+
+    def test_fingerprint_requires_local_image(self) -> None:
+        with mock.patch("aicage.runtime.run_plan_cache.get_local_image_id", return_value=None):
+            self.assertIsNone(run_plan_cache._fingerprint(Path("/repo"), "codex", "aicage:codex-ubuntu", None))
+
+
+def _record(
+    project_path: Path,
+    fingerprint: str,
+    resolved_at: str | None = None,
+    agent_config_dir: Path | None = None,
+) -> RunPlanRecord:
+    return RunPlanRecord(
+        project_path=str(project_path),
+        agent="codex",
+        fingerprint=fingerprint,
+        image_ref="ghcr.io/aicage/aicage:codex-ubuntu",
+        project_docker_args="--project",
+        agent_config_mounts=[
+            MountSpec(
+                host_path=agent_config_dir or project_path,
+                container_path=PurePosixPath("/aicage/agent-config/.codex"),
+            )
+        ],
+        mounts=[],
+        env=[],
+        resolved_at=resolved_at or datetime.now(timezone.utc).isoformat(),
+    )
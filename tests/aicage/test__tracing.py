@@ -0,0 +1,126 @@
+import json
+import tempfile
+import threading
+from pathlib import Path
+from unittest import TestCase, mock
+
+from aicage import _tracing
+
+
+class TracingTests(TestCase):
+    def setUp(self) -> None:
+        self._tracer = _tracing._Tracer()
+        patcher = mock.patch("aicage._tracing._TRACER", self._tracer)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_tracing_requested(self) -> None:
+        with mock.patch.dict("os.environ", {"AICAGE_TRACE": "1"}):
+            self.assertTrue(_tracing.tracing_requested())
+        with mock.patch.dict("os.environ", {"AICAGE_TRACE": "off"}):
+            self.assertFalse(_tracing.tracing_requested())
+        with mock.patch.dict("os.environ", {}, clear=True):
+            self.assertFalse(_tracing.tracing_requested())
+
+    def test_enable_tracing(self) -> None:
+        self.assertFalse(self._tracer.enabled)
+        _tracing.enable_tracing()
+        self.assertTrue(self._tracer.enabled)
+
+    def test_trace_span_is_noop_when_disabled(self) -> None:
+        with _tracing.trace_span("phase"):
+            pass
+        self.assertEqual([], self._tracer.spans)
+
+    def test_trace_span_nests_children(self) -> None:
+        _tracing.enable_tracing()
+        with _tracing.trace_span("outer"):
+            with _tracing.trace_span("inner"):
+                pass
+
+        self.assertEqual(["outer"], [span.name for span in self._tracer.spans])
+        outer = self._tracer.spans[0]
+        self.assertEqual(["inner"], [child.name for child in outer.children])
+        self.assertIsNotNone(outer.end)
+        self.assertIsNotNone(outer.children[0].end)
+
+    def test_traced(self) -> None:
+        @_tracing.traced("double")
+        def double(value: int) -> int:
+            return value * 2
+
+        _tracing.enable_tracing()
+        self.assertEqual(4, double(2))
+        self.assertEqual(["double"], [span.name for span in self._tracer.spans])
+
+    def test_count_event(self) -> None:
+        _tracing.count_event(_tracing.SUBPROCESS_COUNTER)
+        self.assertEqual({}, self._tracer.counters)
+
+        _tracing.enable_tracing()
+        _tracing.count_event(_tracing.SUBPROCESS_COUNTER)
+        _tracing.count_event(_tracing.YAML_BYTES_COUNTER, 10)
+        _tracing.count_event(_tracing.YAML_BYTES_COUNTER, 5)
+
+        self.assertEqual(
+            {_tracing.SUBPROCESS_COUNTER: 1, _tracing.YAML_BYTES_COUNTER: 15},
+            self._tracer.counters,
+        )
+
+    def test_write_trace_returns_none_when_disabled(self) -> None:
+        self.assertIsNone(_tracing.write_trace())
+
+    def test_write_trace(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with mock.patch("aicage._tracing.TRACE_LOG_DIR", Path(tmp_dir)):
+                _tracing.enable_tracing()
+                _tracing.count_event(_tracing.HTTP_REQUEST_COUNTER)
+                with _tracing.trace_span("outer"):
+                    with _tracing.trace_span("inner"):
+                        pass
+                path = _tracing.write_trace()
+                second = _tracing.write_trace()
+
+            self.assertIsNotNone(path)
+            assert path is not None
+            payload = json.loads(path.read_text(encoding="utf-8"))
+
+        self.assertIsNone(second)
+        self.assertEqual({_tracing.HTTP_REQUEST_COUNTER: 1}, payload["counters"])
+        self.assertEqual("outer", payload["spans"][0]["name"])
+        self.assertEqual("inner", payload["spans"][0]["children"][0]["name"])
+        self.assertGreaterEqual(payload["total_ms"], payload["spans"][0]["duration_ms"])
+
+    def test_stack(self) -> None:
+        stacks: list[list[object]] = []
+
+        def collect() -> None:
+            stacks.append(self._tracer.stack())
+
+        worker = threading.Thread(target=collect)
+        worker.start()
+        worker.join()
+
+        self.assertIs(self._tracer.stack(), self._tracer.stack())
+        self.assertIsNot(self._tracer.stack(), stacks[0])
+
+    def test_open_span(self) -> None:
+        outer = self._tracer.open_span("outer")
+        inner = self._tracer.open_span("inner")
+
+        self.assertEqual([outer], self._tracer.spans)
+        self.assertEqual([inner], outer.children)
+        self.assertEqual([outer, inner], self._tracer.stack())
+
+    def test_close_span(self) -> None:
+        span = self._tracer.open_span("phase")
+        self._tracer.close_span(span)
+
+        self.assertIsNotNone(span.end)
+        self.assertEqual([], self._tracer.stack())
+
+    def test_count(self) -> None:
+        self._tracer.count("events", 2)
+        self._tracer.count("events", 3)
+
+        self.assertEqual({"events": 5}, self._tracer.counters)
@@ -0,0 +1,44 @@
+import io
+from unittest import TestCase
+
+import yaml
+
+from aicage import _yaml_codec
+
+_PROJECT_CONFIG = {
+    "path": "/home/user/project",
+    "agents": {
+        "codex": {
+            "base": "ubuntu",
+            "docker_args": "--net=host -e FOO='bar baz'",
+            "extensions": ["python", "node"],
+            "image_ref": "aicage-extended:codex-ubuntu-python",
+            "mounts": {"gitconfig": True, "ssh": False},
+        },
+    },
+}
+
+
+class YamlCodecTests(TestCase):
+    def test_parse_yaml(self) -> None:
+        payload = yaml.safe_dump(_PROJECT_CONFIG, sort_keys=True)
+
+        self.assertEqual(_PROJECT_CONFIG, _yaml_codec.parse_yaml(payload))
+        self.assertIsNone(_yaml_codec.parse_yaml(""))
+
+    def test_parse_yaml_rejects_unsafe_tags(self) -> None:
+        with self.assertRaises(yaml.YAMLError):
+            _yaml_codec.parse_yaml("!!python/object/apply:os.getcwd []\n")
+
+    def test_dump_yaml(self) -> None:
+        self.assertEqual(
+            yaml.safe_dump(_PROJECT_CONFIG, sort_keys=True),
+            _yaml_codec.dump_yaml(_PROJECT_CONFIG),
+        )
+
+    def test_dump_yaml_to(self) -> None:
+        handle = io.StringIO()
+
+        _yaml_codec.dump_yaml_to(_PROJECT_CONFIG, handle)
+
+        self.assertEqual(yaml.safe_dump(_PROJECT_CONFIG, sort_keys=True), handle.getvalue())